@@ -3,9 +3,15 @@
 Based on the pattern from freecad-mcp but extended with solar-specific operations.
 """
 
+import array
+import functools
+import hashlib
+import itertools
+import socketserver
 import threading
 import traceback
-from xmlrpc.server import SimpleXMLRPCServer
+import zlib
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 from queue import Queue
 import sys
 import os
@@ -31,6 +37,9 @@ _server_thread = None
 _running = False
 _command_queue = Queue()
 _timer = None  # Keep reference to timer to prevent garbage collection
+_mesh_uploads = {}  # upload id -> (name, coords, indices) of a chunked mesh upload
+_mesh_uploads_lock = threading.Lock()
+_mesh_upload_ids = itertools.count(1)
 
 
 def execute_in_gui_thread(func):
@@ -73,6 +82,53 @@ def execute_in_gui_thread(func):
     return wrapper
 
 
+def _unpack_binary(data, typecode, compressed=False):
+    """Decode a little-endian xmlrpc Binary buffer into an array.array.
+
+    ``compressed`` buffers are zlib streams of the same bytes.
+    """
+    values = array.array(typecode)
+    values.frombytes(zlib.decompress(data.data) if compressed else bytes(data.data))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_script(code):
+    """Compile code as an expression if possible, else as statements.
+
+    Tools send fixed scripts and pass their arguments separately, so the
+    same code objects are reused across calls.
+
+    Returns:
+        tuple: (code object, True if it is an expression)
+    """
+    try:
+        return compile(code, "<string>", "eval"), True
+    except SyntaxError:
+        return compile(code, "<string>", "exec"), False
+
+
+class _KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    """Request handler that keeps HTTP/1.1 connections open between calls."""
+
+    protocol_version = "HTTP/1.1"
+
+
+class _ThreadingXMLRPCServer(socketserver.ThreadingMixIn, SimpleXMLRPCServer):
+    """XML-RPC server with one thread per client connection.
+
+    Clients hold keep-alive connections (the MCP server opens one per RPC
+    worker thread), so connections are served concurrently. Methods
+    wrapped in execute_in_gui_thread run one at a time in the GUI thread;
+    begin/append_terrain_mesh run on the connection threads and share
+    _mesh_uploads under _mesh_uploads_lock.
+    """
+
+    daemon_threads = True
+
+
 class FreePVCRPCServer:
     """XML-RPC server for FreePVC operations."""
 
@@ -92,11 +148,12 @@ class FreePVCRPCServer:
         return "pong"
 
     @execute_in_gui_thread
-    def execute_code(self, code: str):
+    def execute_code(self, code: str, params=None):
         """Execute arbitrary Python code in FreeCAD.
 
         Args:
             code: Python code to execute
+            params: Optional dict made available to the code as ``params``
 
         Returns:
             Result of code execution
@@ -107,18 +164,16 @@ class FreePVCRPCServer:
             "FreeCADGui": FreeCADGui,
             "App": FreeCAD,
             "Gui": FreeCADGui,
+            "params": params or {},
         }
 
         try:
             # Use exec for statements, eval for expressions
-            result = eval(code, globals(), local_vars)
-            return result
-        except SyntaxError:
-            try:
-                exec(code, globals(), local_vars)
-                return local_vars.get("result", "Executed successfully")
-            except Exception as e:
-                raise Exception(f"Execution error: {str(e)}")
+            compiled, is_expression = _compile_script(code)
+            if is_expression:
+                return eval(compiled, globals(), local_vars)
+            exec(compiled, globals(), local_vars)
+            return local_vars.get("result", "Executed successfully")
         except Exception as e:
             raise Exception(f"Execution error: {str(e)}")
 
@@ -162,6 +217,163 @@ class FreePVCRPCServer:
 
         return name
 
+    @execute_in_gui_thread
+    def create_terrain_mesh_bin(
+        self, vertex_data, triangle_data, name="Terrain", compressed=False
+    ):
+        """Create a terrain mesh object from packed binary buffers.
+
+        Args:
+            vertex_data: xmlrpc Binary of float64 (x, y, z) per vertex
+            triangle_data: xmlrpc Binary of int32 (i, j, k) per triangle
+            name: Object name
+            compressed: Whether both buffers are zlib-compressed
+
+        Returns:
+            str: Created object name
+        """
+        return self._add_terrain_mesh(
+            _unpack_binary(vertex_data, "d", compressed),
+            _unpack_binary(triangle_data, "i", compressed),
+            name,
+        )
+
+    # Chunked uploads only touch the pending buffers, so begin/append run on
+    # the connection threads; the document is changed in finish_terrain_mesh.
+    # Each upload has its own id, so concurrent uploads never share buffers.
+
+    def begin_terrain_mesh(self, name="Terrain"):
+        """Start a chunked terrain mesh upload.
+
+        Args:
+            name: Object name
+
+        Returns:
+            int: Upload id to pass to append/finish_terrain_mesh
+        """
+        upload_id = next(_mesh_upload_ids)
+        with _mesh_uploads_lock:
+            _mesh_uploads[upload_id] = (name, array.array("d"), array.array("i"))
+        return upload_id
+
+    def append_terrain_mesh(self, upload_id, vertex_data, triangle_data, compressed=False):
+        """Append a chunk of vertices and triangles to a pending upload.
+
+        Args:
+            upload_id: Id returned by begin_terrain_mesh
+            vertex_data: xmlrpc Binary of float64 (x, y, z) per vertex
+            triangle_data: xmlrpc Binary of int32 (i, j, k) per triangle,
+                indexing the whole mesh
+            compressed: Whether both buffers are zlib-compressed
+
+        Returns:
+            bool: Success
+        """
+        # Decode outside the lock; only the buffer update is serialized
+        vertices = _unpack_binary(vertex_data, "d", compressed)
+        triangles = _unpack_binary(triangle_data, "i", compressed)
+        with _mesh_uploads_lock:
+            if upload_id not in _mesh_uploads:
+                raise Exception(f"No mesh upload in progress with id {upload_id}")
+            _, coords, indices = _mesh_uploads[upload_id]
+            coords.extend(vertices)
+            indices.extend(triangles)
+        return True
+
+    @execute_in_gui_thread
+    def finish_terrain_mesh(self, upload_id):
+        """Create the mesh object from a completed chunked upload.
+
+        Args:
+            upload_id: Id returned by begin_terrain_mesh
+
+        Returns:
+            str: Created object name
+        """
+        with _mesh_uploads_lock:
+            if upload_id not in _mesh_uploads:
+                raise Exception(f"No mesh upload in progress with id {upload_id}")
+            name, coords, indices = _mesh_uploads.pop(upload_id)
+        return self._add_terrain_mesh(coords, indices, name)
+
+    def _add_terrain_mesh(self, coords, indices, name):
+        """Add a Mesh::Feature from flat coordinate and index arrays."""
+        import Mesh
+
+        doc = FreeCAD.ActiveDocument
+        if not doc:
+            raise Exception("No active document")
+
+        values = iter(coords)
+        points = list(zip(values, values, values))
+        num_points = len(points)
+
+        # Triangle soup: every three consecutive points form one facet
+        facets = []
+        corners = iter(indices)
+        for i, j, k in zip(corners, corners, corners):
+            if i < num_points and j < num_points and k < num_points:
+                facets.extend((points[i], points[j], points[k]))
+
+        mesh_obj = doc.addObject("Mesh::Feature", name)
+        mesh_obj.Mesh = Mesh.Mesh(facets)
+        doc.recompute()
+
+        return name
+
+    @execute_in_gui_thread
+    def get_terrain_mesh_arrays(self, name, known_revision="", compress_level=0):
+        """Return a mesh's vertices and triangles as packed binary buffers.
+
+        Args:
+            name: Name of mesh object
+            known_revision: Revision string from a previous call; if the mesh
+                is unchanged the buffers are omitted
+            compress_level: zlib level for the buffers, 0 to send them raw
+
+        Returns:
+            dict: "revision", plus "vertices" (float64 x, y, z per point),
+            "triangles" (int32 i, j, k per facet) as xmlrpc Binary and
+            "compressed" when the mesh changed, or "error" if the object is
+            missing
+        """
+        import xmlrpc.client
+
+        doc = FreeCAD.ActiveDocument
+        if not doc:
+            raise Exception("No active document")
+
+        obj = doc.getObject(name)
+        if obj is None or not hasattr(obj, "Mesh"):
+            return {"error": "Terrain object not found"}
+
+        mesh = obj.Mesh
+        revision = f"{mesh.CountPoints}:{mesh.CountFacets}:{mesh.Area!r}:{mesh.BoundBox}"
+        if revision == known_revision:
+            return {"revision": revision}
+
+        # Vectors and facet tuples are sequences, so both buffers fill
+        # straight from the topology without per-element Python lists
+        points, facets = mesh.Topology
+        coords = array.array("d", itertools.chain.from_iterable(points))
+        indices = array.array("i", itertools.chain.from_iterable(facets))
+        if sys.byteorder == "big":
+            coords.byteswap()
+            indices.byteswap()
+
+        vertex_bytes = coords.tobytes()
+        triangle_bytes = indices.tobytes()
+        if compress_level:
+            vertex_bytes = zlib.compress(vertex_bytes, compress_level)
+            triangle_bytes = zlib.compress(triangle_bytes, compress_level)
+
+        return {
+            "revision": revision,
+            "vertices": xmlrpc.client.Binary(vertex_bytes),
+            "triangles": xmlrpc.client.Binary(triangle_bytes),
+            "compressed": bool(compress_level),
+        }
+
     @execute_in_gui_thread
     def set_face_colors(self, obj_name, colors):
         """Set per-face colors on a mesh (for heatmaps).
@@ -190,6 +402,35 @@ class FreePVCRPCServer:
 
         return True
 
+    @execute_in_gui_thread
+    def set_face_colors_bin(self, obj_name, data):
+        """Set per-face colors from a packed uint8 RGB buffer.
+
+        Args:
+            obj_name: Name of mesh object
+            data: xmlrpc Binary with 3 bytes (r, g, b) per face
+
+        Returns:
+            bool: Success
+        """
+        doc = FreeCAD.ActiveDocument
+        if not doc:
+            raise Exception("No active document")
+
+        obj = doc.getObject(obj_name)
+        if not obj:
+            raise Exception(f"Object '{obj_name}' not found")
+
+        vp = obj.ViewObject
+        if hasattr(vp, "DiffuseColor"):
+            channels = iter(bytes(data.data))
+            vp.DiffuseColor = [
+                (r / 255.0, g / 255.0, b / 255.0, 1.0)
+                for r, g, b in zip(channels, channels, channels)
+            ]
+
+        return True
+
     @execute_in_gui_thread
     def create_fixed_rack(self, config):
         """Create a fixed-tilt solar rack object using FeaturePython.
@@ -389,6 +630,61 @@ class FreePVCRPCServer:
                 print(f"  [{i}]: x={p.get('x', 'MISSING')}, y={p.get('y', 'MISSING')}, z={p.get('z', 'MISSING')}")
         print("=================================\n")
         
+        rows = (
+            (
+                p.get("name", f"{base_object}_Instance_{i:04d}"),
+                p.get("x", 0.0),
+                p.get("y", 0.0),
+                p.get("z", 0.0),
+                p.get("rotation_x", 0.0),
+                p.get("rotation_y", 0.0),
+                p.get("rotation_z", 0.0),
+            )
+            for i, p in enumerate(placements)
+        )
+        return self._create_array_layout(base_object, rows)
+
+    @execute_in_gui_thread
+    def create_array_layout_bin(self, base_object, placement_data, names):
+        """Create an array of solar objects from a packed placement buffer.
+
+        Args:
+            base_object: Name of template object to array
+            placement_data: xmlrpc Binary of float64 (x, y, z, rotation_x,
+                rotation_y, rotation_z) per instance; positions in mm,
+                rotations in degrees
+            names: Instance names, one per placement
+
+        Returns:
+            dict: Result with created object names and statistics
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(base_object.encode())
+        digest.update(bytes(placement_data.data))
+        digest.update("\0".join(names).encode())
+
+        values = iter(_unpack_binary(placement_data, "d"))
+        rows = zip(names, *([values] * 6))
+        return self._create_array_layout(base_object, rows, digest.hexdigest(), names)
+
+    def _create_array_layout(self, base_object, rows, digest="", names=()):
+        """Create App::Link instances of base_object in a fresh ArrayLayout group.
+
+        If the existing ArrayLayout group was built from the same request
+        (same ``digest``) and still holds exactly the requested instances,
+        it is kept as it is instead of being rebuilt.
+
+        Args:
+            base_object: Name of template object to array
+            rows: Iterable of (name, x, y, z, rotation_x, rotation_y, rotation_z)
+            digest: Hash of the request, stored on the group; empty to
+                always rebuild
+            names: Instance names of the request, in order; the kept
+                group's children must match them
+
+        Returns:
+            dict: Result with created object names and statistics
+        """
         doc = FreeCAD.ActiveDocument
         if not doc:
             raise Exception("No active document")
@@ -399,6 +695,13 @@ class FreePVCRPCServer:
         
         # Delete old ArrayLayout if it exists (including its children!)
         old_array = doc.getObject("ArrayLayout")
+        if (
+            old_array
+            and digest
+            and getattr(old_array, "LayoutDigest", "") == digest
+            and [child.Name for child in getattr(old_array, "Group", [])] == list(names)
+        ):
+            return self._array_layout_result(old_array, base_object)
         if old_array:
             # Delete all children first
             if hasattr(old_array, "Group"):
@@ -410,23 +713,19 @@ class FreePVCRPCServer:
         
         # Create a group for the array
         array_group = doc.addObject("App::DocumentObjectGroup", "ArrayLayout")
+        if digest:
+            array_group.addProperty(
+                "App::PropertyString", "LayoutDigest", "FreePVC", "Hash of the layout request"
+            )
+            array_group.LayoutDigest = digest
         created_objects = []
         
-        for i, placement_data in enumerate(placements):
+        for link_name, x, y, z, rx, ry, rz in rows:
             # Use App::Link for efficient object reuse
             # Links share geometry but have independent placements
-            link_name = placement_data.get("name", f"{base_object}_Instance_{i:04d}")
             link = doc.addObject("App::Link", link_name)
             link.LinkedObject = base
             
-            # Set placement
-            x = placement_data.get("x", 0.0)
-            y = placement_data.get("y", 0.0)
-            z = placement_data.get("z", 0.0)
-            rx = placement_data.get("rotation_x", 0.0)
-            ry = placement_data.get("rotation_y", 0.0)
-            rz = placement_data.get("rotation_z", 0.0)
-            
             # Create placement
             placement = FreeCAD.Placement()
             placement.Base = FreeCAD.Vector(x, y, z)
@@ -456,6 +755,106 @@ class FreePVCRPCServer:
             "total_instances": len(created_objects)
         }
 
+    @staticmethod
+    def _array_layout_result(array_group, base_object):
+        """Result for an existing layout group that was left unchanged."""
+        names = [child.Name for child in array_group.Group]
+        return {
+            "group_name": array_group.Name,
+            "base_object": base_object,
+            "instances_created": 0,
+            "instance_names": names[:10],
+            "total_instances": len(names)
+        }
+
+    @execute_in_gui_thread
+    def place_array(self, base_object, positions, rotations=None):
+        """Place App::Link instances of an object at the given positions.
+
+        Unlike create_array_layout this does not replace an existing layout
+        group, so a large array can be placed in several calls (e.g. chunks
+        batched through system.multicall).
+
+        Args:
+            base_object: Name of template object to link
+            positions: List of [x, y, z] positions in mm
+            rotations: Optional list of [rx, ry, rz] rotations in degrees
+
+        Returns:
+            list: Names of created link objects
+        """
+        doc = FreeCAD.ActiveDocument
+        if not doc:
+            raise Exception("No active document")
+
+        base = doc.getObject(base_object)
+        if not base:
+            raise Exception(f"Base object '{base_object}' not found")
+
+        rotations = rotations or []
+        created = []
+        for i, (x, y, z) in enumerate(positions):
+            link = doc.addObject("App::Link", f"{base_object}_Instance")
+            link.LinkedObject = base
+
+            placement = FreeCAD.Placement()
+            placement.Base = FreeCAD.Vector(x, y, z)
+
+            # Apply rotations (Z-Y-X order, same as create_array_layout)
+            if i < len(rotations):
+                rx, ry, rz = rotations[i]
+                if rz != 0:
+                    placement.Rotation = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), rz)
+                if ry != 0:
+                    placement.Rotation = placement.Rotation * FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), ry)
+                if rx != 0:
+                    placement.Rotation = placement.Rotation * FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), rx)
+
+            link.Placement = placement
+            created.append(link.Name)
+
+        doc.recompute()
+        return created
+
+    @execute_in_gui_thread
+    def get_rack_summary(self, name):
+        """Read the layout-relevant properties of a rack object.
+
+        Args:
+            name: Name of rack object
+
+        Returns:
+            dict: panels_per_row, rows, tilt_angle and power_watts (defaults
+            for missing properties), or None if the object does not exist
+        """
+        doc = FreeCAD.ActiveDocument
+        base = doc.getObject(name) if doc else None
+        if base is None:
+            return None
+
+        panel_template = getattr(base, "PanelTemplate", None)
+        return {
+            "panels_per_row": int(getattr(base, "PanelsPerRow", 2)),
+            "rows": int(getattr(base, "Rows", 1)),
+            "tilt_angle": float(getattr(base, "TiltAngle", 25.0)),
+            "power_watts": float(getattr(panel_template, "PowerWatts", 550.0)),
+        }
+
+    @execute_in_gui_thread
+    def find_terrain(self):
+        """Find a terrain mesh object in the active document.
+
+        Returns:
+            str: Name of the first mesh object with "terrain" in its name,
+            or "" if there is none
+        """
+        doc = FreeCAD.ActiveDocument
+        if doc:
+            for obj in doc.Objects:
+                if hasattr(obj, "Mesh") and "terrain" in obj.Name.lower():
+                    return obj.Name
+        return ""
+
     @execute_in_gui_thread
     def get_terrain_elevation(self, terrain_name, x, y):
         """Get terrain elevation at (x, y).
@@ -497,7 +896,13 @@ def _server_thread_func(host, port):
     """Server thread function."""
     global _server, _running
 
-    _server = SimpleXMLRPCServer((host, port), allow_none=True, logRequests=False)
+    _server = _ThreadingXMLRPCServer(
+        (host, port),
+        requestHandler=_KeepAliveRequestHandler,
+        allow_none=True,
+        logRequests=False,
+    )
+    _server.register_multicall_functions()
 
     # Create RPC server instance and register its methods
     rpc = FreePVCRPCServer(host, port)
@@ -1,7 +1,15 @@
 """FreePVC Connection - Extends freecad-mcp's FreeCADConnection with solar-specific RPC methods."""
 
+import threading
 import xmlrpc.client
-from typing import Any, Dict, List, Optional, Tuple
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from freepvc.models.solar_objects import PlacementArray
+from freepvc.models.terrain import TerrainMesh, quantize_colors
 
 try:
     from freecad_mcp.server import FreeCADConnection as BaseFreeCADConnection
@@ -46,9 +54,172 @@ class FreePVCConnection(BaseFreeCADConnection):
     # Use different port to avoid conflict with base freecad-mcp
     RPC_PORT = 9876
 
+    # Worker threads used by the *_async methods
+    ASYNC_WORKERS = 4
+
+    # Positions per place_array call when sharding through system.multicall
+    PLACE_ARRAY_CHUNK = 100
+
+    # Vertex/triangle rows per call when streaming a large terrain mesh upload
+    MESH_UPLOAD_CHUNK = 250_000
+
+    # zlib level for mesh buffers in both directions, 0 to send them raw.
+    # Level 1 shrinks terrain meshes 2-3x for about the time the smaller
+    # base64/XML payload saves on localhost, and wins outright over a network.
+    MESH_COMPRESSION_LEVEL = 1
+
+    # Terrain meshes kept by get_terrain_mesh(), least recently used dropped first
+    MESH_CACHE_SIZE = 8
+
     def __init__(self, host: str = None, port: int = None):
         """Initialize connection to FreePVC's RPC server on port 9876."""
-        super().__init__(host=host, port=port or self.RPC_PORT)
+        port = port or self.RPC_PORT
+        super().__init__(host=host, port=port)
+        self._url = f"http://{host or '127.0.0.1'}:{port}"
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        # terrain name -> (revision, TerrainMesh) from get_terrain_mesh()
+        self._mesh_cache: Dict[str, Tuple[str, TerrainMesh]] = {}
+        # Guards _mesh_cache, which the async worker threads share;
+        # _mesh_forgets counts _forget_mesh() calls so that a fetch that
+        # was in flight during one does not re-cache a stale mesh
+        self._mesh_cache_lock = threading.Lock()
+        self._mesh_forgets = 0
+
+    # Async RPC support
+    #
+    # ServerProxy is not thread-safe, so each worker thread lazily opens its
+    # own proxy. The caller can keep doing local NumPy work (e.g. building the
+    # next layout) while FreeCAD processes the previous request.
+
+    def _thread_server(self) -> xmlrpc.client.ServerProxy:
+        """Get the ServerProxy owned by the calling worker thread."""
+        server = getattr(self._local, "server", None)
+        if server is None:
+            server = xmlrpc.client.ServerProxy(self._url, allow_none=True)
+            self._local.server = server
+        return server
+
+    def _call_in_worker(self, method: str, *args) -> Any:
+        return getattr(self._thread_server(), method)(*args)
+
+    def _worker_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.ASYNC_WORKERS, thread_name_prefix="freepvc-rpc"
+            )
+        return self._pool
+
+    def submit(self, method: str, *args) -> Future:
+        """Run an RPC method on a worker thread.
+
+        Args:
+            method: Name of the RPC method on the FreeCAD server
+            *args: Positional arguments for the method
+
+        Returns:
+            Future resolving to the RPC result
+        """
+        return self._worker_pool().submit(self._call_in_worker, method, *args)
+
+    def submit_with_server(self, fn: Callable[..., Any], *args) -> Future:
+        """Run ``fn(server, *args)`` on a worker thread.
+
+        ``server`` is the worker's own ServerProxy, for client-side helpers
+        that make RPC calls and post-process the results.
+        """
+        return self._worker_pool().submit(lambda: fn(self._thread_server(), *args))
+
+    @staticmethod
+    def gather(futures: List[Future], timeout: Optional[float] = None) -> List[Any]:
+        """Wait for futures and return their results in submission order.
+
+        Args:
+            futures: Futures returned by the *_async methods
+            timeout: Optional per-future timeout in seconds
+
+        Returns:
+            List of results (re-raises the first RPC error encountered)
+        """
+        return [f.result(timeout=timeout) for f in futures]
+
+    def close(self) -> None:
+        """Shut down the async worker pool, waiting for pending calls."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def execute_code(self, code: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Execute Python code in FreeCAD.
+
+        Args:
+            code: Python code to execute
+            params: Optional dict the code reads as ``params``. Passing
+                arguments this way keeps the script text fixed, so FreeCAD
+                reuses the compiled code and values need no quoting.
+
+        Returns:
+            Result of code execution
+        """
+        if params is None:
+            return super().execute_code(code)
+        return self.server.execute_code(code, params)
+
+    def execute_code_async(
+        self, code: str, params: Optional[Dict[str, Any]] = None
+    ) -> Future:
+        """Async variant of execute_code()."""
+        if params is None:
+            return self.submit("execute_code", code)
+        return self.submit("execute_code", code, params)
+
+    def create_terrain_mesh_async(
+        self,
+        vertices: List[Tuple[float, float, float]],
+        triangles: List[Tuple[int, int, int]],
+        name: str = "Terrain",
+    ) -> Future:
+        """Async variant of create_terrain_mesh()."""
+        self._forget_mesh(name)
+        return self.submit("create_terrain_mesh", vertices, triangles, name)
+
+    def create_terrain_mesh_bin_async(
+        self, vertices: np.ndarray, triangles: np.ndarray, name: str = "Terrain"
+    ) -> Future:
+        """Async variant of create_terrain_mesh_bin()."""
+        self._forget_mesh(name)
+        return self.submit_with_server(self._upload_terrain_mesh, vertices, triangles, name)
+
+    def set_face_colors_async(
+        self, obj_name: str, colors: List[Tuple[float, float, float]]
+    ) -> Future:
+        """Async variant of set_face_colors()."""
+        return self.submit("set_face_colors", obj_name, colors)
+
+    def set_face_colors_bin_async(self, obj_name: str, colors: np.ndarray) -> Future:
+        """Async variant of set_face_colors_bin()."""
+        return self.submit("set_face_colors_bin", obj_name, self._pack_rgb(colors))
+
+    def place_array_async(
+        self,
+        base_object: str,
+        positions: List[Tuple[float, float, float]],
+        rotations: Optional[List[Tuple[float, float, float]]] = None,
+    ) -> Future:
+        """Async variant of place_array()."""
+        return self.submit("place_array", base_object, positions, rotations or [])
+
+    def create_array_layout_async(
+        self, base_object: str, placements: List[Dict[str, Any]]
+    ) -> Future:
+        """Async variant of the create_array_layout RPC."""
+        return self.submit("create_array_layout", base_object, placements)
+
+    def create_array_layout_bin_async(
+        self, base_object: str, placements: PlacementArray
+    ) -> Future:
+        """Async variant of create_array_layout_bin()."""
+        return self.submit("create_array_layout_bin", *self._pack_placements(base_object, placements))
 
     # Solar-specific RPC methods that will be implemented in the FreeCAD addon
 
@@ -68,7 +239,175 @@ class FreePVCConnection(BaseFreeCADConnection):
         Returns:
             Object name in FreeCAD document
         """
-        return self.server.create_terrain_mesh(vertices, triangles, name)
+        obj_name = self.server.create_terrain_mesh(vertices, triangles, name)
+        self._forget_mesh(name, obj_name)
+        return obj_name
+
+    def create_terrain_mesh_bin(
+        self,
+        vertices: np.ndarray,
+        triangles: np.ndarray,
+        name: str = "Terrain",
+    ) -> str:
+        """Create a terrain mesh object from arrays sent as raw binary buffers.
+
+        Vertices travel as little-endian float64 and triangles as int32, each
+        in one base64 blob, instead of one XML element per coordinate. Meshes
+        larger than MESH_UPLOAD_CHUNK rows are streamed in chunks, so only
+        one chunk is ever encoded at a time on either side.
+
+        Args:
+            vertices: Nx3 array of (x, y, z) coordinates
+            triangles: Mx3 array of vertex indices
+            name: Object name
+
+        Returns:
+            Object name in FreeCAD document
+        """
+        obj_name = self._upload_terrain_mesh(self.server, vertices, triangles, name)
+        self._forget_mesh(name, obj_name)
+        return obj_name
+
+    def _upload_terrain_mesh(
+        self,
+        server: xmlrpc.client.ServerProxy,
+        vertices: np.ndarray,
+        triangles: np.ndarray,
+        name: str,
+    ) -> str:
+        chunk = self.MESH_UPLOAD_CHUNK
+        if len(vertices) <= chunk and len(triangles) <= chunk:
+            return server.create_terrain_mesh_bin(
+                self._pack_mesh_array(vertices, "<f8"),
+                self._pack_mesh_array(triangles, "<i4"),
+                name,
+                bool(self.MESH_COMPRESSION_LEVEL),
+            )
+
+        upload_id = server.begin_terrain_mesh(name)
+        for start in range(0, max(len(vertices), len(triangles)), chunk):
+            server.append_terrain_mesh(
+                upload_id,
+                self._pack_mesh_array(vertices[start:start + chunk], "<f8"),
+                self._pack_mesh_array(triangles[start:start + chunk], "<i4"),
+                bool(self.MESH_COMPRESSION_LEVEL),
+            )
+        return server.finish_terrain_mesh(upload_id)
+
+    def create_array_layout_bin(
+        self, base_object: str, placements: PlacementArray
+    ) -> Dict[str, Any]:
+        """Create App::Link instances of a rack from a PlacementArray.
+
+        Positions and rotations travel as one float64 buffer (six values per
+        rack) with a parallel list of names, instead of one XML struct per
+        rack.
+
+        Args:
+            base_object: Name of the template rack object
+            placements: Rack positions (mm), rotations (degrees) and ids
+
+        Returns:
+            Dict with group_name, instance counts and the first instance names
+        """
+        return self.server.create_array_layout_bin(*self._pack_placements(base_object, placements))
+
+    def _pack_placements(
+        self, base_object: str, placements: PlacementArray
+    ) -> Tuple[str, xmlrpc.client.Binary, List[str]]:
+        return base_object, self._pack_array(placements.data[:, :6], "<f8"), placements.rack_ids
+
+    def get_rack_summary(self, name: str) -> Optional[Dict[str, Any]]:
+        """Read a rack object's layout properties in one direct RPC.
+
+        Args:
+            name: Name of rack object
+
+        Returns:
+            Dict with panels_per_row, rows, tilt_angle and power_watts, or
+            None if the object does not exist
+        """
+        return self.server.get_rack_summary(name)
+
+    def get_rack_summary_async(self, name: str) -> Future:
+        """Async variant of get_rack_summary()."""
+        return self.submit("get_rack_summary", name)
+
+    def find_terrain(self) -> str:
+        """Name of a terrain mesh in the active document, or "" if none."""
+        return self.server.find_terrain()
+
+    def find_terrain_async(self) -> Future:
+        """Async variant of find_terrain()."""
+        return self.submit("find_terrain")
+
+    def get_terrain_mesh(self, terrain_name: str) -> Optional[TerrainMesh]:
+        """Fetch a terrain mesh from FreeCAD as a TerrainMesh.
+
+        Vertices and triangles arrive as packed binary buffers. The last
+        MESH_CACHE_SIZE meshes are cached per terrain name and only
+        re-transferred when their revision in FreeCAD changes, so repeated
+        queries also keep the engine caches (interpolator, grid index)
+        attached to the same TerrainMesh.
+
+        Args:
+            terrain_name: Name of terrain mesh object
+
+        Returns:
+            TerrainMesh, or None if the object does not exist
+        """
+        return self._fetch_terrain_mesh(self.server, terrain_name)
+
+    def get_terrain_mesh_async(self, terrain_name: str) -> Future:
+        """Async variant of get_terrain_mesh(), sharing its cache."""
+        return self.submit_with_server(self._fetch_terrain_mesh, terrain_name)
+
+    def _fetch_terrain_mesh(
+        self, server: xmlrpc.client.ServerProxy, terrain_name: str
+    ) -> Optional[TerrainMesh]:
+        with self._mesh_cache_lock:
+            cached = self._mesh_cache.get(terrain_name)
+            forgets = self._mesh_forgets
+        known_revision = cached[0] if cached else ""
+
+        data = server.get_terrain_mesh_arrays(
+            terrain_name, known_revision, self.MESH_COMPRESSION_LEVEL
+        )
+        if "error" in data:
+            with self._mesh_cache_lock:
+                self._mesh_cache.pop(terrain_name, None)
+            return None
+        if "vertices" not in data:
+            # Unchanged; re-insert to mark it most recently used, unless it
+            # was dropped or replaced meanwhile
+            with self._mesh_cache_lock:
+                if self._mesh_cache.get(terrain_name) is cached:
+                    del self._mesh_cache[terrain_name]
+                    self._mesh_cache[terrain_name] = cached
+            return cached[1]
+
+        vertex_bytes = data["vertices"].data
+        triangle_bytes = data["triangles"].data
+        if data.get("compressed"):
+            vertex_bytes = zlib.decompress(vertex_bytes)
+            triangle_bytes = zlib.decompress(triangle_bytes)
+        vertices = np.frombuffer(vertex_bytes, dtype="<f8").reshape(-1, 3)
+        triangles = np.frombuffer(triangle_bytes, dtype="<i4").reshape(-1, 3)
+        mesh = TerrainMesh(vertices=vertices, triangles=triangles)
+        with self._mesh_cache_lock:
+            if self._mesh_forgets == forgets:
+                self._mesh_cache.pop(terrain_name, None)
+                self._mesh_cache[terrain_name] = (data["revision"], mesh)
+                while len(self._mesh_cache) > self.MESH_CACHE_SIZE:
+                    del self._mesh_cache[next(iter(self._mesh_cache))]
+        return mesh
+
+    def _forget_mesh(self, *names: str) -> None:
+        """Drop cached meshes for objects that are being (re)created."""
+        with self._mesh_cache_lock:
+            self._mesh_forgets += 1
+            for name in names:
+                self._mesh_cache.pop(name, None)
 
     def set_face_colors(
         self, obj_name: str, colors: List[Tuple[float, float, float]]
@@ -84,6 +423,45 @@ class FreePVCConnection(BaseFreeCADConnection):
         """
         return self.server.set_face_colors(obj_name, colors)
 
+    @staticmethod
+    def _pack_array(values: np.ndarray, dtype: str) -> xmlrpc.client.Binary:
+        """Pack an array as one contiguous buffer of the given dtype."""
+        return xmlrpc.client.Binary(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+    def _pack_mesh_array(self, values: np.ndarray, dtype: str) -> xmlrpc.client.Binary:
+        """Pack a mesh array, zlib-compressed at MESH_COMPRESSION_LEVEL if set."""
+        if not self.MESH_COMPRESSION_LEVEL:
+            return self._pack_array(values, dtype)
+        data = np.ascontiguousarray(values, dtype=dtype)
+        return xmlrpc.client.Binary(zlib.compress(data, self.MESH_COMPRESSION_LEVEL))
+
+    @staticmethod
+    def _pack_rgb(colors: np.ndarray) -> xmlrpc.client.Binary:
+        """Pack Nx3 RGB colors as one flat uint8 buffer for transport.
+
+        Float colors (0-1) are quantized; uint8 colors are sent as they are.
+        """
+        colors = np.asarray(colors)
+        if colors.dtype != np.uint8:
+            colors = quantize_colors(colors)
+        return xmlrpc.client.Binary(np.ascontiguousarray(colors).tobytes())
+
+    def set_face_colors_bin(self, obj_name: str, colors: np.ndarray) -> bool:
+        """Apply per-face colors sent as a packed uint8 RGB buffer.
+
+        8-bit channels are enough for display and the payload is a single
+        base64 blob instead of three XML doubles per face.
+
+        Args:
+            obj_name: Name of mesh object
+            colors: Nx3 array of RGB values, floats in the 0-1 range or
+                uint8, one row per face
+
+        Returns:
+            Success status
+        """
+        return self.server.set_face_colors_bin(obj_name, self._pack_rgb(colors))
+
     def create_fixed_rack(self, config: Dict[str, Any]) -> str:
         """Create a fixed-tilt solar rack object.
 
@@ -122,7 +500,25 @@ class FreePVCConnection(BaseFreeCADConnection):
         Returns:
             List of created object names
         """
-        return self.server.place_array(base_object, positions, rotations or [])
+        rotations = rotations or []
+        chunk = self.PLACE_ARRAY_CHUNK
+        if len(positions) <= chunk:
+            return self.server.place_array(base_object, positions, rotations)
+
+        # Shard into one multicall: a single HTTP round trip, but each chunk
+        # runs as its own GUI-thread command on the FreeCAD side
+        multicall = xmlrpc.client.MultiCall(self.server)
+        for start in range(0, len(positions), chunk):
+            multicall.place_array(
+                base_object,
+                positions[start:start + chunk],
+                rotations[start:start + chunk],
+            )
+
+        names: List[str] = []
+        for chunk_names in multicall():
+            names.extend(chunk_names)
+        return names
 
     def get_terrain_elevation(
         self, terrain_name: str, x: float, y: float
@@ -0,0 +1,270 @@
+"""Marching-squares contour extraction on a regular elevation grid.
+
+The cell kernel is compiled with Numba (parallel over contour levels) when it
+is installed; otherwise the same code runs as plain Python.
+
+Segment endpoints are identified by the grid edge they lie on rather than by
+coordinates, so neighbouring cells share endpoints exactly and stitching
+segments into polylines is a pure integer lookup. Because edge ids are
+global, large grids can be split into tiles that are marched independently
+(in a thread pool when the kernel is compiled) and stitched in one pass.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import numpy as np
+
+from freepvc.engines._numba_compat import NUMBA_AVAILABLE, njit, prange
+
+# Local cell edges: 0=bottom, 1=right, 2=top, 3=left.
+# Corner bits: 1=(i, j), 2=(i, j+1), 4=(i+1, j+1), 8=(i+1, j).
+# Each row lists up to two segments as edge pairs, -1 = unused. Saddle cases
+# (5, 10) use this table when the cell centre is below the level and
+# _SADDLE_ABOVE when it is above.
+_SEGMENTS = np.array([
+    [-1, -1, -1, -1],
+    [3, 0, -1, -1],
+    [0, 1, -1, -1],
+    [3, 1, -1, -1],
+    [1, 2, -1, -1],
+    [3, 0, 1, 2],
+    [0, 2, -1, -1],
+    [3, 2, -1, -1],
+    [2, 3, -1, -1],
+    [0, 2, -1, -1],
+    [0, 1, 2, 3],
+    [1, 2, -1, -1],
+    [3, 1, -1, -1],
+    [0, 1, -1, -1],
+    [3, 0, -1, -1],
+    [-1, -1, -1, -1],
+], dtype=np.int64)
+
+_SADDLE_ABOVE = np.array([
+    [0, 1, 2, 3],  # case 5
+    [3, 0, 1, 2],  # case 10
+], dtype=np.int64)
+
+
+# Grids with more cells than this per side are marched in tiles
+TILE_CELLS = 256
+
+# Cells per side of the blocks whose elevation range is cached so that
+# blocks not crossing a level are skipped without visiting their cells
+RANGE_BLOCK = 32
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _march(z, row0, col0, grid_ny, grid_nx, levels, block_min, block_max,
+           segments, saddle_above, out_edges, out_counts):
+    """Emit (edge_id, edge_id) segment pairs for every level into out_edges.
+
+    ``z`` may be a tile of a larger (grid_ny, grid_nx) grid whose first
+    sample is at (row0, col0); edge ids are always global to that grid.
+    ``block_min``/``block_max`` hold the elevation range of each
+    RANGE_BLOCK x RANGE_BLOCK block of cells in the tile.
+    """
+    ny, nx = z.shape
+    n_h = grid_ny * (grid_nx - 1)
+    n_by, n_bx = block_min.shape
+    for li in prange(levels.shape[0]):
+        level = levels[li]
+        count = 0
+        for bi in range(n_by):
+            for bj in range(n_bx):
+                # A cell crosses the level only if some corner is above it and
+                # some corner is not; NaN ranges compare False and are skipped
+                if not (block_max[bi, bj] > level and block_min[bi, bj] <= level):
+                    continue
+                for ti in range(bi * RANGE_BLOCK, min((bi + 1) * RANGE_BLOCK, ny - 1)):
+                    i = row0 + ti
+                    for tj in range(bj * RANGE_BLOCK, min((bj + 1) * RANGE_BLOCK, nx - 1)):
+                        j = col0 + tj
+                        z0 = z[ti, tj]
+                        z1 = z[ti, tj + 1]
+                        z2 = z[ti + 1, tj + 1]
+                        z3 = z[ti + 1, tj]
+                        if np.isnan(z0) or np.isnan(z1) or np.isnan(z2) or np.isnan(z3):
+                            continue
+
+                        case = 0
+                        if z0 > level:
+                            case |= 1
+                        if z1 > level:
+                            case |= 2
+                        if z2 > level:
+                            case |= 4
+                        if z3 > level:
+                            case |= 8
+                        if case == 0 or case == 15:
+                            continue
+
+                        row = segments[case]
+                        if case == 5 or case == 10:
+                            if 0.25 * (z0 + z1 + z2 + z3) > level:
+                                row = saddle_above[0 if case == 5 else 1]
+
+                        for k in range(0, 4, 2):
+                            if row[k] < 0:
+                                break
+                            for side in range(2):
+                                local = row[k + side]
+                                if local == 0:
+                                    edge = i * (grid_nx - 1) + j
+                                elif local == 1:
+                                    edge = n_h + i * grid_nx + j + 1
+                                elif local == 2:
+                                    edge = (i + 1) * (grid_nx - 1) + j
+                                else:
+                                    edge = n_h + i * grid_nx + j
+                                out_edges[li, count, side] = edge
+                            count += 1
+        out_counts[li] = count
+
+
+def _march_tile(
+    z: np.ndarray, row0: int, col0: int, row1: int, col1: int, levels: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """March the cells between sample rows row0..row1 and columns col0..col1.
+
+    The tile is a view sharing its last row/column with the next tile, so
+    every cell is visited exactly once across tiles.
+    """
+    tile = z[row0:row1 + 1, col0:col1 + 1]
+    block_min, block_max = _block_ranges(tile)
+    max_segments = 2 * (row1 - row0) * (col1 - col0)
+    out_edges = np.empty((len(levels), max_segments, 2), dtype=np.int64)
+    out_counts = np.zeros(len(levels), dtype=np.int64)
+    _march(tile, row0, col0, z.shape[0], z.shape[1], levels, block_min, block_max,
+           _SEGMENTS, _SADDLE_ABOVE, out_edges, out_counts)
+    return out_edges, out_counts
+
+
+def _block_ranges(z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max corner elevation of each RANGE_BLOCK-sized block of cells.
+
+    NaN corners are ignored; all-NaN blocks get a NaN range.
+    """
+    cell_min = np.fmin(np.fmin(z[:-1, :-1], z[:-1, 1:]), np.fmin(z[1:, 1:], z[1:, :-1]))
+    cell_max = np.fmax(np.fmax(z[:-1, :-1], z[:-1, 1:]), np.fmax(z[1:, 1:], z[1:, :-1]))
+
+    # Pad to whole blocks with NaN (ignored by fmin/fmax) and reduce
+    n_cy, n_cx = cell_min.shape
+    n_by = -(-n_cy // RANGE_BLOCK)
+    n_bx = -(-n_cx // RANGE_BLOCK)
+    pad = ((0, n_by * RANGE_BLOCK - n_cy), (0, n_bx * RANGE_BLOCK - n_cx))
+    shape = (n_by, RANGE_BLOCK, n_bx, RANGE_BLOCK)
+    cell_min = np.pad(cell_min, pad, constant_values=np.nan).reshape(shape)
+    cell_max = np.pad(cell_max, pad, constant_values=np.nan).reshape(shape)
+    block_min = np.fmin.reduce(np.fmin.reduce(cell_min, axis=3), axis=1)
+    block_max = np.fmax.reduce(np.fmax.reduce(cell_max, axis=3), axis=1)
+    return block_min, block_max
+
+
+def _edge_points(
+    edges: np.ndarray, x: np.ndarray, y: np.ndarray, z: np.ndarray, level: float
+) -> np.ndarray:
+    """Linearly interpolate the level crossing on each grid edge id."""
+    ny, nx = z.shape
+    n_h = ny * (nx - 1)
+
+    horizontal = edges < n_h
+    k = np.where(horizontal, edges, edges - n_h)
+    ia = np.where(horizontal, k // (nx - 1), k // nx)
+    ja = np.where(horizontal, k % (nx - 1), k % nx)
+    ib = np.where(horizontal, ia, ia + 1)
+    jb = np.where(horizontal, ja + 1, ja)
+
+    za = z[ia, ja]
+    zb = z[ib, jb]
+    t = (level - za) / (zb - za)
+
+    px = x[ja] + t * (x[jb] - x[ja])
+    py = y[ia] + t * (y[ib] - y[ia])
+    return np.column_stack([px, py])
+
+
+def _stitch(pairs: np.ndarray) -> List[Tuple[List[int], bool]]:
+    """Join segments sharing an edge id into polylines.
+
+    Every grid edge borders at most two cells, so each edge id appears in at
+    most two segments and the chains are unambiguous.
+    """
+    adjacency: dict = {}
+    for s, (a, b) in enumerate(pairs.tolist()):
+        adjacency.setdefault(a, []).append(s)
+        adjacency.setdefault(b, []).append(s)
+
+    pair_list = pairs.tolist()
+    used = [False] * len(pair_list)
+    lines = []
+
+    # Start open chains from their free ends, then pick up closed loops
+    ends = [e for e, segs in adjacency.items() if len(segs) == 1]
+    for start in ends + list(adjacency):
+        for seg in adjacency[start]:
+            if used[seg]:
+                continue
+            chain = [start]
+            edge = start
+            s = seg
+            while s is not None:
+                used[s] = True
+                a, b = pair_list[s]
+                edge = b if a == edge else a
+                chain.append(edge)
+                s = next((t for t in adjacency[edge] if not used[t]), None)
+            lines.append((chain, len(chain) > 2 and chain[0] == chain[-1]))
+    return lines
+
+
+def march_contours(
+    x: np.ndarray,
+    y: np.ndarray,
+    z_grid: np.ndarray,
+    levels: np.ndarray,
+) -> List[Tuple[float, np.ndarray, bool]]:
+    """Extract contour polylines from a regular grid.
+
+    Args:
+        x: 1D array of grid x coordinates (length nx)
+        y: 1D array of grid y coordinates (length ny)
+        z_grid: (ny, nx) elevation grid, NaN cells are skipped. float32 grids
+            are processed as float32.
+        levels: Contour elevations
+
+    Returns:
+        List of (level, Nx2 points, is_closed) tuples
+    """
+    z_dtype = np.float32 if z_grid.dtype == np.float32 else np.float64
+    z = np.ascontiguousarray(z_grid, dtype=z_dtype)
+    levels = np.ascontiguousarray(levels, dtype=np.float64)
+    ny, nx = z.shape
+    if ny < 2 or nx < 2 or len(levels) == 0:
+        return []
+
+    if not NUMBA_AVAILABLE or (ny - 1 <= TILE_CELLS and nx - 1 <= TILE_CELLS):
+        tiles = [_march_tile(z, 0, 0, ny - 1, nx - 1, levels)]
+    else:
+        # Tiles that fit in cache, marched concurrently; the compiled kernel
+        # releases the GIL
+        bounds = [
+            (r, c, min(r + TILE_CELLS, ny - 1), min(c + TILE_CELLS, nx - 1))
+            for r in range(0, ny - 1, TILE_CELLS)
+            for c in range(0, nx - 1, TILE_CELLS)
+        ]
+        with ThreadPoolExecutor() as pool:
+            tiles = list(pool.map(lambda b: _march_tile(z, *b, levels), bounds))
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    contours = []
+    for li, level in enumerate(levels.tolist()):
+        pairs = np.concatenate([edges[li, :counts[li]] for edges, counts in tiles])
+        if len(pairs) == 0:
+            continue
+        for chain, closed in _stitch(pairs):
+            points = _edge_points(np.array(chain), x, y, z, level)
+            contours.append((level, points, closed))
+    return contours
@@ -0,0 +1,24 @@
+"""Optional Numba support for the compute kernels.
+
+Kernels decorated with ``njit`` are compiled when Numba is installed (the
+``accel`` extra) and run as plain Python otherwise; check
+``NUMBA_AVAILABLE`` to choose a NumPy path for hot loops instead.
+"""
+
+try:
+    from numba import get_num_threads, njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def get_num_threads():
+        """Plain Python runs kernels on one thread."""
+        return 1
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        def decorator(func):
+            return func
+        return decorator
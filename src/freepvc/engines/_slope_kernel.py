@@ -0,0 +1,59 @@
+"""Fused slope/aspect derivation from face normals.
+
+With Numba the kernel reads each normal once and writes both outputs in a
+single parallel pass. Without it, the NumPy path works in place on two
+preallocated arrays to avoid per-step temporaries.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from freepvc.engines._numba_compat import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _slope_aspect_kernel(normals, slopes, aspects):
+    for i in prange(normals.shape[0]):
+        nx = normals[i, 0]
+        ny = normals[i, 1]
+        nz = abs(normals[i, 2])
+        slopes[i] = math.degrees(math.acos(min(1.0, nz)))
+        aspects[i] = (math.degrees(math.atan2(nx, ny)) + 360.0) % 360.0
+
+
+def slope_aspect(
+    normals: np.ndarray, dtype: np.dtype = np.float64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute slope and aspect in degrees from unit face normals.
+
+    Slope is the angle from horizontal (Z is up); aspect is the compass
+    bearing of the normal's horizontal component (0=N, 90=E).
+
+    Args:
+        normals: Mx3 array of unit normal vectors
+        dtype: Working and output dtype (float64 or float32)
+
+    Returns:
+        Tuple of (slope_deg, aspect_deg) arrays of length M
+    """
+    normals = np.ascontiguousarray(normals, dtype=dtype)
+    slopes = np.empty(len(normals), dtype=normals.dtype)
+    aspects = np.empty(len(normals), dtype=normals.dtype)
+
+    if NUMBA_AVAILABLE:
+        _slope_aspect_kernel(normals, slopes, aspects)
+        return slopes, aspects
+
+    np.abs(normals[:, 2], out=slopes)
+    np.minimum(slopes, 1.0, out=slopes)
+    np.arccos(slopes, out=slopes)
+    np.degrees(slopes, out=slopes)
+
+    # arctan2(x, y) for compass bearing
+    np.arctan2(normals[:, 0], normals[:, 1], out=aspects)
+    np.degrees(aspects, out=aspects)
+    aspects += 360.0
+    np.mod(aspects, 360.0, out=aspects)
+    return slopes, aspects
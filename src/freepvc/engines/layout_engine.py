@@ -5,14 +5,15 @@ with object reuse and terrain-following capabilities.
 """
 
 import math
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 import numpy as np
 
 from freepvc.models.terrain import TerrainMesh
+from freepvc.engines.terrain_engine import TerrainEngine
 from freepvc.models.solar_objects import (
     RackConfig,
     TrackerConfig,
-    RackPlacement,
+    PlacementArray,
     LayoutConfig,
     ArrayLayout,
     RackType,
@@ -49,11 +50,16 @@ class LayoutEngine:
         # Calculate grid parameters
         row_spacing_m = config.spacing_m
         
+        # Rack cap for the capacity target, applied as a single slice after filtering
+        power_per_rack_kw = config.rack_config.dc_capacity_kw
+        if config.target_capacity_mw:
+            max_racks = math.ceil(config.target_capacity_mw * 1000 / power_per_rack_kw)
+        else:
+            max_racks = None
+        
         # Determine layout area
         # If target capacity is specified, calculate estimated area needed
         if config.target_capacity_mw:
-            panels_per_rack = config.rack_config.panels_per_row * config.rack_config.rows
-            power_per_rack_kw = (panels_per_rack * config.rack_config.panel_spec.power_watts) / 1000.0
             num_racks_needed = int(config.target_capacity_mw * 1000 / power_per_rack_kw)
             racks_per_row = int(num_racks_needed ** 0.5) + 2
             area_width_m = racks_per_row * rack_width_m * 1.2
@@ -84,96 +90,118 @@ class LayoutEngine:
             x_min, y_min = 0, 0
             x_max, y_max = 500_000, 500_000
         
-        # Convert to meters
-        x_min_m, x_max_m = x_min / 1000.0, x_max / 1000.0
-        y_min_m, y_max_m = y_min / 1000.0, y_max / 1000.0
-        
         # Generate all potential grid positions upfront (vectorized)
-        x_positions = np.arange(x_min_m, x_max_m - rack_width_m, rack_width_m)
-        y_positions = np.arange(y_min_m, y_max_m - rack_length_m, row_spacing_m)
-        xx, yy = np.meshgrid(x_positions, y_positions)
-        grid_positions = np.column_stack([xx.ravel(), yy.ravel()])
+        grid_positions = LayoutEngine._grid_positions(config, (x_min, x_max), (y_min, y_max))
+        
+        # Flat ground: every grid position is valid, so skip the sampling
+        if terrain_mesh is None:
+            layout = ArrayLayout(
+                config=config,
+                placement_array=LayoutEngine._grid_placement_array(grid_positions[:max_racks]),
+            )
+            layout.calculate_statistics()
+            return layout
         
         # Calculate center points for terrain sampling
         center_offsets = np.array([rack_width_m / 2, rack_length_m / 2])
         center_positions = grid_positions + center_offsets
         center_positions_mm = center_positions * 1000
         
-        # Batch query terrain if available (MUCH faster!)
-        if terrain_mesh:
-            from freepvc.engines.terrain_engine import TerrainEngine
-            
-            # Single batched call for all elevations
-            z_mm_array = TerrainEngine.interpolate_elevation(terrain_mesh, center_positions_mm)
-            
-            # Single batched call for all slopes
-            slope_deg_array = TerrainEngine.compute_slopes_at_points(
-                terrain_mesh, center_positions_mm, delta=1000.0
-            )
-            
-            # Check if entire rack footprint is within terrain bounds (all 4 corners)
-            bounds = terrain_mesh.bounds
-            terrain_x_min, terrain_x_max = bounds[0]
-            terrain_y_min, terrain_y_max = bounds[1]
-            
-            # Calculate all 4 corners for each rack position (in mm)
-            rack_x_min = grid_positions[:, 0] * 1000  # Left edge
-            rack_x_max = (grid_positions[:, 0] + rack_width_m) * 1000  # Right edge
-            rack_y_min = grid_positions[:, 1] * 1000  # Bottom edge
-            rack_y_max = (grid_positions[:, 1] + rack_length_m) * 1000  # Top edge
-            
-            # Check if all corners are within terrain bounds
-            within_bounds = (
-                (rack_x_min >= terrain_x_min) &
-                (rack_x_max <= terrain_x_max) &
-                (rack_y_min >= terrain_y_min) &
-                (rack_y_max <= terrain_y_max)
-            )
-            
-            # Filter by slope AND boundary (vectorized)
-            valid_mask = (slope_deg_array <= config.max_slope_deg) & ~np.isnan(z_mm_array) & within_bounds
-        else:
-            z_mm_array = np.zeros(len(grid_positions))
-            slope_deg_array = np.zeros(len(grid_positions))
-            valid_mask = np.ones(len(grid_positions), dtype=bool)
+        # Batch query terrain (MUCH faster!)
+        # Single batched call for all elevations
+        z_mm_array = TerrainEngine.interpolate_elevation(terrain_mesh, center_positions_mm)
         
-        # Apply filters
-        valid_positions = grid_positions[valid_mask]
-        valid_z_mm = z_mm_array[valid_mask]
-        valid_slopes = slope_deg_array[valid_mask]
+        # Single batched call for all slopes
+        slope_deg_array = TerrainEngine.compute_slopes_at_points(
+            terrain_mesh, center_positions_mm, delta=1000.0
+        )
         
-        # Apply capacity limit
-        panels_per_rack = config.rack_config.panels_per_row * config.rack_config.rows
-        power_per_rack_kw = (panels_per_rack * config.rack_config.panel_spec.power_watts) / 1000.0
+        # Check if entire rack footprint is within terrain bounds (all 4 corners)
+        bounds = terrain_mesh.bounds
+        terrain_x_min, terrain_x_max = bounds[0]
+        terrain_y_min, terrain_y_max = bounds[1]
+        
+        # Calculate all 4 corners for each rack position (in mm)
+        rack_x_min = grid_positions[:, 0] * 1000  # Left edge
+        rack_x_max = (grid_positions[:, 0] + rack_width_m) * 1000  # Right edge
+        rack_y_min = grid_positions[:, 1] * 1000  # Bottom edge
+        rack_y_max = (grid_positions[:, 1] + rack_length_m) * 1000  # Top edge
+        
+        # Check if all corners are within terrain bounds
+        within_bounds = (
+            (rack_x_min >= terrain_x_min) &
+            (rack_x_max <= terrain_x_max) &
+            (rack_y_min >= terrain_y_min) &
+            (rack_y_max <= terrain_y_max)
+        )
         
-        if config.target_capacity_mw:
-            target_capacity_kw = config.target_capacity_mw * 1000
-            max_racks = int(np.ceil(target_capacity_kw / power_per_rack_kw))
-            valid_positions = valid_positions[:max_racks]
-            valid_z_mm = valid_z_mm[:max_racks]
-            valid_slopes = valid_slopes[:max_racks]
-        
-        # Create placements
-        placements: List[RackPlacement] = []
-        for i, (pos, z_mm, slope) in enumerate(zip(valid_positions, valid_z_mm, valid_slopes)):
-            placement = RackPlacement(
-                x=pos[0] * 1000,  # mm
-                y=pos[1] * 1000,
-                z=z_mm,
-                rotation_x=0.0,
-                rotation_y=0.0,
-                rotation_z=0.0,
-                terrain_slope_deg=float(slope),
-                terrain_aspect_deg=0.0,
-                rack_id=f"Rack_{i:04d}",
-            )
-            placements.append(placement)
+        # Filter by slope AND boundary (vectorized)
+        valid_mask = (slope_deg_array <= config.max_slope_deg) & ~np.isnan(z_mm_array) & within_bounds
         
-        layout = ArrayLayout(config=config, placements=placements)
+        # Apply filters and capacity limit in one index selection
+        valid_idx = np.flatnonzero(valid_mask)[:max_racks]
+        valid_positions = grid_positions[valid_idx]
+        valid_z_mm = z_mm_array[valid_idx]
+        valid_slopes = slope_deg_array[valid_idx]
+        
+        layout = ArrayLayout(
+            config=config,
+            placement_array=LayoutEngine._grid_placement_array(
+                valid_positions, z_mm=valid_z_mm, slopes_deg=valid_slopes
+            ),
+        )
         layout.calculate_statistics()
         
         return layout
     
+    @staticmethod
+    def _grid_positions(
+        config: LayoutConfig,
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float],
+    ) -> np.ndarray:
+        """Lower-left corners of a regular rack grid, in meters.
+
+        Racks sit side by side along x and ``config.spacing_m`` apart along
+        y, ordered row by row ('xy' meshgrid order).
+
+        Args:
+            config: Layout configuration with rack template
+            x_range: (min, max) x extent of the area in mm
+            y_range: (min, max) y extent of the area in mm
+
+        Returns:
+            Nx2 array of (x, y) positions in meters
+        """
+        rack_width_m = config.rack_config.rack_width_mm / 1000.0
+        rack_length_m = config.rack_config.rack_length_mm / 1000.0
+        x_positions = np.arange(x_range[0] / 1000.0, x_range[1] / 1000.0 - rack_width_m, rack_width_m)
+        y_positions = np.arange(y_range[0] / 1000.0, y_range[1] / 1000.0 - rack_length_m, config.spacing_m)
+        xx, yy = np.meshgrid(x_positions, y_positions)
+        return np.column_stack([xx.ravel(), yy.ravel()])
+    
+    @staticmethod
+    def _grid_placement_array(
+        positions_m: np.ndarray,
+        z_mm: Optional[np.ndarray] = None,
+        slopes_deg: Optional[np.ndarray] = None,
+    ) -> PlacementArray:
+        """PlacementArray for grid positions, with ids Rack_0000, Rack_0001, ...
+
+        Rotations and aspect stay zero, as do z and slope unless given.
+        """
+        columns = PlacementArray.COLUMNS
+        data = np.zeros((len(positions_m), len(columns)), order="F")
+        data[:, columns.index("x")] = positions_m[:, 0] * 1000  # mm
+        data[:, columns.index("y")] = positions_m[:, 1] * 1000
+        if z_mm is not None:
+            data[:, columns.index("z")] = z_mm
+        if slopes_deg is not None:
+            data[:, columns.index("terrain_slope_deg")] = slopes_deg
+        return PlacementArray(
+            data=data, rack_ids=[f"Rack_{i:04d}" for i in range(len(positions_m))]
+        )
+    
     @staticmethod
     def generate_terrain_following_layout(
         config: LayoutConfig,
@@ -247,6 +275,9 @@ class LayoutEngine:
         Returns:
             Actual GCR (0-1)
         """
+        # calculate_statistics() already derived the ratio from per-rack areas
+        if layout.gcr_actual > 0:
+            return layout.gcr_actual
         if layout.ground_area_m2 > 0:
             return layout.panel_area_m2 / layout.ground_area_m2
         return 0.0
@@ -267,31 +298,30 @@ class LayoutEngine:
         Returns:
             Tuple of (slope_deg, aspect_deg, elevation_mm)
         """
-        from freepvc.engines.terrain_engine import TerrainEngine
-        import numpy as np
+        # Point lookups go through the cached uniform-grid triangle index
+        index = TerrainEngine.get_grid_index(terrain_mesh)
         
         # Get elevation
-        z_mm = TerrainEngine.interpolate_elevation(terrain_mesh, np.array([x_mm, y_mm]))
+        z_mm = index.elevation(x_mm, y_mm)
         
         # Sample nearby points to calculate slope
         delta = 1000.0  # mm (1 meter for better slope calculation)
         try:
-            z_xp = TerrainEngine.interpolate_elevation(terrain_mesh, np.array([x_mm + delta, y_mm]))
-            z_xn = TerrainEngine.interpolate_elevation(terrain_mesh, np.array([x_mm - delta, y_mm]))
-            z_yp = TerrainEngine.interpolate_elevation(terrain_mesh, np.array([x_mm, y_mm + delta]))
-            z_yn = TerrainEngine.interpolate_elevation(terrain_mesh, np.array([x_mm, y_mm - delta]))
+            z_xp = index.elevation(x_mm + delta, y_mm)
+            z_xn = index.elevation(x_mm - delta, y_mm)
+            z_yp = index.elevation(x_mm, y_mm + delta)
+            z_yn = index.elevation(x_mm, y_mm - delta)
             
             # Calculate gradients
             dx = (z_xp - z_xn) / (2 * delta)
             dy = (z_yp - z_yn) / (2 * delta)
             
             # Calculate slope and aspect
-            slope_rad = math.atan(math.sqrt(dx**2 + dy**2))
-            slope_deg = math.degrees(slope_rad)
+            gradient = math.hypot(dx, dy)
+            slope_deg = math.degrees(math.atan(gradient))
             
-            if dx != 0 or dy != 0:
-                aspect_rad = math.atan2(dy, dx)
-                aspect_deg = (90 - math.degrees(aspect_rad)) % 360
+            if gradient > 0:
+                aspect_deg = (90 - math.degrees(math.atan2(dy, dx))) % 360
             else:
                 aspect_deg = 0.0
             
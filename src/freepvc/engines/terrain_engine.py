@@ -9,16 +9,106 @@ from scipy.spatial import Delaunay
 from scipy.interpolate import LinearNDInterpolator, CloughTocher2DInterpolator
 from typing import List, Tuple, Optional
 
+from freepvc.engines import _contour_kernel
+from freepvc.engines._slope_kernel import slope_aspect
+from freepvc.engines._volume_kernel import cut_fill
 from freepvc.models.terrain import (
     TerrainData,
     TerrainMesh,
     SlopeMap,
     ContourLine,
     ContourSet,
+    NORMAL_DTYPE,
 )
 import math
 
 
+class TriangleGridIndex:
+    """Uniform-grid bucket index for locating the mesh triangle under a point.
+
+    Each grid cell stores the indices of the triangles whose XY bounding box
+    overlaps it. The cell size is chosen so that a cell holds about
+    ``tris_per_cell`` triangles, making a lookup one dict access plus a
+    barycentric test on a handful of candidates.
+    """
+
+    def __init__(self, mesh: TerrainMesh, tris_per_cell: float = 3.0):
+        tri_xyz = mesh.tri_verts  # (M, 3, 3)
+        tri_xy = tri_xyz[:, :, :2]
+        lo = tri_xy.min(axis=1)
+        hi = tri_xy.max(axis=1)
+
+        self.x0, self.y0 = (float(v) for v in lo.min(axis=0))
+        x1, y1 = (float(v) for v in hi.max(axis=0))
+        area = (x1 - self.x0) * (y1 - self.y0)
+        n_cells = max(len(tri_xy) / tris_per_cell, 1.0)
+        self.cell_size = math.sqrt(area / n_cells) if area > 0 else 1.0
+
+        # Per-triangle origin, inverse edge matrix and corner elevations,
+        # stored as Python floats for fast scalar access in locate()
+        a = tri_xy[:, 0]
+        e1 = tri_xy[:, 1] - a
+        e2 = tri_xy[:, 2] - a
+        det = e1[:, 0] * e2[:, 1] - e2[:, 0] * e1[:, 1]
+        safe_det = np.where(det == 0, 1.0, det)
+        inv = np.column_stack([
+            e2[:, 1] / safe_det, -e2[:, 0] / safe_det,
+            -e1[:, 1] / safe_det, e1[:, 0] / safe_det,
+        ])
+        self._origin = a.tolist()
+        self._inverse = inv.tolist()
+        self._degenerate = (det == 0).tolist()
+        self._z = tri_xyz[:, :, 2].tolist()
+
+        # Bucket triangles by the cells their bounding boxes cover
+        ix_lo = ((lo[:, 0] - self.x0) // self.cell_size).astype(int)
+        iy_lo = ((lo[:, 1] - self.y0) // self.cell_size).astype(int)
+        ix_hi = ((hi[:, 0] - self.x0) // self.cell_size).astype(int)
+        iy_hi = ((hi[:, 1] - self.y0) // self.cell_size).astype(int)
+
+        buckets: dict = {}
+        for t, (ia, ib, ja, jb) in enumerate(
+            zip(ix_lo.tolist(), ix_hi.tolist(), iy_lo.tolist(), iy_hi.tolist())
+        ):
+            for ix in range(ia, ib + 1):
+                for iy in range(ja, jb + 1):
+                    buckets.setdefault((ix, iy), []).append(t)
+        self._buckets = buckets
+
+    def locate(self, x: float, y: float) -> Optional[Tuple[int, float, float]]:
+        """Find the triangle containing (x, y).
+
+        Returns:
+            Tuple of (triangle_index, u, v) barycentric coordinates relative to
+            the triangle's first vertex, or None if the point is off the mesh
+        """
+        key = (
+            int((x - self.x0) // self.cell_size),
+            int((y - self.y0) // self.cell_size),
+        )
+        eps = 1e-9
+        for t in self._buckets.get(key, ()):
+            if self._degenerate[t]:
+                continue
+            ox, oy = self._origin[t]
+            a, b, c, d = self._inverse[t]
+            px, py = x - ox, y - oy
+            u = a * px + b * py
+            v = c * px + d * py
+            if u >= -eps and v >= -eps and u + v <= 1.0 + eps:
+                return t, u, v
+        return None
+
+    def elevation(self, x: float, y: float) -> float:
+        """Linearly interpolated elevation at (x, y), NaN if off the mesh."""
+        hit = self.locate(x, y)
+        if hit is None:
+            return float("nan")
+        t, u, v = hit
+        z0, z1, z2 = self._z[t]
+        return z0 + u * (z1 - z0) + v * (z2 - z0)
+
+
 class TerrainEngine:
     """Engine for terrain mesh generation and analysis."""
 
@@ -39,30 +129,86 @@ class TerrainEngine:
             raise ValueError("Need at least 3 points to create a mesh")
 
         points = terrain_data.points
-        xy = points[:, :2]  # Project to 2D for Delaunay
 
-        # Generate Delaunay triangulation
-        tri = Delaunay(xy)
+        # Complete regular grids are split into two triangles per cell
+        # directly; anything else is triangulated by qhull
+        grid_shape = terrain_data.metadata.get("grid_shape")
+        tri = None
+        if (
+            grid_shape is not None
+            and min(grid_shape) >= 2
+            and grid_shape[0] * grid_shape[1] == terrain_data.num_points
+        ):
+            triangles = TerrainEngine.grid_triangles(*grid_shape)
+        else:
+            tri = Delaunay(points[:, :2])  # Project to 2D for Delaunay
+            triangles = tri.simplices.copy()
 
-        # Create mesh with original 3D coordinates
+        # Create mesh with original 3D coordinates; vertices are row-major
+        # since mesh operations gather whole vertices by index
         mesh = TerrainMesh(
-            vertices=points.copy(),
-            triangles=tri.simplices.copy(),
+            vertices=np.array(points, dtype=np.float64, order="C"),
+            triangles=triangles,
             source_data=terrain_data,
         )
 
-        # Compute normals
-        mesh.compute_face_normals()
-        mesh.compute_vertex_normals()
+        # Keep the triangulation so interpolators don't have to rerun qhull;
+        # grids keep their axes so elevations come from their own cells
+        if tri is not None:
+            mesh._delaunay = (mesh.vertices, tri)
+        else:
+            nx = grid_shape[1]
+            mesh._grid_axes = (
+                mesh.vertices, mesh.vertices[:nx, 0].copy(), mesh.vertices[::nx, 1].copy()
+            )
+
+        # Compute normals. A level grid needs no arithmetic: its cells are
+        # counter-clockwise and non-degenerate, so every normal is +Z
+        z_min, z_max = mesh.bounds[2]
+        if tri is None and z_min == z_max:
+            mesh.face_normals = np.zeros((mesh.num_faces, 3), dtype=NORMAL_DTYPE)
+            mesh.face_normals[:, 2] = 1.0
+            mesh.vertex_normals = np.zeros((mesh.num_vertices, 3), dtype=NORMAL_DTYPE)
+            mesh.vertex_normals[:, 2] = 1.0
+        else:
+            mesh.compute_face_normals()
+            mesh.compute_vertex_normals()
 
         return mesh
 
     @staticmethod
-    def analyze_slope(mesh: TerrainMesh) -> SlopeMap:
+    def grid_triangles(ny: int, nx: int) -> np.ndarray:
+        """Triangulate a regular grid of points stored row by row.
+
+        Point ``i * nx + j`` is row ``i`` (y), column ``j`` (x). Each cell is
+        split along its rising diagonal into two triangles that are
+        counter-clockwise seen from above, so their normals point up.
+
+        Args:
+            ny: Number of grid rows
+            nx: Number of grid columns
+
+        Returns:
+            (2 * (ny - 1) * (nx - 1), 3) int32 vertex indices
+        """
+        corner = (np.arange(ny - 1)[:, None] * nx + np.arange(nx - 1)).ravel()
+        triangles = np.empty((2 * len(corner), 3), dtype=np.int32)
+        triangles[0::2, 0] = corner
+        triangles[0::2, 1] = corner + 1
+        triangles[0::2, 2] = corner + nx + 1
+        triangles[1::2, 0] = corner
+        triangles[1::2, 1] = corner + nx + 1
+        triangles[1::2, 2] = corner + nx
+        return triangles
+
+    @staticmethod
+    def analyze_slope(mesh: TerrainMesh, dtype: np.dtype = np.float32) -> SlopeMap:
         """Analyze slope and aspect for terrain mesh.
 
         Args:
             mesh: Input terrain mesh
+            dtype: Working and output dtype; the default float32 matches the
+                stored face normals and halves memory traffic
 
         Returns:
             SlopeMap with slope/aspect data for each face
@@ -70,21 +216,10 @@ class TerrainEngine:
         # Compute face normals if not already done
         normals = mesh.compute_face_normals()
 
-        # Slope is the angle from horizontal (Z-axis is up)
-        # Normal vector is [nx, ny, nz], vertical is [0, 0, 1]
-        # Slope angle = arccos(|nz|)
-        nz = normals[:, 2]
-        slope_rad = np.arccos(np.clip(np.abs(nz), 0, 1))
-        slope_deg = np.degrees(slope_rad)
-
-        # Aspect is the compass direction of the slope
-        # Calculated from normal's horizontal component [nx, ny]
+        # Slope = arccos(|nz|) from horizontal (Z-axis is up); aspect is the
+        # compass direction of the normal's horizontal component
         # 0° = North (+Y), 90° = East (+X), 180° = South (-Y), 270° = West (-X)
-        nx = normals[:, 0]
-        ny = normals[:, 1]
-        aspect_rad = np.arctan2(nx, ny)  # arctan2(x, y) for compass bearing
-        aspect_deg = np.degrees(aspect_rad)
-        aspect_deg = (aspect_deg + 360) % 360  # Normalize to 0-360
+        slope_deg, aspect_deg = slope_aspect(normals, dtype=dtype)
 
         return SlopeMap(
             mesh=mesh,
@@ -123,22 +258,15 @@ class TerrainEngine:
             [0, -delta],  # -y
         ])
         
-        # Create batch of all query points (n_points * 5: center + 4 neighbors)
-        all_queries = np.vstack([
-            query_points,  # Center points
-            *(query_points + offset for offset in offsets)  # Offset points
-        ])
+        # Create batch of the 4 neighbor sets (n_points * 4); the center
+        # elevation is not needed for a central-difference gradient
+        all_queries = np.vstack([query_points + offset for offset in offsets])
         
         # Single batched interpolation call
         z_values = TerrainEngine.interpolate_elevation(mesh, all_queries)
         
-        # Reshape: [center_z, xp_z, xn_z, yp_z, yn_z] for each point
-        n_total = n_points
-        z_center = z_values[:n_total]
-        z_xp = z_values[n_total:2*n_total]
-        z_xn = z_values[2*n_total:3*n_total]
-        z_yp = z_values[3*n_total:4*n_total]
-        z_yn = z_values[4*n_total:]
+        # Reshape: [xp_z, xn_z, yp_z, yn_z] for each point
+        z_xp, z_xn, z_yp, z_yn = z_values.reshape(4, n_points)
         
         # Calculate gradients
         dx = (z_xp - z_xn) / (2 * delta)
@@ -166,44 +294,108 @@ class TerrainEngine:
         Returns:
             Array of interpolated z-values (elevations)
         """
-        # Use cached interpolator if available
+        # Regular grid meshes are interpolated on their own cell triangles;
+        # qhull would split the cells along other diagonals
+        grid = getattr(mesh, "_grid_axes", None)
+        if method == "linear" and grid is not None and grid[0] is mesh.vertices:
+            return TerrainEngine._interpolate_grid(mesh, grid[1], grid[2], query_points)
+
+        # Use cached interpolator if available (invalidated if vertices are replaced)
         cache_key = f"_interpolator_{method}"
-        if hasattr(mesh, cache_key):
-            interpolator = getattr(mesh, cache_key)
+        cached = getattr(mesh, cache_key, None)
+        if cached is not None and cached[0] is mesh.vertices:
+            interpolator = cached[1]
         else:
-            # Extract x, y, z from mesh vertices
-            x = mesh.vertices[:, 0]
-            y = mesh.vertices[:, 1]
+            # Reuse the mesh's Delaunay triangulation when it matches the current
+            # vertices; otherwise pass a contiguous (N, 2) XY array to qhull
+            delaunay = getattr(mesh, "_delaunay", None)
+            if delaunay is not None and delaunay[0] is mesh.vertices:
+                xy = delaunay[1]
+            else:
+                xy = np.ascontiguousarray(mesh.vertices[:, :2])
             z = mesh.vertices[:, 2]
 
             # Create interpolator and cache it
             if method == "linear":
-                interpolator = LinearNDInterpolator(
-                    list(zip(x, y)), z, fill_value=np.nan
-                )
+                interpolator = LinearNDInterpolator(xy, z, fill_value=np.nan)
             elif method == "cubic":
-                interpolator = CloughTocher2DInterpolator(
-                    list(zip(x, y)), z, fill_value=np.nan
-                )
+                interpolator = CloughTocher2DInterpolator(xy, z, fill_value=np.nan)
             else:
                 raise ValueError(f"Unknown interpolation method: {method}")
             
             # Cache interpolator on mesh object for reuse
-            setattr(mesh, cache_key, interpolator)
+            setattr(mesh, cache_key, (mesh.vertices, interpolator))
 
         # Interpolate
         if query_points.ndim == 1:
             # Single point [x, y]
             return float(interpolator(query_points[0], query_points[1]))
         else:
-            # Multiple points Nx2
-            return interpolator(query_points[:, 0], query_points[:, 1])
+            # Multiple points Nx2, passed as one array so scipy doesn't
+            # re-stack separate x/y columns into a new buffer
+            return interpolator(np.ascontiguousarray(query_points, dtype=np.float64))
+
+    @staticmethod
+    def _interpolate_grid(
+        mesh: TerrainMesh, x: np.ndarray, y: np.ndarray, query_points: np.ndarray
+    ) -> np.ndarray:
+        """Linear elevation on a regular grid mesh built by grid_triangles.
+
+        Each query is located in its cell by binary search on the grid axes
+        and evaluated on the cell triangle it falls in, so the result is the
+        surface the mesh faces describe. Points off the grid are NaN.
+        """
+        single = query_points.ndim == 1
+        q = np.atleast_2d(np.asarray(query_points, dtype=np.float64))
+        qx, qy = q[:, 0], q[:, 1]
+        z = mesh.vertices[:, 2].reshape(len(y), len(x))
+
+        j = np.clip(np.searchsorted(x, qx, side="right") - 1, 0, len(x) - 2)
+        i = np.clip(np.searchsorted(y, qy, side="right") - 1, 0, len(y) - 2)
+        u = (qx - x[j]) / (x[j + 1] - x[j])
+        v = (qy - y[i]) / (y[i + 1] - y[i])
+
+        # Corners (row, column): 00 = (i, j), 01 = (i, j+1), 10 = (i+1, j).
+        # Below the rising diagonal is triangle (00, 01, 11), above it
+        # (00, 11, 10)
+        z00 = z[i, j]
+        z01 = z[i, j + 1]
+        z10 = z[i + 1, j]
+        z11 = z[i + 1, j + 1]
+        result = np.where(
+            v <= u,
+            z00 + u * (z01 - z00) + v * (z11 - z01),
+            z00 + v * (z10 - z00) + u * (z11 - z10),
+        )
+        result[(qx < x[0]) | (qx > x[-1]) | (qy < y[0]) | (qy > y[-1])] = np.nan
+        return float(result[0]) if single else result
+
+    @staticmethod
+    def get_grid_index(mesh: TerrainMesh) -> TriangleGridIndex:
+        """Get the triangle grid index for a mesh, building and caching it on first use.
+
+        The index is rebuilt once ``vertices`` or ``triangles`` is replaced.
+
+        Args:
+            mesh: Terrain mesh
+
+        Returns:
+            TriangleGridIndex for single-point elevation lookups
+        """
+        cached = getattr(mesh, "_grid_index", None)
+        if cached is not None and cached[0] is mesh.vertices and cached[1] is mesh.triangles:
+            return cached[2]
+
+        index = TriangleGridIndex(mesh)
+        mesh._grid_index = (mesh.vertices, mesh.triangles, index)
+        return index
 
     @staticmethod
     def generate_grid_elevations(
         mesh: TerrainMesh,
         grid_size: int = 50,
         bounds: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None,
+        dtype: np.dtype = np.float64,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Generate regular grid of elevations for visualization.
 
@@ -211,11 +403,27 @@ class TerrainEngine:
             mesh: Terrain mesh
             grid_size: Number of grid points in each direction
             bounds: Optional ((x_min, x_max), (y_min, y_max)), defaults to mesh bounds
+            dtype: dtype of z_grid; float32 halves the memory streamed by
+                visualization kernels such as contouring
 
         Returns:
             Tuple of (x_grid, y_grid, z_grid) where x_grid and y_grid are 1D arrays
-            and z_grid is a 2D grid of elevations
+            and z_grid is a 2D grid of elevations. Results are cached on the mesh
+            per (grid_size, bounds) and returned read-only.
         """
+        # Reuse a previous grid if the mesh vertices haven't been replaced
+        key = (
+            grid_size,
+            None if bounds is None else tuple(tuple(b) for b in bounds),
+            np.dtype(dtype).str,
+        )
+        cache = getattr(mesh, "_grid_cache", None)
+        if cache is None or cache[0] is not mesh.vertices:
+            cache = (mesh.vertices, {})
+            mesh._grid_cache = cache
+        if key in cache[1]:
+            return cache[1][key]
+
         # Determine bounds
         if bounds is None:
             mesh_bounds = mesh.bounds
@@ -236,7 +444,11 @@ class TerrainEngine:
         z_flat = TerrainEngine.interpolate_elevation(mesh, query_points)
 
         # Reshape to grid
-        z_grid = z_flat.reshape(grid_size, grid_size)
+        z_grid = z_flat.astype(dtype, copy=False).reshape(grid_size, grid_size)
+
+        for arr in (x, y, z_grid):
+            arr.flags.writeable = False
+        cache[1][key] = (x, y, z_grid)
 
         return x, y, z_grid
 
@@ -258,9 +470,8 @@ class TerrainEngine:
         Returns:
             ContourSet with contour lines
         """
-        # Determine elevation range
-        z_min = mesh.vertices[:, 2].min()
-        z_max = mesh.vertices[:, 2].max()
+        # Determine elevation range (from the mesh's cached bounds)
+        z_min, z_max = mesh.bounds[2]
 
         if min_elevation is None:
             min_elevation = z_min
@@ -274,53 +485,54 @@ class TerrainEngine:
             interval,
         )
 
-        # Generate grid for contouring
+        # Generate grid for contouring (float32 is ample for visualization)
         grid_size = 100
-        x, y, z_grid = TerrainEngine.generate_grid_elevations(mesh, grid_size)
+        x, y, z_grid = TerrainEngine.generate_grid_elevations(
+            mesh, grid_size, dtype=np.float32
+        )
 
         # Extract contours using marching squares algorithm
-        # (simplified implementation - for production, use matplotlib.pyplot.contour)
-        contours = []
-
-        try:
-            import matplotlib.pyplot as plt
-            from matplotlib.path import Path
-
-            # Use matplotlib to generate contours
-            fig, ax = plt.subplots()
-            cs = ax.contour(x, y, z_grid, levels=levels)
-            plt.close(fig)
-
-            # Extract paths
-            for level, collection in zip(levels, cs.collections):
-                for path in collection.get_paths():
-                    vertices = path.vertices
-                    if len(vertices) > 1:
-                        contour = ContourLine(
-                            elevation=level,
-                            points=vertices,
-                            is_closed=path.codes is not None and path.codes[0] == Path.MOVETO,
-                        )
-                        contours.append(contour)
-
-        except ImportError:
-            # Fallback: Simple contour extraction without matplotlib
-            # This is a simplified version - just extracts approximate contours
-            for level in levels:
-                # Find edges that cross this elevation
-                contour_points = []
-                # ... simplified contour extraction logic ...
-                if contour_points:
-                    contours.append(
-                        ContourLine(
-                            elevation=level,
-                            points=np.array(contour_points),
-                            is_closed=False,
-                        )
-                    )
+        if _contour_kernel.NUMBA_AVAILABLE:
+            # Compiled kernel, parallel over levels
+            contours = TerrainEngine._march_contours(x, y, z_grid, levels)
+        else:
+            contours = []
+            try:
+                from contourpy import contour_generator
+
+                # matplotlib's contouring library, without creating a Figure
+                generator = contour_generator(x=x, y=y, z=z_grid, name="serial")
+                for level in levels:
+                    for line in generator.lines(level):
+                        if len(line) > 1:
+                            contours.append(
+                                ContourLine(
+                                    elevation=level,
+                                    points=line,
+                                    is_closed=bool(np.allclose(line[0], line[-1])),
+                                )
+                            )
+
+            except ImportError:
+                # Fallback: run the marching-squares kernel as plain Python
+                contours = TerrainEngine._march_contours(x, y, z_grid, levels)
 
         return ContourSet(contours=contours, interval=interval, mesh=mesh)
 
+    @staticmethod
+    def _march_contours(
+        x: np.ndarray,
+        y: np.ndarray,
+        z_grid: np.ndarray,
+        levels: np.ndarray,
+    ) -> List[ContourLine]:
+        """Run the marching-squares kernel and wrap its polylines as ContourLines."""
+        return [
+            ContourLine(elevation=level, points=points, is_closed=closed)
+            for level, points, closed in _contour_kernel.march_contours(x, y, z_grid, levels)
+            if len(points) > 1
+        ]
+
     @staticmethod
     def create_regular_grid_terrain(
         x_extent: float,
@@ -333,7 +545,8 @@ class TerrainEngine:
         Args:
             x_extent: Width in mm
             y_extent: Depth in mm
-            grid_spacing: Distance between grid points in mm
+            grid_spacing: Distance between grid points in mm (rounded so the
+                grid spans each extent exactly)
             elevation_function: Function(x, y) -> z, defaults to flat at z=0
 
         Returns:
@@ -341,26 +554,35 @@ class TerrainEngine:
         """
         from freepvc.models.terrain import TerrainSource
 
-        if elevation_function is None:
-            elevation_function = lambda x, y: 0.0
-
-        # Generate grid
-        x = np.arange(0, x_extent + grid_spacing / 2, grid_spacing)
-        y = np.arange(0, y_extent + grid_spacing / 2, grid_spacing)
+        # Generate grid with an exact, predictable number of samples
+        nx = int(round(x_extent / grid_spacing)) + 1
+        ny = int(round(y_extent / grid_spacing)) + 1
+        x = np.linspace(0.0, x_extent, nx)
+        y = np.linspace(0.0, y_extent, ny)
         xx, yy = np.meshgrid(x, y)
 
-        # Compute elevations
-        zz = np.zeros_like(xx)
-        for i in range(xx.shape[0]):
-            for j in range(xx.shape[1]):
-                zz[i, j] = elevation_function(xx[i, j], yy[i, j])
+        # Compute elevations: flat terrain needs no function calls; otherwise
+        # call once on the whole grid, falling back to per-point evaluation
+        # for scalar-only functions and for results that are not one value
+        # per grid point (e.g. a scalar from a function ignoring its inputs)
+        zz = None
+        if elevation_function is None:
+            zz = np.zeros_like(xx)
+        else:
+            try:
+                zz = np.asarray(elevation_function(xx, yy), dtype=np.float64)
+            except Exception:
+                pass
+            if zz is None or zz.shape != xx.shape:
+                zz = np.vectorize(elevation_function, otypes=[np.float64])(xx, yy)
 
-        # Flatten to point cloud
-        points = np.column_stack([xx.ravel(), yy.ravel(), zz.ravel()])
+        # Flatten to a column-major point cloud
+        points = np.stack([xx.ravel(), yy.ravel(), zz.ravel()]).T
 
         return TerrainData(
             points=points,
             source=TerrainSource.DEM_ASCII,
+            metadata={"grid_shape": (ny, nx)},
         )
 
     @staticmethod
@@ -385,31 +607,10 @@ class TerrainEngine:
         if original_mesh.num_faces != graded_mesh.num_faces:
             raise ValueError("Meshes must have the same triangulation for cut/fill calculation")
 
-        cut_volume = 0.0
-        fill_volume = 0.0
-
-        for i in range(original_mesh.num_faces):
-            # Get triangle vertices for both surfaces
-            orig_tri = original_mesh.vertices[original_mesh.triangles[i]]
-            grad_tri = graded_mesh.vertices[graded_mesh.triangles[i]]
-
-            # Compute area of triangle (same for both)
-            v1 = orig_tri[1] - orig_tri[0]
-            v2 = orig_tri[2] - orig_tri[0]
-            area = 0.5 * np.linalg.norm(np.cross(v1, v2))
-
-            # Average elevation difference
-            orig_z = orig_tri[:, 2].mean()
-            grad_z = grad_tri[:, 2].mean()
-            z_diff = grad_z - orig_z
-
-            # Volume = area * height
-            volume = area * z_diff
-
-            if volume > 0:
-                fill_volume += volume
-            else:
-                cut_volume += abs(volume)
+        # Only the graded surface's elevations are needed: gather its z column
+        # alone instead of full (M, 3, 3) triangle coordinates
+        grad_z = graded_mesh.vertices[:, 2][graded_mesh.triangles]
+        cut_volume, fill_volume = cut_fill(original_mesh.tri_verts, grad_z)
 
         net_volume = fill_volume - cut_volume
 
@@ -0,0 +1,217 @@
+"""Parallel CSV tokenizer for large point-cloud files.
+
+The file is memory-mapped and parsed in two parallel passes: the first finds
+the start of every line (chunks count newlines, then fill a preallocated
+offset array), the second parses the requested columns of each line straight
+from the bytes. Plain decimal and exponent numbers with up to 15 significant
+digits are converted exactly (one multiply or divide by an exact power of
+ten, as in Clinger's fast path); anything else is handed back to Python's
+``float`` so results always match the csv/pandas readers.
+
+Only used when Numba is installed; the kernels are too slow to be useful as
+plain Python, though they give the same results. Bytes are widened with
+int() before digit arithmetic so that plain Python does not wrap around
+in uint8.
+"""
+
+import csv
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+from freepvc.engines._numba_compat import njit, prange
+
+# Bytes of input scanned per task in the newline pass
+CHUNK_BYTES = 1 << 20
+
+# Per-line parse status
+_OK = 0
+_BLANK = 1
+_SHORT = 2
+_SLOW = 3
+
+# Powers of ten that are exact in float64
+_POW10 = np.array([10.0 ** k for k in range(23)])
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _line_starts(buf, chunk):
+    """Byte offset of the start of every line in ``buf``."""
+    n = buf.shape[0]
+    n_chunks = (n + chunk - 1) // chunk
+
+    counts = np.zeros(n_chunks + 1, dtype=np.int64)
+    for c in prange(n_chunks):
+        k = 0
+        for p in range(c * chunk, min((c + 1) * chunk, n)):
+            if buf[p] == 10:
+                k += 1
+        counts[c + 1] = k
+    for c in range(n_chunks):
+        counts[c + 1] += counts[c]
+
+    starts = np.empty(counts[n_chunks] + 1, dtype=np.int64)
+    starts[0] = 0
+    for c in prange(n_chunks):
+        k = counts[c] + 1
+        for p in range(c * chunk, min((c + 1) * chunk, n)):
+            if buf[p] == 10:
+                starts[k] = p + 1
+                k += 1
+    return starts
+
+
+@njit(nogil=True, cache=True)
+def _parse_float(buf, p, q):
+    """Parse buf[p:q] as a float; returns (value, ok).
+
+    ``ok`` is False for anything outside the exact fast path, including
+    malformed fields, which the caller re-parses in Python.
+    """
+    while p < q and (buf[p] == 32 or buf[p] == 9):
+        p += 1
+    while q > p and (buf[q - 1] == 32 or buf[q - 1] == 9):
+        q -= 1
+    if p == q:
+        return 0.0, False
+
+    neg = False
+    if buf[p] == 45:
+        neg = True
+        p += 1
+    elif buf[p] == 43:
+        p += 1
+
+    mant = 0
+    digits = 0
+    exp10 = 0
+    seen_digit = False
+    while p < q and 48 <= buf[p] <= 57:
+        d = int(buf[p]) - 48
+        if mant != 0 or d != 0:
+            digits += 1
+        mant = mant * 10 + d if digits <= 18 else mant
+        seen_digit = True
+        p += 1
+    if p < q and buf[p] == 46:
+        p += 1
+        while p < q and 48 <= buf[p] <= 57:
+            d = int(buf[p]) - 48
+            if mant != 0 or d != 0:
+                digits += 1
+            if digits <= 18:
+                mant = mant * 10 + d
+                exp10 -= 1
+            seen_digit = True
+            p += 1
+    if not seen_digit or digits > 18:
+        return 0.0, False
+
+    if p < q and (buf[p] == 101 or buf[p] == 69):
+        p += 1
+        exp_neg = False
+        if p < q and (buf[p] == 45 or buf[p] == 43):
+            exp_neg = buf[p] == 45
+            p += 1
+        if p == q:
+            return 0.0, False
+        e = 0
+        while p < q and 48 <= buf[p] <= 57:
+            if e < 100000:
+                e = e * 10 + (int(buf[p]) - 48)
+            p += 1
+        exp10 += -e if exp_neg else e
+    if p != q:
+        return 0.0, False
+
+    if mant == 0:
+        return -0.0 if neg else 0.0, True
+    if mant >= 9007199254740992 or exp10 < -22 or exp10 > 22:
+        return 0.0, False
+    v = float(mant)
+    v = v * _POW10[exp10] if exp10 >= 0 else v / _POW10[-exp10]
+    return -v if neg else v, True
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _parse_lines(buf, starts, delim, cols, out, status):
+    """Parse columns ``cols`` of every line into out[:, line], setting status."""
+    n = buf.shape[0]
+    n_lines = starts.shape[0]
+    max_col = cols.max()
+    for i in prange(n_lines):
+        s = starts[i]
+        e = starts[i + 1] - 1 if i + 1 < n_lines else n
+        if e > s and buf[e - 1] == 13:
+            e -= 1
+        if s == e:
+            status[i] = _BLANK
+            continue
+
+        st = _OK
+        field = 0
+        p = s
+        while p <= e and field <= max_col:
+            q = p
+            while q < e and buf[q] != delim:
+                q += 1
+            for k in range(cols.shape[0]):
+                if cols[k] == field:
+                    v, ok = _parse_float(buf, p, q)
+                    if not ok:
+                        st = _SLOW
+                    out[k, i] = v
+            field += 1
+            p = q + 1
+        if st == _OK and field <= max_col:
+            st = _SHORT
+        status[i] = st
+
+
+def parse_csv_columns(
+    file_path: Path,
+    columns: Tuple[int, int, int],
+    skip_header: int = 0,
+    delimiter: str = ",",
+) -> np.ndarray:
+    """Parse three numeric columns of a delimited file in parallel.
+
+    Blank lines are skipped, as the pandas and NumPy readers do.
+
+    Args:
+        file_path: Path to the file
+        columns: Column indices to return, in (x, y, z) order
+        skip_header: Number of leading lines to skip
+        delimiter: Single-byte field delimiter
+
+    Returns:
+        Column-major (N, 3) float64 array
+
+    Raises:
+        ValueError: If any row is short or has a non-numeric value
+    """
+    buf = np.asarray(np.memmap(file_path, dtype=np.uint8, mode="r"))
+    starts = _line_starts(buf, CHUNK_BYTES)[skip_header:]
+
+    cols = np.array(columns, dtype=np.int64)
+    out = np.empty((3, len(starts)))
+    status = np.empty(len(starts), dtype=np.uint8)
+    _parse_lines(buf, starts, ord(delimiter), cols, out, status)
+
+    if (status == _SHORT).any():
+        raise ValueError("short row")
+
+    # Rows outside the fast path: quoted fields, nan/inf, long mantissas
+    for i in np.flatnonzero(status == _SLOW).tolist():
+        end = starts[i + 1] - 1 if i + 1 < len(starts) else len(buf)
+        line = bytes(buf[starts[i]:end]).decode().rstrip("\r")
+        row = next(csv.reader([line], delimiter=delimiter))
+        try:
+            out[:, i] = [float(row[c]) for c in columns]
+        except IndexError as e:
+            raise ValueError(str(e))
+
+    if (status == _BLANK).any():
+        out = np.ascontiguousarray(out[:, status != _BLANK])
+    return out.T
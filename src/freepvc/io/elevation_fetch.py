@@ -5,12 +5,35 @@ from various free and commercial elevation APIs.
 """
 
 import asyncio
+import json
 import aiohttp
 import numpy as np
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
 
+# WGS84 ellipsoid parameters
+_WGS84_A = 6378137.0
+_WGS84_E2 = 6.69437999014e-3
+
+
+def _metres_per_degree(latitude: float) -> Tuple[float, float]:
+    """Metres per degree of latitude and longitude at the given latitude.
+
+    Uses the WGS84 meridian and prime-vertical radii of curvature, i.e. a
+    local east-north tangent plane at ``latitude``.
+    """
+    phi = np.radians(latitude)
+    sin_phi = np.sin(phi)
+    w2 = 1.0 - _WGS84_E2 * sin_phi * sin_phi
+    meridian = _WGS84_A * (1.0 - _WGS84_E2) / w2 ** 1.5
+    prime_vertical = _WGS84_A / np.sqrt(w2)
+    return (
+        float(np.radians(meridian)),
+        float(np.radians(prime_vertical * np.cos(phi))),
+    )
+
+
 @dataclass
 class ElevationPoint:
     """Single elevation data point."""
@@ -26,16 +49,53 @@ class ElevationFetcher:
     async def fetch_open_elevation(
         latitudes: List[float],
         longitudes: List[float],
+        max_concurrency: int = 8,
     ) -> List[ElevationPoint]:
         """Fetch elevation data from Open-Elevation API (free, no API key).
         
+        Thin wrapper over fetch_open_elevation_arrays() for callers that
+        want ElevationPoint objects.
+        
         Args:
             latitudes: List of latitude coordinates
             longitudes: List of longitude coordinates
+            max_concurrency: Maximum number of batch requests in flight
             
         Returns:
             List of elevation points
             
+        Raises:
+            ValueError: If coordinate lists don't match in length
+            RuntimeError: If API request fails
+        """
+        lats, lons, elevations = await ElevationFetcher.fetch_open_elevation_arrays(
+            latitudes, longitudes, max_concurrency
+        )
+        return [
+            ElevationPoint(latitude=lat, longitude=lon, elevation_m=elev)
+            for lat, lon, elev in zip(lats.tolist(), lons.tolist(), elevations.tolist())
+        ]
+    
+    @staticmethod
+    async def fetch_open_elevation_arrays(
+        latitudes: List[float],
+        longitudes: List[float],
+        max_concurrency: int = 8,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fetch elevation data from Open-Elevation API as NumPy arrays.
+        
+        Batches are requested concurrently (bounded by ``max_concurrency``)
+        and returned in input order. Responses are parsed straight into
+        arrays without building per-point objects.
+        
+        Args:
+            latitudes: Latitude coordinates (list or array)
+            longitudes: Longitude coordinates (list or array)
+            max_concurrency: Maximum number of batch requests in flight
+            
+        Returns:
+            Tuple of (latitudes, longitudes, elevations_m) arrays
+            
         Raises:
             ValueError: If coordinate lists don't match in length
             RuntimeError: If API request fails
@@ -49,12 +109,11 @@ class ElevationFetcher:
         # Prepare locations payload
         locations = [
             {"latitude": lat, "longitude": lon}
-            for lat, lon in zip(latitudes, longitudes)
+            for lat, lon in zip(np.asarray(latitudes).tolist(), np.asarray(longitudes).tolist())
         ]
         
         # Batch requests in groups of 100 (API limit)
         batch_size = 100
-        all_results = []
         
         # Create all batch payloads
         batches = []
@@ -62,59 +121,62 @@ class ElevationFetcher:
             batch = locations[i:i + batch_size]
             batches.append({"locations": batch})
         
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
         async def fetch_batch(session, payload, batch_num, max_retries=3):
             """Fetch a single batch of elevation data with retry logic."""
-            for attempt in range(max_retries):
-                try:
-                    async with session.post(url, json=payload, timeout=30) as response:
-                        if response.status == 429:
-                            # Rate limited - wait with exponential backoff
-                            wait_time = (2 ** attempt) * 2  # 2s, 4s, 8s
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(wait_time)
-                                continue
-                            else:
-                                raise RuntimeError(f"Rate limited after {max_retries} retries")
+            async with semaphore:
+                for attempt in range(max_retries):
+                    try:
+                        async with session.post(url, json=payload, timeout=30) as response:
+                            if response.status == 429:
+                                # Rate limited - wait with exponential backoff
+                                wait_time = (2 ** attempt) * 2  # 2s, 4s, 8s
+                                if attempt < max_retries - 1:
+                                    await asyncio.sleep(wait_time)
+                                    continue
+                                else:
+                                    raise RuntimeError(f"Rate limited after {max_retries} retries")
                         
-                        if response.status != 200:
-                            raise RuntimeError(f"API request failed: {response.status}")
+                            if response.status != 200:
+                                raise RuntimeError(f"API request failed: {response.status}")
                         
-                        data = await response.json()
-                        results = data.get("results", [])
+                            raw = await response.read()
+                            results = json.loads(raw).get("results", [])
                         
-                        points = []
-                        for result in results:
-                            points.append(ElevationPoint(
-                                latitude=result["latitude"],
-                                longitude=result["longitude"],
-                                elevation_m=result["elevation"],
-                            ))
-                        return points
+                            return np.array(
+                                [(r["latitude"], r["longitude"], r["elevation"]) for r in results],
+                                dtype=np.float64,
+                            ).reshape(-1, 3)
                 
-                except asyncio.TimeoutError:
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep((2 ** attempt) * 2)  # 2s, 4s, 8s
-                        continue
-                    raise RuntimeError(f"Timeout fetching elevation data for batch {batch_num + 1}")
-                except RuntimeError:
-                    raise
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep((2 ** attempt) * 2)  # 2s, 4s, 8s
-                        continue
-                    raise RuntimeError(f"Error fetching batch {batch_num + 1}: {str(e)}")
+                    except asyncio.TimeoutError:
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep((2 ** attempt) * 2)  # 2s, 4s, 8s
+                            continue
+                        raise RuntimeError(f"Timeout fetching elevation data for batch {batch_num + 1}")
+                    except RuntimeError:
+                        raise
+                    except Exception as e:
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep((2 ** attempt) * 2)  # 2s, 4s, 8s
+                            continue
+                        raise RuntimeError(f"Error fetching batch {batch_num + 1}: {str(e)}")
         
-        # Process batches sequentially to avoid rate limiting
-        async with aiohttp.ClientSession() as session:
-            for i in range(0, len(batches)):
-                batch_results = await fetch_batch(session, batches[i], i, max_retries=3)
-                all_results.extend(batch_results)
-                
-                # Small delay between requests to avoid rate limiting (except after last batch)
-                if i < len(batches) - 1:
-                    await asyncio.sleep(0.5)  # Reduced from 3.0s to 0.5s
+        # Process batches concurrently over one pooled session; the semaphore
+        # bounds load on the API and 429s are retried with backoff
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            batch_results = await asyncio.gather(*[
+                fetch_batch(session, batch, i, max_retries=3)
+                for i, batch in enumerate(batches)
+            ])
         
-        return all_results
+        if not batch_results:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty.copy(), empty.copy()
+        
+        coords = np.concatenate(batch_results)
+        return coords[:, 0], coords[:, 1], coords[:, 2]
     
     @staticmethod
     def generate_grid_coordinates(
@@ -123,7 +185,7 @@ class ElevationFetcher:
         width_m: float,
         height_m: float,
         resolution_m: float = 10.0,
-    ) -> Tuple[List[float], List[float]]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Generate a grid of coordinates for terrain sampling.
         
         Args:
@@ -134,13 +196,12 @@ class ElevationFetcher:
             resolution_m: Sampling resolution in meters
             
         Returns:
-            Tuple of (latitudes, longitudes) lists
+            Tuple of flat (latitudes, longitudes) arrays
         """
-        # Approximate meters to degrees conversion
-        # 1 degree latitude ≈ 111,111 meters
-        # 1 degree longitude ≈ 111,111 * cos(latitude) meters
-        lat_deg_per_m = 1.0 / 111111.0
-        lon_deg_per_m = 1.0 / (111111.0 * np.cos(np.radians(center_lat)))
+        # Meters to degrees on the local tangent plane at the grid center
+        m_per_deg_lat, m_per_deg_lon = _metres_per_degree(center_lat)
+        lat_deg_per_m = 1.0 / m_per_deg_lat
+        lon_deg_per_m = 1.0 / m_per_deg_lon
         
         # Calculate grid bounds
         half_width = width_m / 2.0
@@ -161,11 +222,7 @@ class ElevationFetcher:
         # Create meshgrid
         lat_grid, lon_grid = np.meshgrid(lats, lons, indexing='ij')
         
-        # Flatten to lists
-        latitudes = lat_grid.flatten().tolist()
-        longitudes = lon_grid.flatten().tolist()
-        
-        return latitudes, longitudes
+        return lat_grid.ravel(), lon_grid.ravel()
     
     @staticmethod
     def convert_to_local_coordinates(
@@ -175,6 +232,8 @@ class ElevationFetcher:
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Convert lat/lon/elevation to local XYZ coordinates.
         
+        Thin wrapper over convert_arrays_to_local() for ElevationPoint lists.
+        
         Args:
             elevation_points: List of elevation points
             origin_lat: Origin latitude for local coordinate system
@@ -183,38 +242,49 @@ class ElevationFetcher:
         Returns:
             Tuple of (x, y, z) numpy arrays in millimeters
         """
-        # Conversion factors
-        lat_deg_per_m = 1.0 / 111111.0
-        lon_deg_per_m = 1.0 / (111111.0 * np.cos(np.radians(origin_lat)))
+        coords = np.array(
+            [(p.latitude, p.longitude, p.elevation_m) for p in elevation_points],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        return ElevationFetcher.convert_arrays_to_local(
+            coords[:, 0], coords[:, 1], coords[:, 2], origin_lat, origin_lon
+        )
+    
+    @staticmethod
+    def convert_arrays_to_local(
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        elevations_m: np.ndarray,
+        origin_lat: float,
+        origin_lon: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert lat/lon/elevation arrays to local XYZ coordinates.
         
-        # First pass: collect all elevations to find minimum
-        elevations = [point.elevation_m for point in elevation_points]
-        min_elevation = min(elevations)
+        Args:
+            latitudes: Latitudes (decimal degrees)
+            longitudes: Longitudes (decimal degrees)
+            elevations_m: Elevations in meters
+            origin_lat: Origin latitude for local coordinate system
+            origin_lon: Origin longitude for local coordinate system
+            
+        Returns:
+            Tuple of (x, y, z) numpy arrays in millimeters
+        """
+        # Millimeters per degree on the local tangent plane at the origin
+        m_per_deg_lat, m_per_deg_lon = _metres_per_degree(origin_lat)
+        mm_per_deg_lat = m_per_deg_lat * 1000.0
+        mm_per_deg_lon = m_per_deg_lon * 1000.0
         
-        x_coords = []
-        y_coords = []
-        z_coords = []
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        elevs = np.asarray(elevations_m, dtype=np.float64)
         
-        for point in elevation_points:
-            # Calculate offset from origin
-            delta_lat = point.latitude - origin_lat
-            delta_lon = point.longitude - origin_lon
-            
-            # Convert to meters
-            y_m = delta_lat / lat_deg_per_m
-            x_m = delta_lon / lon_deg_per_m
-            z_m = point.elevation_m - min_elevation  # Make relative to lowest point
-            
-            # Convert to millimeters (FreeCAD standard)
-            x_coords.append(x_m * 1000.0)
-            y_coords.append(y_m * 1000.0)
-            z_coords.append(z_m * 1000.0)
+        # Convert offsets from origin to millimeters (FreeCAD standard)
+        y = (lats - origin_lat) * mm_per_deg_lat
+        x = (lons - origin_lon) * mm_per_deg_lon
+        z = (elevs - elevs.min()) * 1000.0  # Relative to lowest point
         
-        return (
-            np.array(x_coords),
-            np.array(y_coords),
-            np.array(z_coords),
-        )
+        return x, y, z
 
 
 async def fetch_terrain_from_coordinates(
@@ -251,12 +321,14 @@ async def fetch_terrain_from_coordinates(
         center_lat, center_lon, width_m, height_m, resolution_m
     )
     
-    # Fetch elevation data
-    elevation_points = await fetcher.fetch_open_elevation(latitudes, longitudes)
+    # Fetch elevation data, kept as arrays end to end
+    lats, lons, elevations = await fetcher.fetch_open_elevation_arrays(
+        latitudes, longitudes
+    )
     
     # Convert to local coordinates
-    x, y, z = fetcher.convert_to_local_coordinates(
-        elevation_points, center_lat, center_lon
+    x, y, z = fetcher.convert_arrays_to_local(
+        lats, lons, elevations, center_lat, center_lon
     )
     
     return x, y, z
@@ -7,13 +7,29 @@ Supports:
 """
 
 import numpy as np
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 import csv
-
+import math
+from operator import itemgetter
+import re
+import warnings
+
+from freepvc.engines._numba_compat import NUMBA_AVAILABLE
+from freepvc.io._csv_kernel import parse_csv_columns
+from freepvc.io._terrain_kernels import dem_to_points
 from freepvc.models.terrain import TerrainData, TerrainSource
 
 
+# CSV files at least this large are parsed with the parallel Numba tokenizer
+CSV_KERNEL_MIN_BYTES = 8 << 20
+
+# ncols/nrows key at the start of a line of an ESRI ASCII grid header
+_DEM_HEADER_RE = re.compile(rb"^\s*(?:ncols|nrows)\b", re.IGNORECASE | re.MULTILINE)
+
+
 class TerrainImporter:
     """Import terrain data from various file formats."""
 
@@ -49,7 +65,116 @@ class TerrainImporter:
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-        points = []
+        columns = (x_col, y_col, z_col)
+        try:
+            points_array = TerrainImporter._read_columns(
+                file_path, columns, skip_header, delimiter
+            )
+        except ValueError:
+            # Re-parse row by row to report which row is malformed
+            points_array = TerrainImporter._parse_csv_rows(
+                file_path, columns, skip_header, delimiter
+            )
+
+        if len(points_array) == 0:
+            raise ValueError(f"No valid points found in {file_path}")
+
+        np.multiply(points_array, unit_scale, out=points_array)
+
+        return TerrainData(
+            points=points_array,
+            source=TerrainSource.CSV_POINTS,
+            source_file=str(file_path),
+            metadata={
+                "num_points_imported": len(points_array),
+                "x_col": x_col,
+                "y_col": y_col,
+                "z_col": z_col,
+                "unit_scale": unit_scale,
+            },
+        )
+
+    @staticmethod
+    def _read_columns(
+        file_path: Path,
+        columns: Tuple[int, int, int],
+        skip_header: int = 0,
+        delimiter: Optional[str] = ",",
+        comment: Optional[str] = None,
+    ) -> np.ndarray:
+        """Bulk-parse three numeric columns of a text file into a column-major (N, 3) array.
+
+        Large comment-free delimited files are parsed with the parallel Numba
+        tokenizer when Numba is installed. Otherwise pandas' C parser is used
+        when pandas is installed, np.loadtxt when it is not.
+
+        Args:
+            file_path: Path to the text file
+            columns: Column indices to return, in (x, y, z) order
+            skip_header: Number of leading rows to skip
+            delimiter: Field delimiter, None for any run of whitespace
+            comment: Character starting a comment line, None for no comments
+
+        Raises:
+            ValueError: If any row is short or has a non-numeric value
+        """
+        if (
+            NUMBA_AVAILABLE
+            and delimiter is not None
+            and len(delimiter) == 1
+            and delimiter.isascii()
+            and comment is None
+            and file_path.stat().st_size >= CSV_KERNEL_MIN_BYTES
+        ):
+            return parse_csv_columns(file_path, columns, skip_header, delimiter)
+
+        try:
+            import pandas as pd
+        except ImportError:
+            return np.asfortranarray(np.loadtxt(
+                file_path,
+                delimiter=delimiter,
+                comments=comment,
+                skiprows=skip_header,
+                usecols=columns,
+                dtype=np.float64,
+                ndmin=2,
+            ))
+
+        usecols = sorted(set(columns))
+        df = pd.read_csv(
+            file_path,
+            sep=r"\s+" if delimiter is None else delimiter,
+            comment=comment,
+            header=None,
+            skiprows=skip_header,
+            usecols=usecols,
+            dtype=np.float64,
+            engine="c",
+            memory_map=True,
+        )
+        # Copy each column into a column-major (N, 3) array in (x, y, z) order
+        points_array = np.empty((len(df), 3), order="F")
+        for k, col in enumerate(columns):
+            points_array[:, k] = df[col].to_numpy()
+        if np.isnan(points_array).any():
+            raise ValueError("missing values")
+        return points_array
+
+    @staticmethod
+    def _parse_csv_rows(
+        file_path: Path,
+        columns: Tuple[int, int, int],
+        skip_header: int,
+        delimiter: str,
+    ) -> np.ndarray:
+        """Row-by-row CSV parse that reports the first malformed row.
+
+        Raises:
+            ValueError: With the row number of the first row that fails to parse
+        """
+        get_xyz = itemgetter(*columns)
+        points = array("d")
 
         with open(file_path, "r") as f:
             reader = csv.reader(f, delimiter=delimiter)
@@ -61,34 +186,15 @@ class TerrainImporter:
             # Read data rows
             for row_num, row in enumerate(reader, start=skip_header + 1):
                 try:
-                    # Extract coordinates
-                    x = float(row[x_col]) * unit_scale
-                    y = float(row[y_col]) * unit_scale
-                    z = float(row[z_col]) * unit_scale
-                    points.append([x, y, z])
+                    x, y, z = map(float, get_xyz(row))
+                    points.extend((x, y, z))
 
                 except (IndexError, ValueError) as e:
                     raise ValueError(
                         f"Error parsing row {row_num} in {file_path}: {e}"
                     )
 
-        if not points:
-            raise ValueError(f"No valid points found in {file_path}")
-
-        points_array = np.array(points, dtype=np.float64)
-
-        return TerrainData(
-            points=points_array,
-            source=TerrainSource.CSV_POINTS,
-            source_file=str(file_path),
-            metadata={
-                "num_points_imported": len(points),
-                "x_col": x_col,
-                "y_col": y_col,
-                "z_col": z_col,
-                "unit_scale": unit_scale,
-            },
-        )
+        return np.frombuffer(points, dtype=np.float64).reshape(-1, 3)
 
     @staticmethod
     def import_dem_ascii(
@@ -123,83 +229,77 @@ class TerrainImporter:
         if not file_path.exists():
             raise FileNotFoundError(f"DEM file not found: {file_path}")
 
-        # Read header
+        # One binary handle for the whole file: header lines are split as
+        # bytes, then the grid body is parsed by NumPy's C text parser
+        # straight from the handle without building Python strings
         header = {}
-        with open(file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line[0].isdigit() and line[0] != "-":
-                    # Header line
-                    parts = line.split()
-                    if len(parts) == 2:
-                        key = parts[0].lower()
-                        try:
-                            value = float(parts[1])
-                        except ValueError:
-                            value = parts[1]
-                        header[key] = value
-                else:
-                    # Start of data
-                    break
-
-        # Validate required headers
-        required = ["ncols", "nrows", "xllcorner", "yllcorner", "cellsize"]
-        for key in required:
-            if key not in header:
-                raise ValueError(f"Missing required header: {key}")
-
-        ncols = int(header["ncols"])
-        nrows = int(header["nrows"])
+        with open(file_path, "rb") as f:
+            while True:
+                data_start = f.tell()
+                parts = f.readline().split()
+                if not parts:
+                    if f.tell() == data_start:
+                        break  # End of file
+                    continue  # Blank line
+                try:
+                    float(parts[0])
+                    break  # First grid value: start of data
+                except ValueError:
+                    pass
+
+                # Header line: "<key> <value>"
+                if len(parts) == 2:
+                    key = parts[0].decode("ascii", errors="replace").lower()
+                    try:
+                        value = float(parts[1])
+                    except ValueError:
+                        value = parts[1].decode("ascii", errors="replace")
+                    header[key] = value
+
+            # Validate required headers
+            required = ["ncols", "nrows", "xllcorner", "yllcorner", "cellsize"]
+            for key in required:
+                if key not in header:
+                    raise ValueError(f"Missing required header: {key}")
+
+            ncols = int(header["ncols"])
+            nrows = int(header["nrows"])
+
+            # Read grid data in one bulk parse into an array sized from the
+            # header. Older NumPy only warns on an unparseable token, so
+            # promote that warning to an error too
+            f.seek(data_start)
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", DeprecationWarning)
+                    values = np.fromfile(f, dtype=np.float64, count=nrows * ncols, sep=" ")
+            except (ValueError, DeprecationWarning) as e:
+                raise ValueError(f"Malformed grid data in {file_path}: {e}")
+            num_values = len(values) + len(f.read().split())
+
         xllcorner = float(header["xllcorner"]) * unit_scale
         yllcorner = float(header["yllcorner"]) * unit_scale
         cellsize = float(header["cellsize"]) * unit_scale
         nodata = float(header.get("nodata_value", -9999))
 
-        # Read grid data
-        grid_data = []
-        with open(file_path, "r") as f:
-            # Skip header lines
-            for _ in range(len(header)):
-                next(f)
-
-            # Read grid rows
-            for line in f:
-                line = line.strip()
-                if line:
-                    row = [float(x) for x in line.split()]
-                    grid_data.append(row)
-
-        if len(grid_data) != nrows:
+        if num_values != nrows * ncols:
             raise ValueError(
-                f"Expected {nrows} rows, got {len(grid_data)}"
+                f"Expected {nrows} x {ncols} = {nrows * ncols} grid values, "
+                f"got {num_values} in {file_path}"
             )
+        grid = values.reshape(nrows, ncols)
 
-        # Convert grid to point cloud
-        points = []
-        for row_idx, row in enumerate(grid_data):
-            if len(row) != ncols:
-                raise ValueError(
-                    f"Row {row_idx} has {len(row)} columns, expected {ncols}"
-                )
-
-            for col_idx, z in enumerate(row):
-                if z != nodata:
-                    # Calculate coordinates
-                    x = xllcorner + col_idx * cellsize
-                    y = yllcorner + (nrows - 1 - row_idx) * cellsize  # Y increases upward
-                    z_scaled = z * unit_scale
+        # Convert grid to point cloud, dropping NODATA cells
+        points_array = dem_to_points(grid, xllcorner, yllcorner, cellsize, nodata, unit_scale)
 
-                    points.append([x, y, z_scaled])
-
-        if not points:
+        if len(points_array) == 0:
             raise ValueError(f"No valid elevation data found in {file_path}")
 
-        points_array = np.array(points, dtype=np.float64)
-
         return TerrainData(
             points=points_array,
             source=TerrainSource.DEM_ASCII,
             source_file=str(file_path),
+            grid=grid,
             metadata={
                 "ncols": ncols,
                 "nrows": nrows,
@@ -208,7 +308,7 @@ class TerrainImporter:
                 "cellsize": cellsize,
                 "nodata_value": nodata,
                 "unit_scale": unit_scale,
-                "num_points_imported": len(points),
+                "num_points_imported": len(points_array),
             },
         )
 
@@ -228,51 +328,56 @@ class TerrainImporter:
         Returns:
             TerrainData with point cloud
         """
-        # Simple wrapper around CSV importer
-        if delimiter is None:
-            # Read and detect delimiter
-            with open(file_path, "r") as f:
-                first_line = f.readline().strip()
-                if "\t" in first_line:
-                    delimiter = "\t"
-                else:
-                    delimiter = " "
-
-        # Handle multiple spaces as single delimiter
-        points = []
-        with open(file_path, "r") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                parts = line.split(delimiter) if delimiter != " " else line.split()
-                if len(parts) < 3:
-                    continue
+        # Tabs and runs of spaces are both plain whitespace to the parser
+        if delimiter in (" ", "\t"):
+            delimiter = None
 
-                try:
-                    x = float(parts[0]) * unit_scale
-                    y = float(parts[1]) * unit_scale
-                    z = float(parts[2]) * unit_scale
-                    points.append([x, y, z])
-                except (ValueError, IndexError):
-                    continue
+        try:
+            points_array = TerrainImporter._read_columns(
+                file_path, (0, 1, 2), delimiter=delimiter, comment="#"
+            )
+        except ValueError:
+            # Some lines are malformed: fall back to a tolerant parse that
+            # skips them
+            points_array = TerrainImporter._parse_xyz_lines(file_path, delimiter)
 
-        if not points:
+        if len(points_array) == 0:
             raise ValueError(f"No valid points found in {file_path}")
 
-        points_array = np.array(points, dtype=np.float64)
+        np.multiply(points_array, unit_scale, out=points_array)
 
         return TerrainData(
             points=points_array,
             source=TerrainSource.SURVEYED_POINTS,
             source_file=str(file_path),
             metadata={
-                "num_points_imported": len(points),
+                "num_points_imported": len(points_array),
                 "unit_scale": unit_scale,
             },
         )
 
+    @staticmethod
+    def _parse_xyz_lines(file_path: str, delimiter: Optional[str]) -> np.ndarray:
+        """Line-by-line XYZ parse that skips comments and malformed lines."""
+        points = array("d")
+        with open(file_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                parts = line.split(delimiter)
+                if len(parts) < 3:
+                    continue
+
+                try:
+                    x, y, z = map(float, parts[:3])
+                except ValueError:
+                    continue
+                points.extend((x, y, z))
+
+        return np.frombuffer(points, dtype=np.float64).reshape(-1, 3)
+
     @staticmethod
     def auto_detect_format(file_path: str) -> str:
         """Auto-detect terrain file format.
@@ -295,17 +400,18 @@ class TerrainImporter:
             # Could be XYZ or DEM ASCII, check content
             pass
 
-        # Check content
+        # Check content; a fixed-size peek is enough for the header checks,
+        # which run on the raw bytes without splitting into lines
         try:
-            with open(file_path, "r") as f:
-                first_lines = [next(f).strip() for _ in range(min(10, sum(1 for _ in f)))]
+            with open(file_path, "rb") as f:
+                head = f.read(8192)
 
             # Check for DEM ASCII headers
-            if any("ncols" in line.lower() or "nrows" in line.lower() for line in first_lines):
+            if _DEM_HEADER_RE.search(head):
                 return "dem_ascii"
 
             # Check for CSV (commas)
-            if any("," in line for line in first_lines):
+            if b"," in head:
                 return "csv"
 
             # Default to XYZ
@@ -344,12 +450,69 @@ class TerrainImporter:
         else:
             raise ValueError(f"Unknown terrain file format: {file_path}")
 
+    @staticmethod
+    def import_many(
+        file_paths: List[str],
+        unit_scale: float = 1.0,
+        max_workers: Optional[int] = None,
+    ) -> TerrainData:
+        """Import several terrain files concurrently and merge their points.
+
+        Intended for DEMs tiled across many files. Files are imported with
+        import_auto on a thread pool; the bulk parsers and Numba kernels
+        release the GIL, so the files are parsed in parallel.
+
+        Args:
+            file_paths: Paths to terrain files, in any supported format
+            unit_scale: Multiplier to convert to mm
+            max_workers: Thread pool size (default: ThreadPoolExecutor's)
+
+        Returns:
+            TerrainData with the points of all files, in file order
+
+        Raises:
+            ValueError: If no paths are given or any file fails to import
+        """
+        if not file_paths:
+            raise ValueError("No terrain files given")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(
+                lambda path: TerrainImporter.import_auto(path, unit_scale=unit_scale),
+                file_paths,
+            ))
+
+        # Copy into one column-major array, like the single-file importers
+        counts = [r.num_points for r in results]
+        points_array = np.empty((sum(counts), 3), order="F")
+        offset = 0
+        for result, count in zip(results, counts):
+            points_array[offset:offset + count] = result.points
+            offset += count
+
+        # Tiles of one format keep its source type; mixed inputs are a
+        # generic point cloud
+        sources = {r.source for r in results}
+        source = sources.pop() if len(sources) == 1 else TerrainSource.SURVEYED_POINTS
+
+        return TerrainData(
+            points=points_array,
+            source=source,
+            metadata={
+                "num_points_imported": len(points_array),
+                "source_files": [r.source_file for r in results],
+                "points_per_file": counts,
+                "unit_scale": unit_scale,
+            },
+        )
+
 
 def create_sample_terrain(
     size: float = 50000.0,
     spacing: float = 2000.0,
     slope: float = 5.0,
     roughness: float = 500.0,
+    seed: Optional[int] = None,
 ) -> TerrainData:
     """Create sample terrain for testing.
 
@@ -358,30 +521,27 @@ def create_sample_terrain(
         spacing: Point spacing in mm (default 2m)
         slope: Base slope in degrees (default 5°)
         roughness: Random elevation variation in mm (default 0.5m)
+        seed: Random seed for reproducible roughness
 
     Returns:
         TerrainData with synthetic terrain
     """
-    import math
-    import random
-
-    points = []
-
-    x = 0.0
-    while x <= size:
-        y = 0.0
-        while y <= size:
-            # Base slope (north-south)
-            base_z = y * math.tan(math.radians(slope))
-
-            # Add roughness
-            z = base_z + random.uniform(-roughness, roughness)
-
-            points.append([x, y, z])
-            y += spacing
-        x += spacing
-
-    points_array = np.array(points, dtype=np.float64)
+    n = int(size // spacing) + 1
+    axis = np.arange(n) * spacing
+
+    # Fill a preallocated column-major array through (n, n) views of its
+    # columns; X varies along the first grid axis, Y along the second
+    points_array = np.empty((n * n, 3), order="F")
+    xx, yy, zz = (points_array[:, k].reshape(n, n) for k in range(3))
+    xx[...] = axis[:, None]
+    yy[...] = axis
+
+    # Base slope (north-south) plus uniform roughness, generated in place
+    rng = np.random.default_rng(seed)
+    rng.random(out=zz)
+    zz *= 2 * roughness
+    zz -= roughness
+    zz += yy * math.tan(math.radians(slope))
 
     return TerrainData(
         points=points_array,
@@ -34,29 +34,29 @@ async def create_project(
 
     try:
         # Create a new FreeCAD document
-        code = f"""
+        code = """
 import FreeCAD
 import FreeCADGui
 
 # Create new document
-doc = FreeCAD.newDocument("{project_name}")
-FreeCAD.setActiveDocument("{project_name}")
+doc = FreeCAD.newDocument(params["project_name"])
+FreeCAD.setActiveDocument(params["project_name"])
 
 # Add project metadata as document properties
 doc.addProperty("App::PropertyString", "ProjectName", "FreePVC", "Project name")
-doc.ProjectName = "{project_name}"
+doc.ProjectName = params["project_name"]
 
 doc.addProperty("App::PropertyFloat", "Latitude", "FreePVC", "Site latitude (deg)")
-doc.Latitude = {latitude}
+doc.Latitude = params["latitude"]
 
 doc.addProperty("App::PropertyFloat", "Longitude", "FreePVC", "Site longitude (deg)")
-doc.Longitude = {longitude}
+doc.Longitude = params["longitude"]
 
 doc.addProperty("App::PropertyFloat", "Altitude", "FreePVC", "Site altitude (m)")
-doc.Altitude = {altitude}
+doc.Altitude = params["altitude"]
 
 doc.addProperty("App::PropertyString", "Timezone", "FreePVC", "Site timezone")
-doc.Timezone = "{timezone}"
+doc.Timezone = params["timezone"]
 
 # Create main groups for organization
 layout_group = doc.addObject("App::DocumentObjectGroup", "Layout")
@@ -68,7 +68,14 @@ doc.recompute()
 
 "Project created successfully"
 """
-        result = connection.execute_code(code)
+        params = {
+            "project_name": project_name,
+            "latitude": float(latitude),
+            "longitude": float(longitude),
+            "altitude": float(altitude),
+            "timezone": timezone,
+        }
+        result = connection.execute_code(code, params)
 
         return [
             TextContent(
@@ -186,12 +193,12 @@ async def save_project(
 
     try:
         if file_path:
-            code = f"""
+            code = """
 import FreeCAD
 doc = FreeCAD.ActiveDocument
 if doc:
-    doc.saveAs("{file_path}")
-    "Saved to {file_path}"
+    doc.saveAs(params["file_path"])
+    "Saved to " + params["file_path"]
 else:
     "No active document"
 """
@@ -208,7 +215,7 @@ if doc:
 else:
     "No active document"
 """
-        result = connection.execute_code(code)
+        result = connection.execute_code(code, {"file_path": file_path})
 
         return [TextContent(type="text", text=f"✓ {result}")]
 
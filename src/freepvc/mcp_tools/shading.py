@@ -6,7 +6,6 @@ Exposes shading analysis operations via Model Context Protocol.
 from datetime import datetime
 from mcp.types import TextContent, ImageContent
 from mcp.server.fastmcp import Context
-import json
 
 from freepvc.server import mcp
 from freepvc.engines.shading_engine import ShadingEngine, AnnualShadingMetrics
@@ -3,10 +3,11 @@
 Exposes terrain operations via Model Context Protocol.
 """
 
+import asyncio
+
 from mcp.types import TextContent, ImageContent
 from mcp.server.fastmcp import Context
 import numpy as np
-import json
 
 from freepvc.server import mcp
 from freepvc.io.terrain_import import TerrainImporter, create_sample_terrain
@@ -57,10 +58,7 @@ async def import_terrain(
         stats = terrain_data.get_statistics()
 
         # Create mesh in FreeCAD via RPC
-        vertices_list = mesh.vertices.tolist()
-        triangles_list = mesh.triangles.tolist()
-
-        result = connection.create_terrain_mesh(vertices_list, triangles_list, object_name)
+        result = connection.create_terrain_mesh_bin(mesh.vertices, mesh.triangles, object_name)
 
         # Format response
         response = f"""✓ Terrain imported successfully
@@ -109,53 +107,20 @@ async def analyze_terrain_slope(
     connection = ctx.request_context["connection"]
 
     try:
-        # Get terrain mesh from FreeCAD
-        code = f"""
-import FreeCAD
-import numpy as np
-
-doc = FreeCAD.ActiveDocument
-terrain = doc.getObject("{terrain_name}")
-
-if terrain is None:
-    result = {{"error": "Terrain object not found"}}
-else:
-    # Extract mesh data
-    mesh = terrain.Mesh
-    vertices = []
-    for v in mesh.Points:
-        vertices.append([v.x, v.y, v.z])
-
-    triangles = []
-    for f in mesh.Facets:
-        triangles.append([f.PointIndices[0], f.PointIndices[1], f.PointIndices[2]])
-
-    result = {{
-        "vertices": vertices,
-        "triangles": triangles,
-    }}
-"""
-        mesh_data = connection.execute_code(code)
-
-        if "error" in mesh_data:
-            return [TextContent(type="text", text=f"✗ {mesh_data['error']}")]
-
-        # Reconstruct TerrainMesh
-        from freepvc.models.terrain import TerrainMesh
-        vertices = np.array(mesh_data["vertices"])
-        triangles = np.array(mesh_data["triangles"])
-        mesh = TerrainMesh(vertices=vertices, triangles=triangles)
-
-        # Analyze slope
-        slope_map = TerrainEngine.analyze_slope(mesh)
+        # Get terrain mesh from FreeCAD (cached until the mesh changes); RPC
+        # and NumPy work run off the event loop so other tools can proceed
+        mesh = await asyncio.wrap_future(connection.get_terrain_mesh_async(terrain_name))
+        if mesh is None:
+            return [TextContent(type="text", text="✗ Terrain object not found")]
+
+        # Analyze slope and generate colors
+        slope_map = await asyncio.to_thread(TerrainEngine.analyze_slope, mesh)
+        colors = slope_map.compute_heatmap_colors(color_scheme, dtype=np.uint8)
+
+        # Apply colors to FreeCAD mesh while the statistics are computed
+        upload = asyncio.wrap_future(connection.set_face_colors_bin_async(terrain_name, colors))
         stats = slope_map.get_statistics()
-
-        # Generate colors
-        colors = slope_map.compute_heatmap_colors(color_scheme)
-        colors_list = colors.tolist()
-
-        # Apply colors to FreeCAD mesh
-        connection.set_face_colors(terrain_name, colors_list)
+        await upload
 
         # Format response
         response = f"""✓ Terrain slope analysis complete
@@ -189,6 +154,7 @@ async def query_terrain_elevation(
     x: float,
     y: float,
     terrain_name: str = "Terrain",
+    include_slope: bool = False,
     ctx: Context = None,
 ) -> list[TextContent | ImageContent]:
     """Query elevation at a specific (x, y) coordinate.
@@ -199,6 +165,8 @@ async def query_terrain_elevation(
         x: X coordinate in mm
         y: Y coordinate in mm
         terrain_name: Name of terrain object in FreeCAD
+        include_slope: Also report the slope at the point (four extra
+            elevation lookups)
 
     Returns:
         Interpolated elevation value
@@ -206,51 +174,23 @@ async def query_terrain_elevation(
     connection = ctx.request_context["connection"]
 
     try:
-        # Get terrain mesh from FreeCAD (same as analyze_terrain_slope)
-        code = f"""
-import FreeCAD
-import numpy as np
-
-doc = FreeCAD.ActiveDocument
-terrain = doc.getObject("{terrain_name}")
-
-if terrain is None:
-    result = {{"error": "Terrain object not found"}}
-else:
-    mesh = terrain.Mesh
-    vertices = [[v.x, v.y, v.z] for v in mesh.Points]
-    triangles = [[f.PointIndices[0], f.PointIndices[1], f.PointIndices[2]] for f in mesh.Facets]
-
-    result = {{
-        "vertices": vertices,
-        "triangles": triangles,
-    }}
-"""
-        mesh_data = connection.execute_code(code)
-
-        if "error" in mesh_data:
-            return [TextContent(type="text", text=f"✗ {mesh_data['error']}")]
-
-        # Reconstruct mesh
-        from freepvc.models.terrain import TerrainMesh
-        vertices = np.array(mesh_data["vertices"])
-        triangles = np.array(mesh_data["triangles"])
-        mesh = TerrainMesh(vertices=vertices, triangles=triangles)
+        # Get terrain mesh from FreeCAD (cached until the mesh changes)
+        mesh = await asyncio.wrap_future(connection.get_terrain_mesh_async(terrain_name))
+        if mesh is None:
+            return [TextContent(type="text", text="✗ Terrain object not found")]
 
         # Interpolate elevation
         query_point = np.array([x, y])
         elevation = TerrainEngine.interpolate_elevation(mesh, query_point)
 
-        # Also compute slope at this point
-        slopes = TerrainEngine.compute_slopes_at_points(mesh, query_point.reshape(1, -1))
-        slope = slopes[0]
-
         response = f"""✓ Terrain elevation query
 
 **Location:** ({x/1000:.2f}m, {y/1000:.2f}m)
 **Elevation:** {elevation/1000:.2f} m ({elevation:.1f} mm)
-**Slope:** {slope:.2f}°
 """
+        if include_slope:
+            slopes = TerrainEngine.compute_slopes_at_points(mesh, query_point.reshape(1, -1))
+            response += f"**Slope:** {slopes[0]:.2f}°\n"
 
         return [TextContent(type="text", text=response)]
 
@@ -298,15 +238,13 @@ async def create_sample_terrain_demo(
         mesh = TerrainEngine.create_mesh_from_points(terrain_data)
 
         # Create in FreeCAD
-        vertices_list = mesh.vertices.tolist()
-        triangles_list = mesh.triangles.tolist()
-        connection.create_terrain_mesh(vertices_list, triangles_list, object_name)
+        connection.create_terrain_mesh_bin(mesh.vertices, mesh.triangles, object_name)
 
         # Apply slope colors if requested
         if apply_slope_colors:
             slope_map = TerrainEngine.analyze_slope(mesh)
-            colors = slope_map.compute_heatmap_colors("slope")
-            connection.set_face_colors(object_name, colors.tolist())
+            colors = slope_map.compute_heatmap_colors("slope", dtype=np.uint8)
+            connection.set_face_colors_bin(object_name, colors)
 
         # Get statistics
         stats = terrain_data.get_statistics()
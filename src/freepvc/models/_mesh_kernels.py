@@ -0,0 +1,238 @@
+"""Numba kernels for terrain point-cloud and mesh quantities.
+
+Face normals are computed in one fused pass per triangle (gather, cross
+product, normalize, store) without the intermediate edge and length arrays
+of the NumPy version.
+
+Scatter-adds from faces onto vertices race when faces are processed in
+parallel, so each thread accumulates a contiguous range of faces into its
+own buffer and the buffers are summed per vertex afterwards.
+
+Point-cloud and slope statistics (extremes, moments, class and buildable
+counts) are each gathered in a single read of the input array, and slope
+heatmap colors are written in a single pass over the slopes.
+"""
+
+import math
+
+import numpy as np
+
+from freepvc.engines._numba_compat import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def _face_normals_kernel(vertices, triangles, out):
+    for i in prange(triangles.shape[0]):
+        a = triangles[i, 0]
+        b = triangles[i, 1]
+        c = triangles[i, 2]
+        x0 = vertices[a, 0]
+        y0 = vertices[a, 1]
+        z0 = vertices[a, 2]
+        e1x = vertices[b, 0] - x0
+        e1y = vertices[b, 1] - y0
+        e1z = vertices[b, 2] - z0
+        e2x = vertices[c, 0] - x0
+        e2y = vertices[c, 1] - y0
+        e2z = vertices[c, 2] - z0
+
+        nx = e1y * e2z - e1z * e2y
+        ny = e1z * e2x - e1x * e2z
+        nz = e1x * e2y - e1y * e2x
+        length = math.sqrt(nx * nx + ny * ny + nz * nz)
+        if length == 0.0:
+            length = 1.0  # Degenerate face: leave the zero normal
+        out[i, 0] = nx / length
+        out[i, 1] = ny / length
+        out[i, 2] = nz / length
+
+
+def unit_face_normals(vertices: np.ndarray, triangles: np.ndarray, dtype=np.float32) -> np.ndarray:
+    """Unit normal of every triangle, computed in one fused pass.
+
+    Args:
+        vertices: (N, 3) vertex coordinates
+        triangles: (M, 3) vertex indices
+        dtype: Output dtype; the arithmetic is float64 regardless
+
+    Returns:
+        (M, 3) unit normals, zero for degenerate faces
+    """
+    out = np.empty((len(triangles), 3), dtype=dtype)
+    _face_normals_kernel(
+        np.ascontiguousarray(vertices, dtype=np.float64),
+        np.ascontiguousarray(triangles),
+        out,
+    )
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _accumulate_vertex_normals_kernel(triangles, face_normals, num_vertices, n_chunks):
+    m = triangles.shape[0]
+    step = (m + n_chunks - 1) // n_chunks
+
+    buf = np.zeros((n_chunks, num_vertices, 3))
+    for c in prange(n_chunks):
+        for i in range(c * step, min((c + 1) * step, m)):
+            for k in range(3):
+                v = triangles[i, k]
+                buf[c, v, 0] += face_normals[i, 0]
+                buf[c, v, 1] += face_normals[i, 1]
+                buf[c, v, 2] += face_normals[i, 2]
+
+    out = np.empty((num_vertices, 3))
+    for v in prange(num_vertices):
+        for a in range(3):
+            total = 0.0
+            for c in range(n_chunks):
+                total += buf[c, v, a]
+            out[v, a] = total
+    return out
+
+
+def accumulate_vertex_normals(
+    triangles: np.ndarray, face_normals: np.ndarray, num_vertices: int, n_chunks: int
+) -> np.ndarray:
+    """Sum each face normal onto the face's three vertices.
+
+    Args:
+        triangles: (M, 3) vertex indices
+        face_normals: (M, 3) face normals
+        num_vertices: Number of mesh vertices
+        n_chunks: Number of per-thread face ranges (and accumulation buffers)
+
+    Returns:
+        (num_vertices, 3) unnormalized vertex normals
+    """
+    return _accumulate_vertex_normals_kernel(
+        np.ascontiguousarray(triangles, dtype=np.int64),
+        np.ascontiguousarray(face_normals),
+        num_vertices,
+        max(1, n_chunks),
+    )
+
+
+@njit(cache=True)
+def _slope_summary_kernel(slopes, thresholds, buildable_max, class_counts):
+    n = slopes.shape[0]
+    shift = float(slopes[0])
+    lo = slopes[0]
+    hi = slopes[0]
+    total = 0.0
+    total_sq = 0.0
+    num_buildable = 0
+    for i in range(n):
+        v = slopes[i]
+        # NaN sticks once seen, as with ndarray.min/max
+        if v < lo or v != v:
+            lo = v if lo == lo else lo
+        if v > hi or v != v:
+            hi = v if hi == hi else hi
+        d = v - shift
+        total += d
+        total_sq += d * d
+
+        # Same class as np.digitize: thresholds not above v (NaN -> last)
+        k = 0
+        for t in thresholds:
+            if not v < t:
+                k += 1
+        class_counts[k] += 1
+        if v <= buildable_max:
+            num_buildable += 1
+
+    mean = total / n
+    var = max(total_sq / n - mean * mean, 0.0)
+    return float(lo), float(hi), shift + mean, math.sqrt(var), num_buildable
+
+
+def slope_summary(slopes: np.ndarray, thresholds: np.ndarray, buildable_max: float):
+    """Min, max, mean, std, class counts and buildable count in one pass.
+
+    Args:
+        slopes: Non-empty 1D array of slopes in degrees
+        thresholds: Ascending class thresholds in degrees
+        buildable_max: Maximum buildable slope in degrees
+
+    Returns:
+        (min, max, mean, std, class_counts, num_buildable); class_counts has
+        len(thresholds) + 1 entries
+    """
+    class_counts = np.zeros(len(thresholds) + 1, dtype=np.int64)
+    lo, hi, mean, std, num_buildable = _slope_summary_kernel(
+        np.ascontiguousarray(slopes),
+        np.ascontiguousarray(thresholds, dtype=np.float64),
+        float(buildable_max),
+        class_counts,
+    )
+    return lo, hi, mean, std, class_counts, num_buildable
+
+
+@njit(parallel=True, cache=True)
+def _slope_colors_kernel(slopes, out):
+    for i in prange(slopes.shape[0]):
+        v = slopes[i] / 45.0
+        # Explicit comparisons so NaN slopes give NaN colors, as np.clip does
+        if v < 0.0:
+            v = 0.0
+        elif v > 1.0:
+            v = 1.0
+        out[i, 0] = v
+        out[i, 1] = 1.0 - v * 0.5
+        out[i, 2] = 0.1
+
+
+def slope_colors(slopes: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """Green-to-red slope heatmap colors in one fused pass.
+
+    Args:
+        slopes: 1D array of slopes in degrees
+        dtype: Output dtype
+
+    Returns:
+        (N, 3) RGB values in the 0-1 range; 45 degrees and above are red
+    """
+    out = np.empty((len(slopes), 3), dtype=dtype)
+    _slope_colors_kernel(np.ascontiguousarray(slopes), out)
+    return out
+
+
+@njit(cache=True)
+def _point_stats_kernel(points, mins, maxs):
+    n = points.shape[0]
+    for a in range(3):
+        mins[a] = points[0, a]
+        maxs[a] = points[0, a]
+    shift = points[0, 2]
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        for a in range(3):
+            v = points[i, a]
+            if v < mins[a] or v != v:
+                mins[a] = v if mins[a] == mins[a] else mins[a]
+            if v > maxs[a] or v != v:
+                maxs[a] = v if maxs[a] == maxs[a] else maxs[a]
+        d = points[i, 2] - shift
+        total += d
+        total_sq += d * d
+
+    mean = total / n
+    var = max(total_sq / n - mean * mean, 0.0)
+    return shift + mean, math.sqrt(var)
+
+
+def point_stats(points: np.ndarray):
+    """Per-axis min/max and z mean/std of a point cloud in one pass.
+
+    Args:
+        points: Non-empty (N, 3) float64 array, C or Fortran order
+
+    Returns:
+        (mins, maxs, z_mean, z_std) with mins/maxs as length-3 arrays
+    """
+    mins = np.empty(3)
+    maxs = np.empty(3)
+    z_mean, z_std = _point_stats_kernel(np.asarray(points, dtype=np.float64), mins, maxs)
+    return mins, maxs, z_mean, z_std
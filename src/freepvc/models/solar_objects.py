@@ -5,9 +5,11 @@ the FreePVC system.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class RackType(Enum):
     """Types of solar racking systems."""
@@ -24,7 +26,7 @@ class MountingType(Enum):
     ROOFTOP = "rooftop"
 
 
-@dataclass
+@dataclass(slots=True)
 class PanelSpec:
     """Solar panel specification (template/prototype)."""
     
@@ -57,7 +59,7 @@ class PanelSpec:
             raise ValueError("Panel power must be positive")
 
 
-@dataclass
+@dataclass(slots=True)
 class RackConfig:
     """Configuration for a solar rack (shared template for many instances)."""
     
@@ -105,7 +107,7 @@ class RackConfig:
         return (self.total_panels * self.panel_spec.power_watts) / 1000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackerConfig(RackConfig):
     """Configuration for single-axis tracker."""
     
@@ -121,7 +123,7 @@ class TrackerConfig(RackConfig):
     tilt_angle_deg: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RackPlacement:
     """Placement data for a single rack instance.
     
@@ -150,6 +152,52 @@ class RackPlacement:
 
 
 @dataclass
+class PlacementArray:
+    """Rack placements stored column-wise (structure of arrays).
+
+    One row per rack with the numeric RackPlacement fields as columns, in
+    COLUMNS order, so per-field passes (bounds, rotations, RPC packing) are
+    NumPy operations instead of attribute access on many objects. The
+    array is column-major so each field is contiguous; positions are mm
+    and stay float64.
+    """
+
+    COLUMNS = (
+        "x", "y", "z",
+        "rotation_x", "rotation_y", "rotation_z",
+        "terrain_slope_deg", "terrain_aspect_deg",
+    )
+
+    data: np.ndarray  # (N, 8) float64, columns as in COLUMNS
+    rack_ids: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def column(self, name: str) -> np.ndarray:
+        """View of one field for all racks, e.g. ``column("z")``."""
+        return self.data[:, self.COLUMNS.index(name)]
+
+    @classmethod
+    def from_placements(cls, placements: List[RackPlacement]) -> "PlacementArray":
+        """Pack RackPlacement objects into columns."""
+        data = np.array(
+            [[getattr(p, name) for name in cls.COLUMNS] for p in placements],
+            dtype=np.float64,
+        ).reshape(-1, len(cls.COLUMNS))
+        return cls(data=np.asfortranarray(data), rack_ids=[p.rack_id for p in placements])
+
+    def iter_placements(self) -> Iterator[RackPlacement]:
+        """Yield a RackPlacement per rack, with native float fields."""
+        for row, rack_id in zip(self.data.tolist(), self.rack_ids):
+            yield RackPlacement(*row, rack_id=rack_id)
+
+    def to_placements(self) -> List[RackPlacement]:
+        """Materialize all racks as RackPlacement objects."""
+        return list(self.iter_placements())
+
+
+@dataclass(slots=True)
 class LayoutConfig:
     """Configuration for array layout generation."""
     
@@ -181,8 +229,8 @@ class ArrayLayout:
     # Configuration used
     config: LayoutConfig
     
-    # Generated placements
-    placements: List[RackPlacement] = field(default_factory=list)
+    # Generated racks, column-wise; ``placements`` gives them as objects
+    placement_array: Optional[PlacementArray] = None
     
     # Statistics
     total_racks: int = 0
@@ -192,26 +240,53 @@ class ArrayLayout:
     panel_area_m2: float = 0.0
     gcr_actual: float = 0.0
     
+    @property
+    def placements(self) -> List[RackPlacement]:
+        """Placements as RackPlacement objects.
+
+        Built from ``placement_array`` on first access and cached until the
+        array is replaced.
+        """
+        cached = getattr(self, "_placements", None)
+        if cached is not None and cached[0] is self.placement_array:
+            return cached[1]
+
+        placements = [] if self.placement_array is None else self.placement_array.to_placements()
+        self._placements = (self.placement_array, placements)
+        return placements
+
+    @property
+    def num_racks(self) -> int:
+        """Number of racks, without materializing placements."""
+        return 0 if self.placement_array is None else len(self.placement_array)
+
+    def get_placement_array(self) -> PlacementArray:
+        """Placements as a PlacementArray (empty if none were generated)."""
+        if self.placement_array is None:
+            self.placement_array = PlacementArray.from_placements([])
+        return self.placement_array
+
     def calculate_statistics(self):
-        """Calculate layout statistics from placements."""
-        self.total_racks = len(self.placements)
-        self.total_panels = self.total_racks * self.config.rack_config.total_panels
-        self.dc_capacity_kw = self.total_racks * self.config.rack_config.dc_capacity_kw
+        """Calculate layout statistics from placements.
+        
+        All racks share one RackConfig, so every total is the rack count times
+        a per-rack constant and no pass over the placements is needed.
+        """
+        rack_config = self.config.rack_config
+        self.total_racks = self.num_racks
+        self.total_panels = self.total_racks * rack_config.total_panels
+        self.dc_capacity_kw = self.total_racks * rack_config.dc_capacity_kw
         
         # Calculate areas (simplified - assumes rectangular layout)
         if self.total_racks > 0:
-            rack_area = (
-                self.config.rack_config.rack_width_mm / 1000.0 *
-                self.config.rack_config.rack_length_mm / 1000.0
-            )
+            rack_width_m = rack_config.rack_width_mm / 1000.0
+            rack_area = rack_width_m * rack_config.rack_length_mm / 1000.0
             self.panel_area_m2 = self.total_racks * rack_area
             
             # Ground area = total racks * spacing * rack_width
-            self.ground_area_m2 = (
-                self.total_racks *
-                self.config.spacing_m *
-                (self.config.rack_config.rack_width_mm / 1000.0)
-            )
+            row_ground_area = self.config.spacing_m * rack_width_m
+            self.ground_area_m2 = self.total_racks * row_ground_area
             
-            if self.ground_area_m2 > 0:
-                self.gcr_actual = self.panel_area_m2 / self.ground_area_m2
+            # The rack count cancels out of the ratio
+            if row_ground_area > 0:
+                self.gcr_actual = rack_area / row_ground_area
@@ -10,6 +10,64 @@ import numpy as np
 from enum import Enum
 
 
+# Meshes with more faces than this accumulate vertex normals in parallel
+# (per thread) when Numba is installed
+PARALLEL_NORMALS_MIN_FACES = 50_000
+
+# Stored unit normals are single precision; they are computed from float64
+# vertices and only feed slope/aspect and shading. Vertex coordinates stay
+# float64 since site coordinates in mm need more than float32's 24 bits.
+NORMAL_DTYPE = np.float32
+
+# Floor for normal lengths before normalizing. Any non-zero float64 length
+# is above it, so only exactly-zero normals are affected and stay zero.
+MIN_NORMAL_LENGTH = np.finfo(np.float64).smallest_subnormal
+
+# Default maximum slope for panel placement (degrees)
+BUILDABLE_MAX_SLOPE_DEG = 20.0
+
+
+def _numba_kernels():
+    """The Numba mesh kernels module, or None when Numba is not installed.
+
+    Imported on first use rather than with this module, so that loading
+    the models (and the MCP server through them) does not import Numba.
+    """
+    from freepvc.engines._numba_compat import NUMBA_AVAILABLE
+
+    if not NUMBA_AVAILABLE:
+        return None
+    from freepvc.models import _mesh_kernels
+
+    return _mesh_kernels
+
+
+def quantize_colors(colors: np.ndarray) -> np.ndarray:
+    """Round RGB floats in the 0-1 range to uint8 channels (0-255)."""
+    rgb = np.multiply(colors, 255.0, dtype=np.float32)
+    rgb += 0.5
+    np.clip(rgb, 0, 255, out=rgb)
+    return rgb.astype(np.uint8)
+
+
+def _axis_bounds(points: np.ndarray) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
+    """((x_min, x_max), (y_min, y_max), (z_min, z_max)) of a non-empty (N, 3) array.
+
+    Reduces each column separately: min(axis=0) on a row-major (N, 3) array,
+    such as mesh vertices, is several times slower than three strided
+    column reductions, and for column-major points the two are the same.
+    """
+    return tuple((points[:, axis].min(), points[:, axis].max()) for axis in range(3))
+
+
+def _read_only(values):
+    """Read-only view of an array; the caller's array keeps its own flags."""
+    if isinstance(values, np.ndarray):
+        values = values.view()
+        values.flags.writeable = False
+    return values
+
+
 class TerrainSource(Enum):
     """Source type for terrain data."""
     CSV_POINTS = "csv_points"
@@ -24,6 +82,12 @@ class TerrainData:
 
     Represents the initial terrain data before mesh generation.
     Coordinates are in millimeters to match FreeCAD units.
+
+    ``points`` is stored column-major (Fortran order), so each of the
+    ``x``, ``y`` and ``z`` columns is a contiguous array while the (N, 3)
+    interface stays the same. Row-major input is converted on construction.
+    The array is read-only, since ``bounds`` is cached per array; assign a
+    new array to move the points.
     """
 
     points: np.ndarray  # Nx3 array of [x, y, z] coordinates (mm)
@@ -31,40 +95,83 @@ class TerrainData:
     source_file: Optional[str] = None
     coordinate_system: str = "local"  # or "WGS84", "UTM", etc.
     metadata: dict = field(default_factory=dict)
+    grid: Optional[np.ndarray] = None  # (nrows, ncols) raw elevations for gridded sources
+
+    def __post_init__(self):
+        # Importers already build Fortran-order arrays; this only copies
+        # points handed in row-major by other callers
+        if isinstance(self.points, np.ndarray) and self.points.ndim == 2:
+            self.points = np.asfortranarray(self.points)
+        self.points = _read_only(self.points)
 
     @property
     def num_points(self) -> int:
         """Number of terrain points."""
         return len(self.points)
 
+    @property
+    def x(self) -> np.ndarray:
+        """X coordinates (mm), a view into ``points``."""
+        return self.points[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Y coordinates (mm), a view into ``points``."""
+        return self.points[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """Z coordinates (mm), a view into ``points``."""
+        return self.points[:, 2]
+
     @property
     def bounds(self) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
-        """Bounding box as ((x_min, x_max), (y_min, y_max), (z_min, z_max))."""
-        if len(self.points) == 0:
-            return ((0, 0), (0, 0), (0, 0))
+        """Bounding box as ((x_min, x_max), (y_min, y_max), (z_min, z_max)).
 
-        mins = self.points.min(axis=0)
-        maxs = self.points.max(axis=0)
-        return ((mins[0], maxs[0]), (mins[1], maxs[1]), (mins[2], maxs[2]))
+        Cached until ``points`` is replaced with a different array.
+        """
+        cached = getattr(self, "_bounds", None)
+        if cached is not None and cached[0] is self.points:
+            return cached[1]
+
+        if len(self.points) == 0:
+            bounds = ((0, 0), (0, 0), (0, 0))
+        else:
+            bounds = _axis_bounds(self.points)
+        self._bounds = (self.points, bounds)
+        return bounds
 
     @property
     def elevation_range(self) -> Tuple[float, float]:
         """Min and max elevation (z coordinate) in mm."""
-        z_coords = self.points[:, 2]
-        return (float(z_coords.min()), float(z_coords.max()))
+        z_min, z_max = self.bounds[2]
+        return (float(z_min), float(z_max))
 
     def get_statistics(self) -> dict:
-        """Get statistical summary of terrain data."""
-        x, y, z = self.points[:, 0], self.points[:, 1], self.points[:, 2]
+        """Get statistical summary of terrain data.
+
+        With Numba the bounds and the z moments are gathered in a single
+        pass over the points (refreshing the ``bounds`` cache); otherwise the
+        extents come from the cached ``bounds``.
+        """
+        kernels = _numba_kernels()
+        if kernels is not None and self.num_points > 0:
+            mins, maxs, z_mean, z_std = kernels.point_stats(self.points)
+            bounds = ((mins[0], maxs[0]), (mins[1], maxs[1]), (mins[2], maxs[2]))
+            self._bounds = (self.points, bounds)
+        else:
+            bounds = self.bounds
+            z_mean, z_std = self.z.mean(), self.z.std()
+        (x_min, x_max), (y_min, y_max), (z_min, z_max) = bounds
 
         return {
             "num_points": self.num_points,
-            "bounds": self.bounds,
-            "x_extent_m": (x.max() - x.min()) / 1000,
-            "y_extent_m": (y.max() - y.min()) / 1000,
-            "elevation_range_m": (z.max() - z.min()) / 1000,
-            "mean_elevation_mm": float(z.mean()),
-            "std_elevation_mm": float(z.std()),
+            "bounds": bounds,
+            "x_extent_m": (x_max - x_min) / 1000,
+            "y_extent_m": (y_max - y_min) / 1000,
+            "elevation_range_m": (z_max - z_min) / 1000,
+            "mean_elevation_mm": float(z_mean),
+            "std_elevation_mm": float(z_std),
         }
 
 
@@ -73,6 +180,9 @@ class TerrainMesh:
     """Triangulated terrain mesh generated from point cloud.
 
     Represents a Delaunay triangulation of the terrain surface.
+    ``vertices`` and ``triangles`` are read-only, since bounds, triangle
+    coordinates and the engine's interpolators are cached per array;
+    assign new arrays to change the mesh.
     """
 
     vertices: np.ndarray  # Nx3 array of vertex coordinates (mm)
@@ -80,8 +190,12 @@ class TerrainMesh:
     source_data: Optional[TerrainData] = None
 
     # Derived properties
-    face_normals: Optional[np.ndarray] = None  # Mx3 array of face normal vectors
-    vertex_normals: Optional[np.ndarray] = None  # Nx3 array of vertex normal vectors
+    face_normals: Optional[np.ndarray] = None  # Mx3 array of face normal vectors (float32)
+    vertex_normals: Optional[np.ndarray] = None  # Nx3 array of vertex normal vectors (float32)
+
+    def __post_init__(self):
+        self.vertices = _read_only(self.vertices)
+        self.triangles = _read_only(self.triangles)
 
     @property
     def num_vertices(self) -> int:
@@ -95,56 +209,114 @@ class TerrainMesh:
 
     @property
     def bounds(self) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
-        """Bounding box as ((x_min, x_max), (y_min, y_max), (z_min, z_max))."""
-        mins = self.vertices.min(axis=0)
-        maxs = self.vertices.max(axis=0)
-        return ((mins[0], maxs[0]), (mins[1], maxs[1]), (mins[2], maxs[2]))
+        """Bounding box as ((x_min, x_max), (y_min, y_max), (z_min, z_max)).
+
+        Cached until ``vertices`` is replaced with a different array.
+        """
+        cached = getattr(self, "_bounds", None)
+        if cached is not None and cached[0] is self.vertices:
+            return cached[1]
+
+        bounds = _axis_bounds(self.vertices)
+        self._bounds = (self.vertices, bounds)
+        return bounds
+
+    @property
+    def tri_verts(self) -> np.ndarray:
+        """(M, 3, 3) read-only array of triangle vertex coordinates.
+
+        The gather is one np.take along the vertex axis, which copies whole
+        vertex rows and is markedly faster than the equivalent fancy index.
+        It is cached and reused until ``vertices`` or ``triangles`` is
+        replaced with a different array.
+        """
+        cached = getattr(self, "_tri_verts", None)
+        if cached is not None and cached[0] is self.vertices and cached[1] is self.triangles:
+            return cached[2]
+
+        tri = np.take(self.vertices, self.triangles, axis=0)
+        tri.flags.writeable = False
+        self._tri_verts = (self.vertices, self.triangles, tri)
+        return tri
 
     def compute_face_normals(self) -> np.ndarray:
-        """Compute normal vectors for all faces."""
+        """Compute normal vectors for all faces.
+
+        With Numba this is one fused parallel pass per triangle. Otherwise
+        it is vectorized over all faces using the cached ``tri_verts``
+        gather, then one np.cross. The result is cached on the mesh as
+        NORMAL_DTYPE unit vectors.
+        """
         if self.face_normals is not None:
             return self.face_normals
 
-        # Get triangle vertices
-        v0 = self.vertices[self.triangles[:, 0]]
-        v1 = self.vertices[self.triangles[:, 1]]
-        v2 = self.vertices[self.triangles[:, 2]]
+        kernels = _numba_kernels()
+        if kernels is not None:
+            self.face_normals = kernels.unit_face_normals(
+                self.vertices, self.triangles, dtype=NORMAL_DTYPE
+            )
+            return self.face_normals
+
+        tri = self.tri_verts
 
         # Compute edge vectors
-        edge1 = v1 - v0
-        edge2 = v2 - v0
+        v0 = tri[:, 0]
+        edge1 = tri[:, 1] - v0
+        edge2 = tri[:, 2] - v0
 
         # Cross product gives normal
         normals = np.cross(edge1, edge2)
 
         # Normalize
         lengths = np.linalg.norm(normals, axis=1, keepdims=True)
-        lengths = np.where(lengths == 0, 1, lengths)  # Avoid division by zero
-        normals = normals / lengths
+        # Avoid division by zero; zero-length (degenerate) normals stay zero
+        np.maximum(lengths, MIN_NORMAL_LENGTH, out=lengths)
+        normals = np.divide(normals, lengths, out=np.empty(normals.shape, dtype=NORMAL_DTYPE))
 
         self.face_normals = normals
         return normals
 
     def compute_vertex_normals(self) -> np.ndarray:
-        """Compute normal vectors for all vertices (averaged from adjacent faces)."""
+        """Compute normal vectors for all vertices (averaged from adjacent faces).
+
+        The scatter-add of face normals onto their corner vertices is one
+        weighted np.bincount per axis, which sums in face order like a
+        sequential loop would. Large meshes use a parallel Numba kernel
+        when Numba is installed.
+        """
         if self.vertex_normals is not None:
             return self.vertex_normals
 
         # First compute face normals
         face_normals = self.compute_face_normals()
 
-        # Initialize vertex normals
-        vertex_normals = np.zeros((self.num_vertices, 3))
-
         # Accumulate face normals at each vertex
-        for i, tri in enumerate(self.triangles):
-            for vertex_idx in tri:
-                vertex_normals[vertex_idx] += face_normals[i]
+        kernels = _numba_kernels()
+        if kernels is not None and self.num_faces > PARALLEL_NORMALS_MIN_FACES:
+            from freepvc.engines._numba_compat import get_num_threads
+
+            # Per-thread buffers cost num_vertices * 24 bytes each, so only
+            # use as many threads as there are faces to keep them busy
+            n_chunks = min(get_num_threads(), self.num_faces // PARALLEL_NORMALS_MIN_FACES)
+            vertex_normals = kernels.accumulate_vertex_normals(
+                self.triangles, face_normals, self.num_vertices, n_chunks
+            )
+        else:
+            corners = self.triangles.ravel()
+            vertex_normals = np.empty((self.num_vertices, 3))
+            for axis in range(3):
+                vertex_normals[:, axis] = np.bincount(
+                    corners,
+                    weights=np.repeat(face_normals[:, axis], 3),
+                    minlength=self.num_vertices,
+                )
 
         # Normalize
         lengths = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
-        lengths = np.where(lengths == 0, 1, lengths)
-        vertex_normals = vertex_normals / lengths
+        np.maximum(lengths, MIN_NORMAL_LENGTH, out=lengths)
+        vertex_normals = np.divide(
+            vertex_normals, lengths, out=np.empty(vertex_normals.shape, dtype=NORMAL_DTYPE)
+        )
 
         self.vertex_normals = vertex_normals
         return vertex_normals
@@ -172,6 +344,10 @@ class SlopeMap:
     slope_threshold_mid: float = 15.0  # Moderate slope
     slope_threshold_high: float = 25.0 # Steep slope
 
+    def __post_init__(self):
+        # Read-only like the mesh arrays: get_statistics() is cached per array
+        self.face_slopes = _read_only(self.face_slopes)
+
     @property
     def max_slope(self) -> float:
         """Maximum slope in degrees."""
@@ -186,18 +362,21 @@ class SlopeMap:
         """Classify slopes into categories: 0=flat, 1=gentle, 2=moderate, 3=steep, 4=very steep.
 
         Returns:
-            Array of integers 0-4 for each face
+            int8 array of class 0-4 for each face
         """
-        classification = np.zeros(len(self.face_slopes), dtype=int)
-
-        classification[self.face_slopes >= self.slope_threshold_low] = 1
-        classification[self.face_slopes >= self.slope_threshold_mid] = 2
-        classification[self.face_slopes >= self.slope_threshold_high] = 3
-        classification[self.face_slopes >= 35.0] = 4
-
-        return classification
-
-    def get_buildable_faces(self, max_slope: float = 20.0) -> np.ndarray:
+        # The class is the number of thresholds at or below the slope
+        return np.digitize(self.face_slopes, self._class_bins()).astype(np.int8)
+
+    def _class_bins(self) -> np.ndarray:
+        """Ascending slope class thresholds in degrees."""
+        return np.array([
+            self.slope_threshold_low,
+            self.slope_threshold_mid,
+            self.slope_threshold_high,
+            35.0,
+        ])
+
+    def get_buildable_faces(self, max_slope: float = BUILDABLE_MAX_SLOPE_DEG) -> np.ndarray:
         """Get indices of faces suitable for panel placement (slope below threshold).
 
         Args:
@@ -208,16 +387,26 @@ class SlopeMap:
         """
         return np.where(self.face_slopes <= max_slope)[0]
 
-    def compute_heatmap_colors(self, scheme: str = "slope") -> np.ndarray:
+    def compute_heatmap_colors(self, scheme: str = "slope", dtype=np.float64) -> np.ndarray:
         """Generate RGB colors for visualization.
 
         Args:
             scheme: Color scheme - "slope" (green to red), "aspect" (compass directions)
+            dtype: dtype of the result; float32 is plenty for colors that
+                are quantized to 8 bits for display, and np.uint8 returns
+                those 8-bit channels directly
 
         Returns:
-            Nx3 array of RGB values (0-1 range)
+            Nx3 array of RGB values (0-1 range, or 0-255 for np.uint8)
         """
-        colors = np.zeros((len(self.face_slopes), 3))
+        if np.dtype(dtype) == np.uint8:
+            return quantize_colors(self.compute_heatmap_colors(scheme, dtype=np.float32))
+
+        kernels = _numba_kernels()
+        if scheme == "slope" and kernels is not None:
+            return kernels.slope_colors(self.face_slopes, dtype=dtype)
+
+        colors = np.zeros((len(self.face_slopes), 3), dtype=dtype)
 
         if scheme == "slope":
             # Green (flat) -> Yellow (moderate) -> Red (steep)
@@ -234,36 +423,56 @@ class SlopeMap:
             normalized_aspect = self.face_aspects / 360.0
 
             # Use HSV-like mapping
-            hue_to_rgb = lambda h: (
-                max(0, min(1, abs(h * 6 - 3) - 1)),  # R
-                max(0, min(1, 2 - abs(h * 6 - 2))),  # G
-                max(0, min(1, 2 - abs(h * 6 - 4))),  # B
-            )
-
-            for i, aspect in enumerate(normalized_aspect):
-                colors[i] = hue_to_rgb(aspect)
+            h6 = normalized_aspect * 6
+            np.clip(np.abs(h6 - 3) - 1, 0, 1, out=colors[:, 0])  # R
+            np.clip(2 - np.abs(h6 - 2), 0, 1, out=colors[:, 1])  # G
+            np.clip(2 - np.abs(h6 - 4), 0, 1, out=colors[:, 2])  # B
 
         return colors
 
     def get_statistics(self) -> dict:
-        """Get statistical summary of slope analysis."""
-        classification = self.classify_slopes()
+        """Get statistical summary of slope analysis.
 
-        return {
-            "mean_slope_deg": float(self.mean_slope),
-            "max_slope_deg": float(self.max_slope),
-            "min_slope_deg": float(self.face_slopes.min()),
-            "std_slope_deg": float(self.face_slopes.std()),
-            "num_flat": int((classification == 0).sum()),
-            "num_gentle": int((classification == 1).sum()),
-            "num_moderate": int((classification == 2).sum()),
-            "num_steep": int((classification == 3).sum()),
-            "num_very_steep": int((classification == 4).sum()),
-            "buildable_area_pct": float(len(self.get_buildable_faces()) / len(self.face_slopes) * 100),
+        Cached until ``face_slopes`` is replaced or a threshold changes.
+        """
+        bins = self._class_bins()
+        cached = getattr(self, "_statistics", None)
+        if (
+            cached is not None
+            and cached[0] is self.face_slopes
+            and np.array_equal(cached[1], bins)
+        ):
+            return dict(cached[2])
+
+        slopes = self.face_slopes
+        kernels = _numba_kernels()
+        if kernels is not None and len(slopes) > 0:
+            min_slope, max_slope, mean_slope, std_slope, class_counts, num_buildable = (
+                kernels.slope_summary(slopes, bins, BUILDABLE_MAX_SLOPE_DEG)
+            )
+        else:
+            min_slope, max_slope = slopes.min(), slopes.max()
+            mean_slope, std_slope = slopes.mean(), slopes.std()
+            class_counts = np.bincount(self.classify_slopes(), minlength=5)
+            num_buildable = np.count_nonzero(slopes <= BUILDABLE_MAX_SLOPE_DEG)
+
+        stats = {
+            "mean_slope_deg": float(mean_slope),
+            "max_slope_deg": float(max_slope),
+            "min_slope_deg": float(min_slope),
+            "std_slope_deg": float(std_slope),
+            "num_flat": int(class_counts[0]),
+            "num_gentle": int(class_counts[1]),
+            "num_moderate": int(class_counts[2]),
+            "num_steep": int(class_counts[3]),
+            "num_very_steep": int(class_counts[4]),
+            "buildable_area_pct": float(num_buildable / len(slopes) * 100),
         }
+        self._statistics = (slopes, bins, stats)
+        return dict(stats)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContourLine:
     """Single elevation contour line.
 
@@ -310,9 +519,53 @@ class ContourSet:
         elevations = [c.elevation for c in self.contours]
         return (min(elevations), max(elevations))
 
+    def lengths(self) -> np.ndarray:
+        """Length of every contour line in mm, in one pass over all points.
+
+        Cached until a contour is added, removed or given new points.
+
+        Returns:
+            Array of lengths, one per contour
+        """
+        key = [c.points for c in self.contours]
+        cached = getattr(self, "_lengths", None)
+        if (
+            cached is not None
+            and len(cached[0]) == len(key)
+            and all(a is b for a, b in zip(cached[0], key))
+        ):
+            return cached[1]
+
+        counts = np.array([len(p) for p in key], dtype=np.int64)
+        lengths = np.zeros(len(key))
+        if counts.sum() >= 2:
+            all_points = np.concatenate(key)
+            # Pad so every contour, including the last, owns a trailing
+            # segment slot; zeroing those slots drops the segments that
+            # join one contour to the next
+            segments = np.zeros(len(all_points))
+            segments[:-1] = np.linalg.norm(np.diff(all_points, axis=0), axis=1)
+            ends = np.cumsum(counts)
+            segments[ends[counts > 0] - 1] = 0.0
+
+            starts = np.minimum(ends - counts, len(all_points) - 1)
+            lengths = np.add.reduceat(segments, starts)
+            lengths[counts < 2] = 0.0
+
+        self._lengths = (key, lengths)
+        return lengths
+
+    def total_length(self) -> float:
+        """Combined length of all contour lines in mm."""
+        return float(self.lengths().sum())
+
     def get_contour_at_elevation(self, elevation: float, tolerance: float = 1.0) -> Optional[ContourLine]:
         """Find contour line closest to specified elevation.
 
+        Binary search over the contour elevations, which are sorted once
+        and cached until ``contours`` is replaced or changes length. Of
+        several contours at the closest elevation, the first is returned.
+
         Args:
             elevation: Target elevation in mm
             tolerance: Maximum elevation difference in mm
@@ -320,7 +573,23 @@ class ContourSet:
         Returns:
             ContourLine or None if not found
         """
-        for contour in self.contours:
-            if abs(contour.elevation - elevation) <= tolerance:
-                return contour
-        return None
+        if not self.contours:
+            return None
+
+        cached = getattr(self, "_elevation_index", None)
+        if cached is None or cached[0] is not self.contours or cached[1] != len(self.contours):
+            elevations = np.array([c.elevation for c in self.contours], dtype=np.float64)
+            order = np.argsort(elevations, kind="stable")
+            cached = (self.contours, len(self.contours), order, elevations[order])
+            self._elevation_index = cached
+        order, sorted_elevations = cached[2], cached[3]
+
+        # Nearest elevation is at the insertion point or just below it
+        i = int(np.searchsorted(sorted_elevations, elevation))
+        if i == len(sorted_elevations) or (
+            i > 0 and elevation - sorted_elevations[i - 1] <= sorted_elevations[i] - elevation
+        ):
+            i = int(np.searchsorted(sorted_elevations, sorted_elevations[i - 1]))
+        if abs(sorted_elevations[i] - elevation) > tolerance:
+            return None
+        return self.contours[order[i]]
@@ -4,19 +4,30 @@ Extends freecad-mcp with solar-specific tools for PV plant design.
 """
 
 import asyncio
-import json
-import numpy as np
-from datetime import datetime
 from contextlib import asynccontextmanager
+from datetime import datetime
 
-from mcp.server.fastmcp import FastMCP, Context
-from mcp.types import TextContent, ImageContent
+import numpy as np
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import ImageContent, TextContent
 
 from freepvc.connection import FreePVCConnection
-from freepvc.io.terrain_import import TerrainImporter, create_sample_terrain
-from freepvc.engines.terrain_engine import TerrainEngine
-from freepvc.engines.shading_engine import ShadingEngine
-from freepvc.models.solar_objects import RackConfig, RackPlacement, PanelSpec
+from freepvc.models.solar_objects import LayoutConfig, PanelSpec, RackConfig, RackPlacement
+from freepvc.models.terrain import TerrainData, TerrainSource
+
+# The terrain and shading engines (and SciPy behind them) are imported
+# inside the tools that use them, and the models load the Numba kernels on
+# first use, so the server is ready without either
+
+
+async def _report_connection(connection: FreePVCConnection):
+    """Ping FreeCAD on an RPC worker thread and report the result."""
+    try:
+        await asyncio.wrap_future(connection.submit("ping"))
+        print("✓ Connected to FreeCAD RPC server on port 9876", flush=True)
+    except Exception as e:
+        print(f"⚠ Warning: Could not connect to FreeCAD: {e}", flush=True)
+        print("  Make sure FreeCAD is running with FreePVC workbench and RPC server started", flush=True)
 
 
 @asynccontextmanager
@@ -26,16 +37,15 @@ async def server_lifespan(server: FastMCP):
     # Use 127.0.0.1 instead of localhost for better compatibility
     connection = FreePVCConnection(host="127.0.0.1")
 
-    try:
-        # Test connection
-        connection.ping()
-        print("✓ Connected to FreeCAD RPC server on port 9876", flush=True)
-    except Exception as e:
-        print(f"⚠ Warning: Could not connect to FreeCAD: {e}", flush=True)
-        print("  Make sure FreeCAD is running with FreePVC workbench and RPC server started", flush=True)
+    # Test the connection in the background so the MCP handshake does not
+    # wait for the FreeCAD round trip
+    ping_task = asyncio.create_task(_report_connection(connection))
 
-    # Make connection available to all tool handlers via context
-    yield {"connection": connection}
+    try:
+        # Make connection available to all tool handlers via context
+        yield {"connection": connection}
+    finally:
+        ping_task.cancel()
 
 
 # Create FastMCP server instance with lifespan
@@ -71,31 +81,38 @@ async def create_project(
     """
     connection = ctx.request_context.lifespan_context["connection"]
 
-    code = f"""
+    code = """
 import FreeCAD
 
 # Create new document
-doc = FreeCAD.newDocument("{project_name}")
+doc = FreeCAD.newDocument(params["project_name"])
 
 # Set document metadata
-doc.Label = "{project_name}"
+doc.Label = params["project_name"]
 doc.Comment = "FreePVC Solar Plant Design"
 
 # Store site information as document metadata
-doc.Meta = {{
+doc.Meta = {
     "FreePVC.ProjectType": "Solar Plant",
-    "FreePVC.Latitude": "{latitude}",
-    "FreePVC.Longitude": "{longitude}",
-    "FreePVC.Altitude": "{altitude}",
-    "FreePVC.Timezone": "{timezone}",
-}}
-
-FreeCAD.setActiveDocument("{project_name}")
-result = {{"name": doc.Name, "label": doc.Label}}
+    "FreePVC.Latitude": params["latitude"],
+    "FreePVC.Longitude": params["longitude"],
+    "FreePVC.Altitude": params["altitude"],
+    "FreePVC.Timezone": params["timezone"],
+}
+
+FreeCAD.setActiveDocument(params["project_name"])
+result = {"name": doc.Name, "label": doc.Label}
 """
+    params = {
+        "project_name": project_name,
+        "latitude": str(latitude),
+        "longitude": str(longitude),
+        "altitude": str(altitude),
+        "timezone": timezone,
+    }
 
     try:
-        result = connection.execute_code(code)
+        result = connection.execute_code(code, params)
         response = f"""✓ Created project: {project_name}
 
 **Site Information:**
@@ -165,23 +182,23 @@ async def save_project(
     """
     connection = ctx.request_context.lifespan_context["connection"]
 
-    code = f"""
+    code = """
 import FreeCAD
 
 doc = FreeCAD.ActiveDocument
 if doc:
-    if "{file_path}":
-        doc.saveAs("{file_path}")
-        result = {{"saved": "{file_path}"}}
+    if params["file_path"]:
+        doc.saveAs(params["file_path"])
+        result = {"saved": params["file_path"]}
     else:
         doc.save()
-        result = {{"saved": doc.FileName}}
+        result = {"saved": doc.FileName}
 else:
-    result = {{"error": "No active document"}}
+    result = {"error": "No active document"}
 """
 
     try:
-        result = connection.execute_code(code)
+        result = connection.execute_code(code, {"file_path": file_path or ""})
         if "error" in result:
             return [TextContent(type="text", text="✗ No active project to save")]
 
@@ -217,6 +234,9 @@ async def import_terrain(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
+        from freepvc.engines.terrain_engine import TerrainEngine
+        from freepvc.io.terrain_import import TerrainImporter
+
         # Import terrain data
         if format == "auto":
             terrain_data = TerrainImporter.import_auto(file_path, unit_scale=unit_scale)
@@ -236,10 +256,7 @@ async def import_terrain(
         stats = terrain_data.get_statistics()
 
         # Create mesh in FreeCAD via RPC
-        vertices_list = mesh.vertices.tolist()
-        triangles_list = mesh.triangles.tolist()
-
-        result = connection.create_terrain_mesh(vertices_list, triangles_list, object_name)
+        result = connection.create_terrain_mesh_bin(mesh.vertices, mesh.triangles, object_name)
 
         # Format response
         response = f"""✓ Terrain imported successfully
@@ -300,9 +317,9 @@ async def import_terrain_from_coordinates(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
+        from freepvc.engines.terrain_engine import TerrainEngine
         from freepvc.io.elevation_fetch import fetch_terrain_from_coordinates
-        from freepvc.models.terrain import TerrainData, TerrainSource
-        
+
         # Fetch elevation data from coordinates
         x, y, z = await fetch_terrain_from_coordinates(
             center_latitude,
@@ -312,9 +329,9 @@ async def import_terrain_from_coordinates(
             resolution_m,
         )
         
-        # Combine into Nx3 points array
-        import numpy as np
-        points = np.column_stack((x, y, z))
+        # Combine into an Nx3 points array, column-major like the importers
+        points = np.empty((len(x), 3), order="F")
+        points[:, 0], points[:, 1], points[:, 2] = x, y, z
         
         # Create TerrainData object
         terrain_data = TerrainData(
@@ -329,10 +346,7 @@ async def import_terrain_from_coordinates(
         stats = terrain_data.get_statistics()
         
         # Create mesh in FreeCAD via RPC
-        vertices_list = mesh.vertices.tolist()
-        triangles_list = mesh.triangles.tolist()
-        
-        result = connection.create_terrain_mesh(vertices_list, triangles_list, object_name)
+        result = connection.create_terrain_mesh_bin(mesh.vertices, mesh.triangles, object_name)
         
         # Format response
         response = f"""✓ Terrain imported from coordinates
@@ -388,53 +402,22 @@ async def analyze_terrain_slope(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
-        # Get terrain mesh from FreeCAD
-        code = f"""
-import FreeCAD
-import numpy as np
+        from freepvc.engines.terrain_engine import TerrainEngine
 
-doc = FreeCAD.ActiveDocument
-terrain = doc.getObject("{terrain_name}")
+        # Get terrain mesh from FreeCAD (cached until the mesh changes); RPC
+        # and NumPy work run off the event loop so other tools can proceed
+        mesh = await asyncio.wrap_future(connection.get_terrain_mesh_async(terrain_name))
+        if mesh is None:
+            return [TextContent(type="text", text="✗ Terrain object not found")]
 
-if terrain is None:
-    result = {{"error": "Terrain object not found"}}
-else:
-    # Extract mesh data
-    mesh = terrain.Mesh
-    vertices = []
-    for v in mesh.Points:
-        vertices.append([v.x, v.y, v.z])
-
-    triangles = []
-    for f in mesh.Facets:
-        triangles.append([f.PointIndices[0], f.PointIndices[1], f.PointIndices[2]])
-
-    result = {{
-        "vertices": vertices,
-        "triangles": triangles,
-    }}
-"""
-        mesh_data = connection.execute_code(code)
-
-        if "error" in mesh_data:
-            return [TextContent(type="text", text=f"✗ {mesh_data['error']}")]
+        # Analyze slope and generate colors
+        slope_map = await asyncio.to_thread(TerrainEngine.analyze_slope, mesh)
+        colors = slope_map.compute_heatmap_colors(color_scheme, dtype=np.uint8)
 
-        # Reconstruct TerrainMesh
-        from freepvc.models.terrain import TerrainMesh
-        vertices = np.array(mesh_data["vertices"])
-        triangles = np.array(mesh_data["triangles"])
-        mesh = TerrainMesh(vertices=vertices, triangles=triangles)
-
-        # Analyze slope
-        slope_map = TerrainEngine.analyze_slope(mesh)
+        # Apply colors to FreeCAD mesh while the statistics are computed
+        upload = asyncio.wrap_future(connection.set_face_colors_bin_async(terrain_name, colors))
         stats = slope_map.get_statistics()
-
-        # Generate colors
-        colors = slope_map.compute_heatmap_colors(color_scheme)
-        colors_list = colors.tolist()
-
-        # Apply colors to FreeCAD mesh
-        connection.set_face_colors(terrain_name, colors_list)
+        await upload
 
         # Format response
         response = f"""✓ Terrain slope analysis complete
@@ -468,6 +451,7 @@ async def query_terrain_elevation(
     x: float,
     y: float,
     terrain_name: str = "Terrain",
+    include_slope: bool = False,
     ctx: Context = None,
 ) -> list[TextContent | ImageContent]:
     """Query elevation at a specific (x, y) coordinate.
@@ -478,6 +462,8 @@ async def query_terrain_elevation(
         x: X coordinate in mm
         y: Y coordinate in mm
         terrain_name: Name of terrain object in FreeCAD
+        include_slope: Also report the slope at the point (four extra
+            elevation lookups)
 
     Returns:
         Interpolated elevation value
@@ -485,50 +471,25 @@ async def query_terrain_elevation(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
-        # Get terrain mesh from FreeCAD
-        code = f"""
-import FreeCAD
+        from freepvc.engines.terrain_engine import TerrainEngine
 
-doc = FreeCAD.ActiveDocument
-terrain = doc.getObject("{terrain_name}")
-
-if terrain is None:
-    result = {{"error": "Terrain object not found"}}
-else:
-    mesh = terrain.Mesh
-    vertices = [[v.x, v.y, v.z] for v in mesh.Points]
-    triangles = [[f.PointIndices[0], f.PointIndices[1], f.PointIndices[2]] for f in mesh.Facets]
-
-    result = {{
-        "vertices": vertices,
-        "triangles": triangles,
-    }}
-"""
-        mesh_data = connection.execute_code(code)
-
-        if "error" in mesh_data:
-            return [TextContent(type="text", text=f"✗ {mesh_data['error']}")]
-
-        # Reconstruct mesh
-        from freepvc.models.terrain import TerrainMesh
-        vertices = np.array(mesh_data["vertices"])
-        triangles = np.array(mesh_data["triangles"])
-        mesh = TerrainMesh(vertices=vertices, triangles=triangles)
+        # Get terrain mesh from FreeCAD (cached until the mesh changes)
+        mesh = await asyncio.wrap_future(connection.get_terrain_mesh_async(terrain_name))
+        if mesh is None:
+            return [TextContent(type="text", text="✗ Terrain object not found")]
 
         # Interpolate elevation
         query_point = np.array([x, y])
         elevation = TerrainEngine.interpolate_elevation(mesh, query_point)
 
-        # Also compute slope at this point
-        slopes = TerrainEngine.compute_slopes_at_points(mesh, query_point.reshape(1, -1))
-        slope = slopes[0]
-
         response = f"""✓ Terrain elevation query
 
 **Location:** ({x/1000:.2f}m, {y/1000:.2f}m)
 **Elevation:** {elevation/1000:.2f} m ({elevation:.1f} mm)
-**Slope:** {slope:.2f}°
 """
+        if include_slope:
+            slopes = TerrainEngine.compute_slopes_at_points(mesh, query_point.reshape(1, -1))
+            response += f"**Slope:** {slopes[0]:.2f}°\n"
 
         return [TextContent(type="text", text=response)]
 
@@ -564,6 +525,9 @@ async def create_sample_terrain_demo(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
+        from freepvc.engines.terrain_engine import TerrainEngine
+        from freepvc.io.terrain_import import create_sample_terrain
+
         # Create sample terrain data
         terrain_data = create_sample_terrain(
             size=size_m * 1000,  # Convert to mm
@@ -576,15 +540,13 @@ async def create_sample_terrain_demo(
         mesh = TerrainEngine.create_mesh_from_points(terrain_data)
 
         # Create in FreeCAD
-        vertices_list = mesh.vertices.tolist()
-        triangles_list = mesh.triangles.tolist()
-        connection.create_terrain_mesh(vertices_list, triangles_list, object_name)
+        connection.create_terrain_mesh_bin(mesh.vertices, mesh.triangles, object_name)
 
         # Apply slope colors if requested
         if apply_slope_colors:
             slope_map = TerrainEngine.analyze_slope(mesh)
-            colors = slope_map.compute_heatmap_colors("slope")
-            connection.set_face_colors(object_name, colors.tolist())
+            colors = slope_map.compute_heatmap_colors("slope", dtype=np.uint8)
+            connection.set_face_colors_bin(object_name, colors)
 
         # Get statistics
         stats = terrain_data.get_statistics()
@@ -864,87 +826,34 @@ async def generate_array_layout(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
-        from freepvc.models.solar_objects import RackConfig, LayoutConfig, PanelSpec
         from freepvc.engines.layout_engine import LayoutEngine
-        from freepvc.models.terrain import TerrainMesh
-        
-        # Get terrain if specified; auto-detect if not provided
-        terrain_mesh = None
-        if not terrain_name:
-            # Try to find a terrain object in the active document automatically
-            autodetect_code = """
-import FreeCAD
-doc = FreeCAD.ActiveDocument
-terrain_name = None
-if doc:
-    for obj in doc.Objects:
-        if hasattr(obj, "Mesh") and "terrain" in obj.Name.lower():
-            terrain_name = obj.Name
-            break
-terrain_name
-"""
-            terrain_name = connection.execute_code(autodetect_code)
 
-        if terrain_name:
-            # Fetch terrain mesh data from FreeCAD
-            code = f"""
-import FreeCAD
-import numpy as np
-doc = FreeCAD.ActiveDocument
-terrain = doc.getObject("{terrain_name}")
-if terrain and hasattr(terrain, "Mesh"):
-    mesh = terrain.Mesh
-    vertices = []
-    for point in mesh.Points:
-        vertices.append([point.x, point.y, point.z])
-    
-    triangles = []
-    for facet in mesh.Facets:
-        triangles.append(facet.PointIndices)
-    
-    result = {{
-        "vertices": vertices,
-        "triangles": triangles,
-    }}
-else:
-    result = None
-result
-"""
-            terrain_data = connection.execute_code(code)
-            
-            if terrain_data:
-                import numpy as np
-                vertices = np.array(terrain_data["vertices"], dtype=np.float64)
-                triangles = np.array(terrain_data["triangles"], dtype=np.int32)
-                terrain_mesh = TerrainMesh(vertices=vertices, triangles=triangles)
-            else:
-                return [TextContent(type="text", text=f"✗ Error: Terrain '{terrain_name}' not found or invalid")]
-        
-        # Query the base rack properties from FreeCAD
-        code = f"""
-import FreeCAD
-doc = FreeCAD.ActiveDocument
-base = doc.getObject("{base_rack}")
-if base:
-    panel_template = base.PanelTemplate if hasattr(base, "PanelTemplate") else None
-    if panel_template:
-        power_w = float(panel_template.PowerWatts) if hasattr(panel_template, "PowerWatts") else 550.0
-    else:
-        power_w = 550.0
-    result = {{
-        "panels_per_row": int(base.PanelsPerRow) if hasattr(base, "PanelsPerRow") else 2,
-        "rows": int(base.Rows) if hasattr(base, "Rows") else 1,
-        "tilt_angle": float(base.TiltAngle) if hasattr(base, "TiltAngle") else 25.0,
-        "power_watts": power_w,
-    }}
-else:
-    result = None
-result
-"""
-        base_rack_props = connection.execute_code(code)
-        
+        async def fetch_terrain(name):
+            # Look for a terrain object if none was named, then fetch its
+            # mesh (cached until the mesh changes)
+            if not name:
+                name = await asyncio.wrap_future(connection.find_terrain_async())
+            if not name:
+                return name, None
+            return name, await asyncio.wrap_future(connection.get_terrain_mesh_async(name))
+
+        # Read the base rack and the terrain as concurrent RPCs; both are
+        # awaited before either result is used, so neither is left running
+        base_rack_props, terrain = await asyncio.gather(
+            asyncio.wrap_future(connection.get_rack_summary_async(base_rack)),
+            fetch_terrain(terrain_name),
+            return_exceptions=True,
+        )
+        if isinstance(base_rack_props, BaseException):
+            raise base_rack_props
         if not base_rack_props:
             return [TextContent(type="text", text=f"✗ Error: Base rack '{base_rack}' not found")]
+
+        if isinstance(terrain, BaseException):
+            raise terrain
+        terrain_name, terrain_mesh = terrain
+        if terrain_name and terrain_mesh is None:
+            return [TextContent(type="text", text=f"✗ Error: Terrain '{terrain_name}' not found or invalid")]
         
         # Create rack config from base rack properties
         rack_config = RackConfig(
@@ -963,28 +872,18 @@ result
         )
         
         # Generate layout
-        layout = LayoutEngine.generate_grid_layout(layout_config, terrain_mesh)
+        layout = await asyncio.to_thread(LayoutEngine.generate_grid_layout, layout_config, terrain_mesh)
         
-        # Convert placements to RPC format (ensure native Python types for XML-RPC)
-        placements_data = [
-            {
-                "x": float(p.x),
-                "y": float(p.y),
-                "z": float(p.z),
-                "rotation_x": float(p.rotation_x),
-                "rotation_y": float(p.rotation_y),
-                "rotation_z": float(p.rotation_z),
-                "name": p.rack_id,
-            }
-            for p in layout.placements
-        ]
-        
-        # Create array in FreeCAD using efficient Links
-        result = connection.server.create_array_layout(base_rack, placements_data)
+        # Create array in FreeCAD using efficient Links; positions and
+        # rotations go as one packed buffer
+        placement_array = layout.get_placement_array()
+        result = await asyncio.wrap_future(
+            connection.create_array_layout_bin_async(base_rack, placement_array)
+        )
         
         # Handle result - it might be a dict or might need to extract info
         group_name = result.get('group_name', 'ArrayLayout') if isinstance(result, dict) else 'ArrayLayout'
-        total_instances = result.get('total_instances', len(placements_data)) if isinstance(result, dict) else len(placements_data)
+        total_instances = result.get('total_instances', len(placement_array)) if isinstance(result, dict) else len(placement_array)
         
         response = f"""✓ Generated array layout: {group_name}
 
@@ -1047,6 +946,8 @@ async def analyze_daily_shading(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
+        from freepvc.engines.shading_engine import ShadingEngine
+
         # Parse date
         date = datetime.strptime(date_str, "%Y-%m-%d")
 
@@ -1282,6 +1183,8 @@ async def analyze_annual_shading(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
+        from freepvc.engines.shading_engine import ShadingEngine
+
         # Get project information and layout data (same as daily analysis)
         project_info_code = """
 import FreeCAD
@@ -1484,6 +1387,8 @@ async def calculate_optimal_spacing(
     connection = ctx.request_context.lifespan_context["connection"]
 
     try:
+        from freepvc.engines.shading_engine import ShadingEngine
+
         # Get project info and rack config
         project_code = """
 import FreeCAD
@@ -1612,11 +1517,12 @@ result
         )]
 
 
+_CARDINALS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
 def _azimuth_to_cardinal(azimuth: float) -> str:
     """Convert azimuth angle to cardinal direction."""
-    directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-    index = int((azimuth + 22.5) / 45.0) % 8
-    return directions[index]
+    return _CARDINALS[int((azimuth + 22.5) // 45.0) % 8]
 
 
 def main():
@@ -0,0 +1,157 @@
+"""Tests for the FreePVC RPC client.
+
+Run with: pytest tests/test_connection.py
+"""
+
+import types
+import xmlrpc.client
+import zlib
+
+import numpy as np
+import pytest
+
+from freepvc.connection import FreePVCConnection
+
+
+class FakeTerrainServer:
+    """Stands in for the ServerProxy, serving meshes by name and revision."""
+
+    def __init__(self):
+        self.meshes = {}  # name -> (revision, vertices, triangles)
+        self.calls = []  # (name, known_revision) per request
+        self.during_fetch = None  # optional hook run inside a request
+
+    def get_terrain_mesh_arrays(self, name, known_revision, compression_level):
+        self.calls.append((name, known_revision))
+        if self.during_fetch is not None:
+            self.during_fetch()
+        if name not in self.meshes:
+            return {"error": f"Object '{name}' not found"}
+        revision, vertices, triangles = self.meshes[name]
+        if revision == known_revision:
+            return {"revision": revision}
+        return {
+            "revision": revision,
+            "vertices": xmlrpc.client.Binary(
+                zlib.compress(vertices.astype("<f8").tobytes(), compression_level)
+            ),
+            "triangles": xmlrpc.client.Binary(
+                zlib.compress(triangles.astype("<i4").tobytes(), compression_level)
+            ),
+            "compressed": True,
+        }
+
+
+class FakeArrayServer:
+    """Stands in for the ServerProxy, naming placed instances from a counter."""
+
+    def __init__(self):
+        self.batches = []  # one list of place_array call sizes per round trip
+        self.count = 0
+        self.system = types.SimpleNamespace(multicall=self._multicall)
+
+    def _place(self, base_object, positions, rotations):
+        # The tests rotate each rack by its x position, so shards stay paired
+        assert [r[2] for r in rotations] in ([], [p[0] for p in positions])
+        names = [f"{base_object}_{self.count + i:04d}" for i in range(len(positions))]
+        self.count += len(positions)
+        return names
+
+    def place_array(self, base_object, positions, rotations):
+        self.batches.append([len(positions)])
+        return self._place(base_object, positions, rotations)
+
+    def _multicall(self, calls):
+        assert all(call["methodName"] == "place_array" for call in calls)
+        self.batches.append([len(call["params"][1]) for call in calls])
+        return [[self._place(*call["params"])] for call in calls]
+
+
+def _square(z: float):
+    vertices = np.array([[0, 0, z], [1, 0, z], [1, 1, z], [0, 1, z]], dtype=float)
+    triangles = np.array([[0, 1, 2], [0, 2, 3]])
+    return vertices, triangles
+
+
+@pytest.fixture
+def conn():
+    connection = FreePVCConnection(port=1)
+    connection.server = FakeTerrainServer()
+    yield connection
+    connection.close()
+
+
+def test_mesh_cache_hit_and_miss(conn):
+    """Test that an unchanged revision reuses the cached TerrainMesh."""
+    conn.server.meshes["Terrain"] = ("r1", *_square(5.0))
+
+    mesh = conn.get_terrain_mesh("Terrain")
+    np.testing.assert_array_equal(mesh.vertices, _square(5.0)[0])
+    np.testing.assert_array_equal(mesh.triangles, _square(5.0)[1])
+
+    # Hit: the known revision is sent and the same object comes back
+    assert conn.get_terrain_mesh("Terrain") is mesh
+    assert conn.server.calls == [("Terrain", ""), ("Terrain", "r1")]
+
+    # Miss: a new revision is transferred again
+    conn.server.meshes["Terrain"] = ("r2", *_square(7.0))
+    changed = conn.get_terrain_mesh("Terrain")
+    assert changed is not mesh
+    assert changed.vertices[0, 2] == 7.0
+
+    # A deleted object drops its entry
+    del conn.server.meshes["Terrain"]
+    assert conn.get_terrain_mesh("Terrain") is None
+    assert "Terrain" not in conn._mesh_cache
+
+
+def test_mesh_cache_evicts_least_recently_used(conn):
+    """Test that the cache holds MESH_CACHE_SIZE meshes, oldest use dropped first."""
+    names = [f"Terrain{i:03d}" for i in range(conn.MESH_CACHE_SIZE + 1)]
+    for name in names:
+        conn.server.meshes[name] = ("r1", *_square(1.0))
+
+    meshes = {name: conn.get_terrain_mesh(name) for name in names[:-1]}
+    assert conn.get_terrain_mesh(names[0]) is meshes[names[0]]  # now most recent
+    conn.get_terrain_mesh(names[-1])
+
+    assert len(conn._mesh_cache) == conn.MESH_CACHE_SIZE
+    assert names[1] not in conn._mesh_cache
+    assert names[0] in conn._mesh_cache and names[-1] in conn._mesh_cache
+
+
+def test_forget_during_fetch_is_not_recached(conn):
+    """Test that a mesh fetched while its object was recreated is not cached."""
+    conn.server.meshes["Terrain"] = ("r1", *_square(1.0))
+    conn.server.during_fetch = lambda: conn._forget_mesh("Terrain")
+
+    mesh = conn.get_terrain_mesh("Terrain")
+
+    assert mesh is not None
+    assert "Terrain" not in conn._mesh_cache
+
+    # The next fetch does not offer a stale revision
+    conn.server.during_fetch = None
+    conn.get_terrain_mesh("Terrain")
+    assert conn.server.calls[-1] == ("Terrain", "")
+    assert "Terrain" in conn._mesh_cache
+
+
+@pytest.mark.parametrize(
+    "count, batches",
+    [(0, [[0]]), (100, [[100]]), (101, [[100, 1]]), (250, [[100, 100, 50]])],
+)
+def test_place_array_shards_large_arrays(conn, count, batches):
+    """Test that place_array splits at PLACE_ARRAY_CHUNK in one multicall."""
+    conn.server = FakeArrayServer()
+    positions = [(float(i), 0.0, 0.0) for i in range(count)]
+    rotations = [(0.0, 0.0, float(i)) for i in range(count)]
+
+    names = conn.place_array("Rack", positions, rotations)
+
+    assert conn.server.batches == batches
+    assert names == [f"Rack_{i:04d}" for i in range(count)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
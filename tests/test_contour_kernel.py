@@ -0,0 +1,89 @@
+"""Tests for marching-squares contour extraction.
+
+Run with: pytest tests/test_contour_kernel.py
+"""
+
+import numpy as np
+import pytest
+
+from freepvc.engines import _contour_kernel
+from freepvc.engines._contour_kernel import march_contours
+
+
+def _key(contours):
+    """Order-independent summary: closed loops and open lines may start anywhere.
+
+    Closed loops repeat their start point, so only distinct points are kept.
+    """
+    return sorted(
+        (level, closed, tuple(sorted(set(map(tuple, np.round(points, 9).tolist())))))
+        for level, points, closed in contours
+    )
+
+
+def test_saddle_cell_follows_cell_centre():
+    """Test that both saddle cases split the cell by the centre value."""
+    x = np.array([0.0, 1.0])
+    y = np.array([0.0, 1.0])
+    z = np.array([[1.0, 0.0], [0.0, 1.0]])  # high corners on the rising diagonal
+
+    # Centre (0.5) above the level: the low corners are cut off
+    below = march_contours(x, y, z, np.array([0.25]))
+    segments = {frozenset(map(tuple, points.tolist())) for _, points, _ in below}
+    assert segments == {
+        frozenset({(0.75, 0.0), (1.0, 0.25)}),
+        frozenset({(0.0, 0.75), (0.25, 1.0)}),
+    }
+
+    # Centre below the level: the high corners are cut off
+    above = march_contours(x, y, z, np.array([0.75]))
+    segments = {frozenset(map(tuple, points.tolist())) for _, points, _ in above}
+    assert segments == {
+        frozenset({(0.0, 0.25), (0.25, 0.0)}),
+        frozenset({(1.0, 0.75), (0.75, 1.0)}),
+    }
+
+
+def test_tiled_marching_matches_untiled(monkeypatch):
+    """Test that tiles stitched together give the single-tile contours."""
+    x = np.linspace(-10, 10, 81)
+    y = np.linspace(-8, 8, 71)
+    xx, yy = np.meshgrid(x, y)
+    z = np.sin(xx) * np.cos(0.7 * yy) + 0.1 * xx
+    levels = np.linspace(-0.9, 0.9, 4)
+
+    untiled = march_contours(x, y, z, levels)
+
+    # Tiling is only used with the compiled kernel; force it with small tiles
+    monkeypatch.setattr(_contour_kernel, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(_contour_kernel, "TILE_CELLS", 23)
+    tiled = march_contours(x, y, z, levels)
+
+    assert len(untiled) > 4
+    assert any(closed for _, _, closed in untiled)
+    assert _key(tiled) == _key(untiled)
+
+
+def test_nan_and_flat_regions_are_skipped():
+    """Test that NaN cells and level plateaus produce no segments."""
+    x = np.linspace(0, 69, 70)
+    y = np.linspace(0, 69, 70)
+    z = np.tile(y[:, None], (1, 70))  # plane rising along y
+    z[:, 40:] = np.nan
+    z[45:, :] = 50.0  # plateau exactly at a contour level
+
+    contours = march_contours(x, y, z, np.array([10.5, 50.0]))
+
+    # One line per level below the plateau, stopping where the NaN cells start
+    assert len(contours) == 1
+    level, points, closed = contours[0]
+    assert level == 10.5 and not closed
+    np.testing.assert_allclose(points[:, 1], 10.5)
+    assert points[:, 0].min() == 0 and points[:, 0].max() == 39
+
+    assert march_contours(x, y, np.full((70, 70), 50.0), np.array([50.0])) == []
+    assert march_contours(x, y, np.full((70, 70), np.nan), np.array([10.0])) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""Tests for the FreeCAD-side RPC server over a loopback connection.
+
+FreeCAD, FreeCADGui and Mesh are replaced by minimal stand-ins, and a
+thread runs the queued GUI commands.
+
+Run with: pytest tests/test_rpc_server.py
+"""
+
+import importlib
+import queue
+import sys
+import threading
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from freepvc.connection import FreePVCConnection
+
+RPC_SERVER_DIR = Path(__file__).parent.parent / "addon" / "FreePVC" / "rpc_server"
+
+
+class FakeDocument:
+    """Records the objects an RPC method adds."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def addObject(self, type_name, name):
+        obj = types.SimpleNamespace(TypeId=type_name, Name=name)
+        self.objects[name] = obj
+        return obj
+
+    def recompute(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def rpc_server():
+    """Import the addon's rpc_server module with FreeCAD stubbed out."""
+    freecad = types.ModuleType("FreeCAD")
+    freecad.ActiveDocument = None
+    freecad_gui = types.ModuleType("FreeCADGui")
+    freecad_gui.updateGui = lambda: None
+    mesh_module = types.ModuleType("Mesh")
+    mesh_module.Mesh = lambda facets=(): list(facets)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "FreeCAD", freecad)
+        mp.setitem(sys.modules, "FreeCADGui", freecad_gui)
+        mp.setitem(sys.modules, "Mesh", mesh_module)
+        mp.syspath_prepend(str(RPC_SERVER_DIR))
+        mp.delitem(sys.modules, "rpc_server", raising=False)
+        module = importlib.import_module("rpc_server")
+        yield module
+        mp.delitem(sys.modules, "rpc_server")
+
+
+@pytest.fixture
+def loopback(rpc_server):
+    """Serve FreePVCRPCServer on a free local port and connect to it."""
+    server = rpc_server._ThreadingXMLRPCServer(
+        ("127.0.0.1", 0),
+        requestHandler=rpc_server._KeepAliveRequestHandler,
+        allow_none=True,
+        logRequests=False,
+    )
+    server.register_multicall_functions()
+    server.register_instance(rpc_server.FreePVCRPCServer())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Stands in for the GUI timer that runs execute_in_gui_thread commands
+    stop = threading.Event()
+
+    def process_queue():
+        while not stop.is_set():
+            try:
+                rpc_server._command_queue.get(timeout=0.05)()
+            except queue.Empty:
+                pass
+
+    threading.Thread(target=process_queue, daemon=True).start()
+
+    document = FakeDocument()
+    sys.modules["FreeCAD"].ActiveDocument = document
+    conn = FreePVCConnection(port=server.server_address[1])
+    yield conn, document
+
+    conn.close()
+    stop.set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_chunked_mesh_upload_is_reassembled(rpc_server, loopback):
+    """Test that a mesh streamed in chunks arrives with every vertex and index."""
+    conn, document = loopback
+    conn.MESH_UPLOAD_CHUNK = 40
+
+    rng = np.random.default_rng(0)
+    vertices = rng.uniform(-1e6, 1e6, size=(101, 3))
+    triangles = rng.integers(0, len(vertices), size=(157, 3)).astype(np.int32)
+
+    name = conn.create_terrain_mesh_bin(vertices, triangles, "Terrain")
+
+    assert name == "Terrain"
+    facets = np.array(document.objects["Terrain"].Mesh).reshape(-1, 3, 3)
+    np.testing.assert_array_equal(facets, vertices[triangles])
+    assert rpc_server._mesh_uploads == {}
+
+
+def test_concurrent_chunked_uploads_stay_separate(rpc_server, loopback):
+    """Test that uploads running at the same time do not mix their chunks."""
+    conn, document = loopback
+    conn.MESH_UPLOAD_CHUNK = 25
+
+    uploads = {}
+    for k in range(conn.ASYNC_WORKERS):
+        vertices = np.full((60, 3), float(k))
+        triangles = (np.arange(90 * 3).reshape(90, 3) % 60).astype(np.int32)
+        uploads[f"Terrain{k}"] = (vertices, triangles)
+
+    futures = [
+        conn.create_terrain_mesh_bin_async(vertices, triangles, name)
+        for name, (vertices, triangles) in uploads.items()
+    ]
+
+    assert conn.gather(futures, timeout=30) == list(uploads)
+    for name, (vertices, triangles) in uploads.items():
+        facets = np.array(document.objects[name].Mesh).reshape(-1, 3, 3)
+        np.testing.assert_array_equal(facets, vertices[triangles])
+    assert rpc_server._mesh_uploads == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,6 +1,6 @@
 """Tests for terrain engine.
 
-Run with: pytest tests/test_terrain_engine.py
+Run with: pytest tests/test_terrain_engine.py (add -n auto with pytest-xdist)
 """
 
 import numpy as np
@@ -13,7 +13,7 @@ from freepvc.io.terrain_import import create_sample_terrain
 
 def test_create_sample_terrain():
     """Test sample terrain generation."""
-    terrain = create_sample_terrain(size=10000, spacing=1000, slope=5.0, roughness=500)
+    terrain = create_sample_terrain(size=10000, spacing=1000, slope=5.0, roughness=500, seed=0)
 
     assert terrain.num_points > 0
     assert terrain.source == TerrainSource.SURVEYED_POINTS
@@ -66,6 +66,41 @@ def test_slope_analysis():
     assert sloped_slope.mean_slope == pytest.approx(5.0, abs=0.5)
 
 
+def test_mesh_from_regular_grid():
+    """Test that regular grids are split into upward-facing cell triangles."""
+    terrain = TerrainEngine.create_regular_grid_terrain(
+        x_extent=10000,
+        y_extent=6000,
+        grid_spacing=1000,
+    )
+    mesh = TerrainEngine.create_mesh_from_points(terrain)
+
+    assert mesh.num_vertices == 11 * 7
+    assert mesh.num_faces == 2 * 10 * 6
+    assert np.all(mesh.face_normals[:, 2] > 0.999)
+
+
+def test_grid_interpolation_follows_mesh_faces():
+    """Test that grid meshes are interpolated on their own triangles."""
+    terrain = TerrainEngine.create_regular_grid_terrain(
+        x_extent=10000,
+        y_extent=10000,
+        grid_spacing=1000,
+        elevation_function=lambda x, y: 1e-4 * (x - 5000) ** 2 + 3e-5 * x * y,
+    )
+    mesh = TerrainEngine.create_mesh_from_points(terrain)
+    index = TerrainEngine.get_grid_index(mesh)
+
+    rng = np.random.default_rng(0)
+    query = rng.uniform(0, 10000, size=(500, 2))
+    expected = np.array([index.elevation(x, y) for x, y in query])
+
+    np.testing.assert_allclose(
+        TerrainEngine.interpolate_elevation(mesh, query), expected, atol=1e-6
+    )
+    assert np.isnan(TerrainEngine.interpolate_elevation(mesh, np.array([-1.0, 0.0])))
+
+
 def test_elevation_interpolation():
     """Test elevation interpolation."""
     import math
@@ -90,7 +125,7 @@ def test_elevation_interpolation():
 
 def test_slope_classification():
     """Test slope classification."""
-    terrain = create_sample_terrain(size=10000, spacing=1000, slope=15, roughness=1000)
+    terrain = create_sample_terrain(size=10000, spacing=1000, slope=15, roughness=1000, seed=0)
     mesh = TerrainEngine.create_mesh_from_points(terrain)
     slope_map = TerrainEngine.analyze_slope(mesh)
 
@@ -107,7 +142,7 @@ def test_slope_classification():
 
 def test_heatmap_colors():
     """Test heatmap color generation."""
-    terrain = create_sample_terrain(size=5000, spacing=1000, slope=10, roughness=500)
+    terrain = create_sample_terrain(size=5000, spacing=1000, slope=10, roughness=500, seed=0)
     mesh = TerrainEngine.create_mesh_from_points(terrain)
     slope_map = TerrainEngine.analyze_slope(mesh)
 
@@ -145,7 +180,7 @@ def test_buildable_faces():
 
 def test_grid_elevation_generation():
     """Test regular grid elevation generation for visualization."""
-    terrain = create_sample_terrain(size=10000, spacing=2000, slope=5, roughness=200)
+    terrain = create_sample_terrain(size=10000, spacing=2000, slope=5, roughness=200, seed=0)
     mesh = TerrainEngine.create_mesh_from_points(terrain)
 
     x, y, z_grid = TerrainEngine.generate_grid_elevations(mesh, grid_size=20)
@@ -156,5 +191,70 @@ def test_grid_elevation_generation():
     assert not np.any(np.isnan(z_grid))  # No NaN values within bounds
 
 
+def test_grid_index_matches_linear_interpolation():
+    """Test grid-hash point location against the Delaunay interpolator."""
+    terrain = create_sample_terrain(size=10000, spacing=1000, slope=8, roughness=300, seed=0)
+    mesh = TerrainEngine.create_mesh_from_points(terrain)
+    index = TerrainEngine.get_grid_index(mesh)
+
+    rng = np.random.default_rng(0)
+    query = rng.uniform(100, 9900, size=(50, 2))
+    expected = TerrainEngine.interpolate_elevation(mesh, query)
+    actual = np.array([index.elevation(x, y) for x, y in query])
+
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+    assert np.isnan(index.elevation(-5000.0, -5000.0))
+    assert TerrainEngine.get_grid_index(mesh) is index
+
+
+def test_cached_results_follow_replaced_arrays():
+    """Test that source arrays are read-only and replacing them refreshes caches."""
+    terrain = create_sample_terrain(size=5000, spacing=1000, slope=5, roughness=100, seed=0)
+    mesh = TerrainEngine.create_mesh_from_points(terrain)
+    z_max = terrain.bounds[2][1]
+    query = np.array([2500.0, 2500.0])
+    elevation = TerrainEngine.interpolate_elevation(mesh, query)
+    index = TerrainEngine.get_grid_index(mesh)
+    mesh.tri_verts
+
+    with pytest.raises(ValueError):
+        terrain.z[:] += 5000
+    with pytest.raises(ValueError):
+        mesh.vertices[:, 2] += 5000
+
+    terrain.points = terrain.points + [0, 0, 5000]
+    assert terrain.bounds[2][1] == pytest.approx(z_max + 5000)
+
+    mesh.vertices = mesh.vertices + [0, 0, 5000]
+    assert mesh.bounds[2][1] == pytest.approx(z_max + 5000)
+    assert mesh.tri_verts[:, :, 2].max() == pytest.approx(z_max + 5000)
+    assert TerrainEngine.interpolate_elevation(mesh, query) == pytest.approx(elevation + 5000)
+    assert TerrainEngine.get_grid_index(mesh) is not index
+    assert TerrainEngine.get_grid_index(mesh).elevation(*query) == pytest.approx(elevation + 5000)
+
+
+def test_contours_on_planar_slope():
+    """Test contour extraction on a plane rising along Y."""
+    import math
+
+    tan = math.tan(math.radians(10))
+    terrain = TerrainEngine.create_regular_grid_terrain(
+        x_extent=10000,
+        y_extent=10000,
+        grid_spacing=1000,
+        elevation_function=lambda x, y: y * tan,
+    )
+    mesh = TerrainEngine.create_mesh_from_points(terrain)
+
+    contour_set = TerrainEngine.generate_contours(mesh, interval=500.0)
+
+    assert contour_set.num_contours > 0
+    for contour in contour_set.contours:
+        # Each contour is a single open line across the full X extent at y = z / tan
+        assert not contour.is_closed
+        np.testing.assert_allclose(contour.points[:, 1], contour.elevation / tan, atol=1.0)
+        assert contour.length == pytest.approx(10000, abs=1.0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])